@@ -1,6 +1,6 @@
 from flask import Flask, render_template
 from config import Config
-from services.representative_role_sync_service import sync_user_roles_from_representatives
+from supabase_db.loader import start_request_loader, end_request_loader
 
 
 # Blueprints
@@ -76,9 +76,20 @@ def create_app():
 
 
 
+    # -----------------------------
+    # Vote Transaction Worker
+    # -----------------------------
+    if Config.VOTE_TX_WORKER_ENABLED and Config.BLOCKCHAIN_MODE == "WEB3":
+        from services.vote_tx_queue import start_vote_tx_worker
+        start_vote_tx_worker()
+
     @app.before_request
-    def sync_roles_once_per_request():
-        sync_user_roles_from_representatives()
+    def open_request_loader():
+        start_request_loader()
+
+    @app.teardown_request
+    def close_request_loader(exc=None):
+        end_request_loader()
     # -----------------------------
     # Error Handlers
     # -----------------------------
@@ -0,0 +1,118 @@
+# benchmarks/merkle_close_benchmark.py
+#
+# Election-close Merkle cost: build + every proof + bulk-insert payloads.
+#
+#   python -m benchmarks.merkle_close_benchmark            # 10k, 100k, 1M
+#   python -m benchmarks.merkle_close_benchmark 10000 50000
+#
+# Each size is run with the list tree (MerkleTree), the compact
+# buffer tree and the mmap-spilled compact tree. "tree MB" is the
+# Python heap held by the tree (tracemalloc; mmap pages are not heap).
+#
+# The old per-receipt path (rebuild tree + list.index per receipt) is
+# timed on a small sample and extrapolated, since running it for real
+# is O(N^2).
+
+import os
+import sys
+import time
+import tracemalloc
+
+from utils.merkle import MerkleTree, CompactMerkleTree, build_merkle_tree
+from models.vote_merkle_proof import PROOF_INSERT_CHUNK_SIZE
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+LEGACY_SAMPLE = 3
+
+IMPLEMENTATIONS = {
+    "list": lambda r: MerkleTree(r),
+    "compact": lambda r: CompactMerkleTree(r),
+    "mmap": lambda r: CompactMerkleTree(r, spill_to_disk=True),
+}
+
+
+def _receipts(n):
+    return [os.urandom(32).hex() for _ in range(n)]
+
+
+def _legacy_proof(receipt_hashes, target):
+    tree = build_merkle_tree(receipt_hashes)
+    index = receipt_hashes.index(target)
+
+    proof = []
+    for level in tree[:-1]:
+        sibling_index = index ^ 1
+        if sibling_index < len(level):
+            proof.append(level[sibling_index].hex())
+        index //= 2
+
+    return proof
+
+
+def _legacy_estimate(receipts, tree):
+    sample = receipts[-LEGACY_SAMPLE:]
+    started = time.perf_counter()
+    for r in sample:
+        assert _legacy_proof(receipts, r) == tree.proof(r)
+    return (time.perf_counter() - started) / len(sample) * len(receipts)
+
+
+def run(receipts, impl):
+    tracemalloc.start()
+    started = time.perf_counter()
+    tree = IMPLEMENTATIONS[impl](receipts)
+    built = time.perf_counter()
+    tree_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    chunks = 0
+    batch = []
+    for receipt_hash, proof in tree.iter_proofs():
+        batch.append({"receipt_hash": receipt_hash, "proof": proof})
+        if len(batch) >= PROOF_INSERT_CHUNK_SIZE:
+            chunks += 1
+            batch = []
+    if batch:
+        chunks += 1
+    proved = time.perf_counter()
+
+    return tree, {
+        "impl": impl,
+        "build_s": built - started,
+        "proofs_s": proved - built,
+        "tree_mb": tree_bytes / 1024 / 1024,
+        "insert_requests": chunks,
+        "root": tree.root,
+    }
+
+
+def main(sizes):
+    print(
+        f"{'receipts':>10} {'impl':>8} {'build s':>9} {'proofs s':>9} "
+        f"{'tree MB':>8} {'inserts':>8} {'legacy s (est)':>15}"
+    )
+
+    for n in sizes:
+        receipts = _receipts(n)
+        roots = set()
+        legacy = None
+
+        for impl in IMPLEMENTATIONS:
+            tree, r = run(receipts, impl)
+            roots.add(r["root"])
+
+            if legacy is None:
+                legacy = _legacy_estimate(receipts, tree)
+            if isinstance(tree, CompactMerkleTree):
+                tree.close()
+
+            print(
+                f"{n:>10} {impl:>8} {r['build_s']:>9.2f} {r['proofs_s']:>9.2f} "
+                f"{r['tree_mb']:>8.1f} {r['insert_requests']:>8} {legacy:>15.0f}"
+            )
+
+        assert len(roots) == 1, "implementations disagree on root"
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or DEFAULT_SIZES)
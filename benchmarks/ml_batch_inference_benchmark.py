@@ -0,0 +1,100 @@
+# benchmarks/ml_batch_inference_benchmark.py
+#
+# Constituency status inference: one model.predict per constituency vs
+# one batched call over the whole feature matrix.
+#
+#   python -m benchmarks.ml_batch_inference_benchmark              # default sizes
+#   python -m benchmarks.ml_batch_inference_benchmark 500 5000     # constituencies
+#
+# Uses ml/model/civic_model.pkl when present, otherwise fits the same
+# RandomForest as ml/training/train_model.py on generated data.
+#
+# per-row df:  the old predict_constituency_status (one-row DataFrame)
+# per-row np:  predict_constituency_status (one-row array)
+# batched:     predict_constituency_statuses over all rows
+#
+# Per-row modes are timed on at most PER_ROW_SAMPLE rows and their
+# throughput extrapolated. All modes must return the same labels (the
+# script exits non-zero otherwise).
+
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+from ml.inference import ml_predictor
+from ml.inference.ml_predictor import (
+    FEATURE_ORDER,
+    MODEL_PATH,
+    features_to_matrix,
+    predict_constituency_status,
+    predict_constituency_statuses
+)
+from ml.training.generate_training_data import generate_dataset, generate_row
+
+DEFAULT_SIZES = [100, 1000, 10000]
+PER_ROW_SAMPLE = 300
+
+
+def _load_model():
+    if os.path.exists(MODEL_PATH):
+        print(f"Model: {MODEL_PATH}")
+        return ml_predictor.get_model()
+
+    from sklearn.ensemble import RandomForestClassifier
+
+    print(f"Model: {MODEL_PATH} not found, fitting train_model.py's RandomForest")
+    df = generate_dataset(8000)
+    model = RandomForestClassifier(n_estimators=150, max_depth=10, random_state=42)
+    model.fit(df.drop("label", axis=1), df["label"])
+    ml_predictor.set_model(model)
+    return model
+
+
+def _per_row_dataframe(model, row):
+    df = pd.DataFrame([[row[f] for f in FEATURE_ORDER]], columns=FEATURE_ORDER)
+    return model.predict(df)[0]
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main(sizes):
+    random.seed(42)
+    model = _load_model()
+
+    print(f"{'rows':>7} {'mode':>11} {'rows/s':>12} {'total ms':>11} {'speedup':>8}")
+
+    for n in sizes:
+        rows = [{f: r[f] for f in FEATURE_ORDER} for r in (generate_row() for _ in range(n))]
+        sample = rows[:PER_ROW_SAMPLE]
+
+        by_df, t_df = _timed(lambda: [_per_row_dataframe(model, r) for r in sample])
+        by_np, t_np = _timed(lambda: [predict_constituency_status(r) for r in sample])
+        batched, t_batch = _timed(lambda: predict_constituency_statuses(features_to_matrix(rows)))
+
+        if list(by_df) != list(batched[:len(sample)]) or list(by_np) != list(by_df):
+            print(f"❌ {n} rows: per-row and batched labels differ")
+            sys.exit(1)
+
+        rates = {
+            "per-row df": len(sample) / t_df,
+            "per-row np": len(sample) / t_np,
+            "batched": n / t_batch
+        }
+        for mode, rate in rates.items():
+            print(
+                f"{n:>7} {mode:>11} {rate:>12,.0f} {n / rate * 1000:>11,.1f} "
+                f"{rate / rates['per-row df']:>7.1f}x"
+            )
+
+    print(f"✅ per-row and batched labels identical for sizes {sizes}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or DEFAULT_SIZES)
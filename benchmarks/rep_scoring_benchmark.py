@@ -0,0 +1,179 @@
+# benchmarks/rep_scoring_benchmark.py
+#
+# Representative scoring: legacy per-dimension reads vs one
+# ScoringContext vs the running aggregates.
+#
+#   python -m benchmarks.rep_scoring_benchmark              # default grid
+#   python -m benchmarks.rep_scoring_benchmark 200 40       # posts comments/post
+#
+# Synthetic histories (the rep's posts, other posts in the
+# constituency, threaded comments, term issues with acceptance times,
+# issue comments) are scored twice from memory:
+#
+# context:    calculate_representative_score over a ScoringContext
+# aggregates: score_from_aggregates over build_rep_aggregates(ctx)
+#
+# Both must agree on every seed (the script exits non-zero otherwise),
+# so the two implementations check each other.
+#
+# Round trips are counted exactly from the code paths:
+#
+# legacy:     9 term-issue reads, 5 post-list reads, 3 participation
+#             reads, and get_policy_comments per rep post twice and
+#             per other post once: 6 reads + 3 per comment (alias,
+#             votes, viewer's vote).
+# context:    ScoringContext.load (fixed, chunked IN filters).
+# aggregates: one row read.
+#
+# "est. wall ms" adds RTT_MS per round trip.
+
+import math
+import random
+import sys
+import time
+import uuid
+
+from datetime import datetime, timedelta, timezone
+
+from services.rep_score_aggregates import build_rep_aggregates, score_from_aggregates
+from services.representative_scoring import ScoringContext, calculate_representative_score
+from supabase_db.db import IN_FILTER_CHUNK_SIZE
+
+DEFAULT_GRID = [(10, 5), (50, 20), (200, 40)]
+OTHER_POSTS = 0.5      # other authors' posts per rep post
+ISSUES = 200
+SEEDS = 20
+RTT_MS = 20
+
+STATUSES = ["Open", "Accepted", "In Progress", "Resolved", "Closed", "Rejected"]
+CATEGORIES = ["health", "road", "water", "misc", "noise"]
+
+
+def _iso(d):
+    return d.isoformat()
+
+
+def _comments(post_id, n, users):
+    rows = []
+    for _ in range(n):
+        parent = random.choice(rows)["id"] if rows and random.random() < 0.4 else None
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "post_id": post_id,
+            "user_id": random.choice(users),
+            "parent_comment_id": parent
+        })
+    return rows
+
+
+def _synthetic(posts, comments_per_post):
+    now = datetime.now(timezone.utc)
+    rep, constituency = str(uuid.uuid4()), str(uuid.uuid4())
+    users = [rep] + [str(uuid.uuid4()) for _ in range(50)]
+
+    def post(author):
+        return {
+            "id": str(uuid.uuid4()),
+            "created_by_user_id": author,
+            "created_at": _iso(now - timedelta(days=random.randint(0, 700))),
+            "upvotes": random.randint(0, 40),
+            "downvotes": random.randint(0, 40),
+            "ai_integrity_score": random.choice([None, random.randint(10, 95)])
+        }
+
+    own = [post(rep) for _ in range(posts)]
+    others = [post(random.choice(users[1:])) for _ in range(int(posts * OTHER_POSTS))]
+
+    comments_by_post = {
+        p["id"]: _comments(p["id"], random.randint(0, 2 * comments_per_post), users)
+        for p in own + others
+    }
+
+    issues, issue_comments = [], []
+    for _ in range(ISSUES):
+        created = now - timedelta(days=random.randint(0, 700), hours=random.randint(0, 23))
+        status = random.choice(STATUSES)
+        accepted = created + timedelta(hours=random.randint(1, 500))
+
+        issue = {
+            "id": str(uuid.uuid4()),
+            "status": status,
+            "created_at": _iso(created),
+            "category": random.choice(CATEGORIES),
+            "title": "", "description": "",
+            "rep_user_id": rep,
+            "accepted_at": _iso(accepted) if status != "Open" else None
+        }
+        issues.append(issue)
+        issue_comments += [
+            {"id": str(uuid.uuid4()), "issue_id": issue["id"], "user_id": random.choice(users)}
+            for _ in range(random.randint(0, 3))
+        ]
+
+    ctx = ScoringContext(
+        rep, constituency, own, own + others, comments_by_post, issues, issue_comments
+    )
+    return ctx, sum(len(comments_by_post[p["id"]]) for p in own), sum(len(comments_by_post[p["id"]]) for p in others)
+
+
+def _chunks(n):
+    return math.ceil(n / IN_FILTER_CHUNK_SIZE)
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main(grid):
+    print(
+        f"{'posts':>6} {'cmts/post':>9} {'impl':>11} {'cpu ms':>8} "
+        f"{'round trips':>12} {'est. wall ms':>13}"
+    )
+
+    for posts, comments_per_post in grid:
+        cpu = {"context": 0.0, "aggregates": 0.0}
+        trips = {"legacy": 0, "context": 0, "aggregates": 0}
+
+        for seed in range(SEEDS):
+            random.seed(seed * 7919 + posts)
+            ctx, own_comments, other_comments = _synthetic(posts, comments_per_post)
+            others = len(ctx.constituency_posts) - len(ctx.posts)
+
+            by_context, ms = _timed(calculate_representative_score, ctx.rep_user_id, ctx.constituency_id, ctx)
+            cpu["context"] += ms
+
+            state = build_rep_aggregates(ctx.rep_user_id, ctx.constituency_id, ctx)
+            by_aggregates, ms = _timed(score_from_aggregates, state, ctx.constituency_id)
+            cpu["aggregates"] += ms
+
+            if by_context != by_aggregates:
+                print(f"❌ seed {seed}: context {by_context} != aggregates {by_aggregates}")
+                sys.exit(1)
+
+            trips["legacy"] += (
+                9 + 5 + 3
+                + 2 * (6 * len(ctx.posts) + 3 * own_comments)
+                + 6 * others + 3 * other_comments
+            )
+            # post lists x2, reps, issues + chunked IN reads for comments,
+            # timelines and issue comments
+            trips["context"] += 4 + _chunks(len(ctx.constituency_posts)) + 2 * _chunks(ISSUES)
+            trips["aggregates"] += 1
+
+        for impl in ("legacy", "context", "aggregates"):
+            c = cpu.get(impl, 0.0) / SEEDS
+            rt = trips[impl] // SEEDS
+            shown = f"{c:>8.2f}" if impl in cpu else f"{'-':>8}"
+            print(
+                f"{posts:>6} {comments_per_post:>9} {impl:>11} {shown} "
+                f"{rt:>12,} {c + rt * RTT_MS:>13,.0f}"
+            )
+
+    print(f"✅ context and aggregate scores identical on {SEEDS * len(grid)} histories")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main([tuple(args[:2])] if len(args) >= 2 else DEFAULT_GRID)
@@ -0,0 +1,80 @@
+# benchmarks/rep_scoring_golden.py
+#
+# Golden-value regression check for representative scoring.
+#
+#   python -m benchmarks.rep_scoring_golden
+#
+# benchmarks/fixtures/rep_scoring_golden.json holds fixed histories
+# (empty, posts only, issues only, small → large, all resolved, deep
+# comment threads). Each one has the ScoringContext it loads to and the
+# full breakdown the original per-dimension implementation (one query
+# per post, comment and issue) returned for the same rows.
+#
+# Both current implementations must reproduce every breakdown exactly:
+#
+# context:    calculate_representative_score over the ScoringContext
+# aggregates: score_from_aggregates over build_rep_aggregates(ctx)
+#
+# rep_scoring_benchmark only checks the two against each other; this
+# catches a change that moves both. Only re-capture the expected values
+# for an intended change to the scoring formula.
+
+import json
+import os
+import sys
+
+from services.rep_score_aggregates import build_rep_aggregates, score_from_aggregates
+from services.representative_scoring import ScoringContext, calculate_representative_score
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "rep_scoring_golden.json")
+
+
+def _diff(expected, actual, path=""):
+    """
+    Paths (e.g. breakdown.engagement.consistency) where two results differ.
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        return [
+            p
+            for key in sorted(set(expected) | set(actual))
+            for p in _diff(expected.get(key), actual.get(key), f"{path}.{key}" if path else key)
+        ]
+    return [] if expected == actual else [f"{path}: expected {expected!r}, got {actual!r}"]
+
+
+def main():
+    with open(FIXTURES) as f:
+        histories = json.load(f)
+
+    failures = 0
+
+    for h in histories:
+        rep, constituency = h["rep_user_id"], h["constituency_id"]
+        ctx = ScoringContext(rep, constituency, **h["context"])
+
+        results = {
+            "context": calculate_representative_score(rep, constituency, ctx),
+            "aggregates": score_from_aggregates(build_rep_aggregates(rep, constituency, ctx), constituency)
+        }
+
+        ok = True
+        for impl, actual in results.items():
+            diffs = _diff(h["expected"], actual)
+            if diffs:
+                ok = False
+                failures += 1
+                print(f"❌ {h['name']} ({impl}):")
+                for d in diffs:
+                    print(f"     {d}")
+
+        if ok:
+            print(f"✅ {h['name']:<14} {h['expected']['final_score']:>6} {h['expected']['rating']}")
+
+    if failures:
+        sys.exit(1)
+
+    print(f"✅ {len(histories)} golden histories reproduced by context and aggregate scoring")
+
+
+if __name__ == "__main__":
+    main()
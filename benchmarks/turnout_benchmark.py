@@ -0,0 +1,133 @@
+# benchmarks/turnout_benchmark.py
+#
+# Per-constituency turnout: legacy loop vs the VoterIndex path of
+# constituency_turnout_percentage.
+#
+#   python -m benchmarks.turnout_benchmark                 # default grid
+#   python -m benchmarks.turnout_benchmark 500 1000000     # constituencies voters
+#
+# Synthetic voters are spread over C constituencies with ~65% turnout.
+#
+# legacy: for every constituency, fetch its registered voters, re-fetch
+# every has_voted row of the election and fetch_one each voter to learn
+# its constituency -> C * (2 + V_voted) round trips and C * V_voted
+# work. Its CPU time is measured on a few constituencies and
+# extrapolated; round trips are counted exactly.
+#
+# index: what constituency_turnout_percentage does per request with a
+# built VoterIndex: resolve the has_voted rows to positions and count
+# both sides with count_by_constituency. Its round trips are the
+# candidates read, the has_voted pages and the chunked names read.
+# Building the index (one streamed voters read, cached for
+# VOTER_INDEX_TTL) is shown separately. "est. wall s" adds RTT_MS per
+# round trip.
+
+import math
+import random
+import sys
+import time
+import uuid
+
+from config import Config
+from services.voter_index import VoterIndex
+from supabase_db.db import IN_FILTER_CHUNK_SIZE
+
+DEFAULT_GRID = [(50, 100_000), (500, 1_000_000), (5_000, 2_000_000)]
+TURNOUT = 0.65
+RTT_MS = 20
+LEGACY_SAMPLE = 3
+
+
+def _synthetic(constituencies, voters):
+    cids = [str(uuid.uuid4()) for _ in range(constituencies)]
+    voter_rows = [
+        {"id": i, "constituency_id": random.choice(cids), "is_active": True}
+        for i in range(voters)
+    ]
+    voted_rows = [{"voter_id": v["id"]} for v in voter_rows if random.random() < TURNOUT]
+    return cids, voter_rows, voted_rows
+
+
+def _legacy(cids, voter_rows, voted_rows):
+    by_id = {v["id"]: v for v in voter_rows}
+    sample = cids[:LEGACY_SAMPLE]
+
+    started = time.perf_counter()
+    counts = {}
+    for cid in sample:
+        registered = [v for v in voter_rows if v["constituency_id"] == cid]
+
+        voted_count = 0
+        for r in voted_rows:
+            v = by_id.get(r["voter_id"])        # was fetch_one per row
+            if v and v["constituency_id"] == cid:
+                voted_count += 1
+
+        counts[cid] = {"registered": len(registered), "voted": voted_count}
+    cpu = (time.perf_counter() - started) / len(sample) * len(cids)
+
+    round_trips = len(cids) * (2 + len(voted_rows))
+    return counts, cpu, round_trips
+
+
+def _build_index(voter_rows):
+    started = time.perf_counter()
+    index = VoterIndex(voter_rows)
+    return index, time.perf_counter() - started
+
+
+def _indexed(index, cids, voted_rows):
+    started = time.perf_counter()
+
+    positions = index.positions(r["voter_id"] for r in voted_rows)
+    voted = index.count_by_constituency(positions)
+    registered = index.count_by_constituency()
+    counts = {
+        cid: {"registered": registered.get(cid, 0), "voted": voted.get(cid, 0)}
+        for cid in cids
+    }
+    cpu = time.perf_counter() - started
+
+    # candidates + has_voted pages + names (chunked IN)
+    round_trips = (
+        1
+        + math.ceil(len(voted_rows) / Config.SUPABASE_PAGE_SIZE)
+        + math.ceil(len(cids) / IN_FILTER_CHUNK_SIZE)
+    )
+    return counts, cpu, round_trips
+
+
+def main(grid):
+    print(
+        f"{'seats':>6} {'voters':>10} {'impl':>11} {'cpu s':>10} "
+        f"{'round trips':>12} {'est. wall s':>12}"
+    )
+
+    for constituencies, voters in grid:
+        random.seed(constituencies * 31 + voters)
+        cids, voter_rows, voted_rows = _synthetic(constituencies, voters)
+
+        index, build_s = _build_index(voter_rows)
+        new_counts, new_cpu, new_rt = _indexed(index, cids, voted_rows)
+        old_counts, old_cpu, old_rt = _legacy(cids, voter_rows, voted_rows)
+
+        for cid, c in old_counts.items():
+            assert new_counts[cid] == c, "voter index disagrees with legacy loop"
+
+        for impl, cpu, rt in (("legacy", old_cpu, old_rt), ("index", new_cpu, new_rt)):
+            wall = cpu + rt * RTT_MS / 1000
+            print(
+                f"{constituencies:>6} {voters:>10} {impl:>11} {cpu:>10.2f} "
+                f"{rt:>12,} {wall:>12,.1f}"
+            )
+
+        build_rt = math.ceil(voters / Config.SUPABASE_PAGE_SIZE)
+        print(
+            f"{'':>6} {'':>10} {'(build)':>11} {build_s:>10.2f} "
+            f"{build_rt:>12,} {build_s + build_rt * RTT_MS / 1000:>12,.1f}"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main([(args[0], args[1])] if len(args) == 2 else DEFAULT_GRID)
@@ -0,0 +1,106 @@
+# benchmarks/voter_import_benchmark.py
+#
+# Voter-roll import throughput: one create_voter call per row vs the
+# chunked bulk pipeline.
+#
+#   python -m benchmarks.voter_import_benchmark                # default sizes
+#   python -m benchmarks.voter_import_benchmark 1000000        # rows
+#
+# A synthetic CSV (~3% invalid or duplicate rows) is written to a temp
+# file and run through the real reader + validate_voter_chunk with the
+# upsert replaced by a counter, so "cpu s" is parse + validation +
+# payload building. Round trips are counted exactly:
+#
+# per-row: one insert per valid row (validation happened in the form).
+# bulk:    one upsert + one checkpoint update per chunk.
+#
+# "est. wall s" adds RTT_MS per round trip; "rows/s" is rows / est. wall.
+
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+from config import Config
+from services.voter_import_service import ImportContext, _read_chunks, validate_voter_chunk
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+BOOTHS = 50
+RTT_MS = 20
+
+
+def _synthetic_csv(rows, booths):
+    fd, path = tempfile.mkstemp(suffix=".csv")
+
+    with os.fdopen(fd, "w") as f:
+        f.write("full_name,guardian_name,gender,date_of_birth,address,booth_number\n")
+        for i in range(rows):
+            r = random.random()
+            dob = f"{random.randint(1940, 2005)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}"
+            booth = random.randint(1, booths)
+
+            if r < 0.01:
+                dob = "not-a-date"
+            elif r < 0.02:
+                booth = booths + 1
+            elif r < 0.03 and i:
+                i -= 1                                   # duplicate of previous row
+
+            f.write(f"Voter {i},Guardian {i},{random.choice(['Male', 'Female', 'Other'])},"
+                    f"{dob},House {i} Main Road,{booth}\n")
+
+    return path
+
+
+def _bulk(path, ctx):
+    started = time.perf_counter()
+
+    processed = imported = chunks = 0
+    for chunk in _read_chunks(path, "csv", 0, Config.VOTER_IMPORT_CHUNK_SIZE):
+        payloads, _ = validate_voter_chunk(chunk, processed, ctx)
+        processed += len(chunk)
+        imported += len(payloads)
+        chunks += 1
+
+    cpu = time.perf_counter() - started
+    return imported, cpu, chunks * 2
+
+
+def main(sizes):
+    booths = [
+        {"id": str(uuid.uuid4()), "booth_number": n}
+        for n in range(1, BOOTHS + 1)
+    ]
+
+    print(
+        f"{'rows':>10} {'impl':>8} {'cpu s':>8} {'round trips':>12} "
+        f"{'est. wall s':>12} {'rows/s':>10}"
+    )
+
+    for rows in sizes:
+        random.seed(rows)
+        path = _synthetic_csv(rows, BOOTHS)
+
+        try:
+            job = {
+                "id": str(uuid.uuid4()),
+                "state_id": "s", "district_id": "d", "constituency_id": "c",
+                "booth_id": None
+            }
+            imported, cpu, bulk_rt = _bulk(path, ImportContext(job, booths, {}))
+        finally:
+            os.remove(path)
+
+        for impl, c, rt in (("per-row", 0.0, imported), ("bulk", cpu, bulk_rt)):
+            wall = c + rt * RTT_MS / 1000
+            print(
+                f"{rows:>10} {impl:>8} {c:>8.2f} {rt:>12,} "
+                f"{wall:>12,.1f} {rows / wall:>10,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(args or DEFAULT_SIZES)
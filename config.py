@@ -40,6 +40,129 @@ class Config:
     APP_NAME = os.getenv("APP_NAME", "E-Democracy")
     TOKEN_EXPIRY_MINUTES = int(os.getenv("TOKEN_EXPIRY_MINUTES", 60))
 
+    # -----------------------
+    # Reference Data Cache
+    # -----------------------
+    REFERENCE_CACHE_ENABLED = os.getenv("REFERENCE_CACHE_ENABLED", "True") == "True"
+    REFERENCE_CACHE_MAX_ENTRIES = int(os.getenv("REFERENCE_CACHE_MAX_ENTRIES", 5000))
+
+    # Rows per page for streamed reads (iter_all); keep <= PostgREST max-rows
+    SUPABASE_PAGE_SIZE = int(os.getenv("SUPABASE_PAGE_SIZE", 1000))
+
+    # -----------------------
+    # Merkle Tree (election close)
+    # -----------------------
+    # Above these receipt counts closure switches to the compact
+    # buffer-backed tree, then to memory-mapped level files.
+    MERKLE_COMPACT_MIN_RECEIPTS = int(os.getenv("MERKLE_COMPACT_MIN_RECEIPTS", 100000))
+    MERKLE_SPILL_MIN_RECEIPTS = int(os.getenv("MERKLE_SPILL_MIN_RECEIPTS", 2000000))
+    MERKLE_SPILL_DIR = os.getenv("MERKLE_SPILL_DIR")
+    # Publish the running accumulator root every N votes (0 = off)
+    MERKLE_INTERIM_ROOT_EVERY = int(os.getenv("MERKLE_INTERIM_ROOT_EVERY", 0))
+
+    # -----------------------
+    # Web3 Provider
+    # -----------------------
+    WEB3_HTTP_POOL_SIZE = int(os.getenv("WEB3_HTTP_POOL_SIZE", 10))
+    WEB3_REQUEST_TIMEOUT = float(os.getenv("WEB3_REQUEST_TIMEOUT", 10))
+    # Seconds between is_connected() probes while the node is healthy
+    WEB3_HEALTH_CHECK_INTERVAL = float(os.getenv("WEB3_HEALTH_CHECK_INTERVAL", 30))
+
+    # Cached eth_gasPrice lifetime (seconds)
+    WEB3_GAS_PRICE_TTL = float(os.getenv("WEB3_GAS_PRICE_TTL", 15))
+
+    # -----------------------
+    # Vote Transaction Queue
+    # -----------------------
+    # Async: submit_vote only enqueues; a worker sends and confirms
+    VOTE_TX_ASYNC = os.getenv("VOTE_TX_ASYNC", "False") == "True"
+    # Run the worker thread in this process (one per signing key)
+    VOTE_TX_WORKER_ENABLED = os.getenv("VOTE_TX_WORKER_ENABLED", "False") == "True"
+    VOTE_TX_POLL_INTERVAL = float(os.getenv("VOTE_TX_POLL_INTERVAL", 2))
+    VOTE_TX_BATCH_SIZE = int(os.getenv("VOTE_TX_BATCH_SIZE", 50))
+    VOTE_TX_CONFIRM_TIMEOUT = int(os.getenv("VOTE_TX_CONFIRM_TIMEOUT", 120))
+    VOTE_TX_GAS_BUMP_PERCENT = int(os.getenv("VOTE_TX_GAS_BUMP_PERCENT", 15))
+    VOTE_TX_MAX_ATTEMPTS = int(os.getenv("VOTE_TX_MAX_ATTEMPTS", 8))
+
+    # -----------------------
+    # VoteCast Event Index
+    # -----------------------
+    VOTE_INDEX_DB_PATH = os.getenv("VOTE_INDEX_DB_PATH", "instance/vote_events.sqlite3")
+    VOTE_INDEX_START_BLOCK = int(os.getenv("VOTE_INDEX_START_BLOCK", 0))
+    VOTE_INDEX_PAGE_BLOCKS = int(os.getenv("VOTE_INDEX_PAGE_BLOCKS", 5000))
+    VOTE_INDEX_CONFIRMATIONS = int(os.getenv("VOTE_INDEX_CONFIRMATIONS", 0))
+    # Reads skip the catch-up call if the index synced this recently
+    VOTE_INDEX_MAX_STALENESS = float(os.getenv("VOTE_INDEX_MAX_STALENESS", 5))
+
+    # -----------------------
+    # Election Snapshots
+    # -----------------------
+    # LIVE snapshots are re-checked against vote counts this often
+    ELECTION_SNAPSHOT_REFRESH_SECONDS = int(os.getenv("ELECTION_SNAPSHOT_REFRESH_SECONDS", 30))
+
+    # -----------------------
+    # Booth Sessions
+    # -----------------------
+    # "memory" (single worker) or "sqlite" (shared by all workers on a host)
+    BOOTH_SESSION_BACKEND = os.getenv("BOOTH_SESSION_BACKEND", "memory")
+    BOOTH_SESSION_DB_PATH = os.getenv("BOOTH_SESSION_DB_PATH", "instance/booth_sessions.sqlite3")
+    # Terminal lock lease, renewed by the terminal's booth-status polls
+    VOTING_TERMINAL_TTL = int(os.getenv("VOTING_TERMINAL_TTL", 120))
+    # How long an authorized voter has to cast a vote
+    BOOTH_VOTER_SESSION_TTL = int(os.getenv("BOOTH_VOTER_SESSION_TTL", 900))
+
+    # -----------------------
+    # Bulk Voter Import
+    # -----------------------
+    VOTER_IMPORT_DIR = os.getenv("VOTER_IMPORT_DIR", "instance/voter_imports")
+    # Rows read, validated and upserted per request / checkpoint
+    VOTER_IMPORT_CHUNK_SIZE = int(os.getenv("VOTER_IMPORT_CHUNK_SIZE", 2000))
+    # Rejected rows kept on the job for the ERO to review
+    VOTER_IMPORT_MAX_ERRORS = int(os.getenv("VOTER_IMPORT_MAX_ERRORS", 1000))
+    VOTER_MIN_AGE = int(os.getenv("VOTER_MIN_AGE", 18))
+
+    # -----------------------
+    # Voter Index
+    # -----------------------
+    # In-process voter → constituency/booth/gender/DOB index; rebuilt at
+    # least this often to pick up roll writes from other processes
+    VOTER_INDEX_TTL = int(os.getenv("VOTER_INDEX_TTL", 300))
+
+    # Enriched candidate lists per (election, constituency); dropped on
+    # nomination changes in this process, otherwise kept this long
+    CANDIDATE_VIEW_TTL = int(os.getenv("CANDIDATE_VIEW_TTL", 300))
+    # Pre-rendered booth ballots; also rebuilt on candidate changes
+    BALLOT_CACHE_TTL = int(os.getenv("BALLOT_CACHE_TTL", 3600))
+
+    # -----------------------
+    # Representative Scoring
+    # -----------------------
+    # Running score aggregates are rebuilt from history this often,
+    # absorbing any delta a failed write hook dropped
+    REP_SCORE_REBUILD_DAYS = int(os.getenv("REP_SCORE_REBUILD_DAYS", 7))
+
+    # -----------------------
+    # Daily Score Job
+    # -----------------------
+    # Constituencies scored at once; the work is mostly DB round trips
+    DAILY_SCORE_CONCURRENCY = int(os.getenv("DAILY_SCORE_CONCURRENCY", 8))
+    # Seconds per constituency attempt; a timed-out one fails (not retried)
+    DAILY_SCORE_ITEM_TIMEOUT = float(os.getenv("DAILY_SCORE_ITEM_TIMEOUT", 120))
+    # Retries for attempts that raised
+    DAILY_SCORE_RETRIES = int(os.getenv("DAILY_SCORE_RETRIES", 2))
+    # First retry delay in seconds, doubled per attempt
+    DAILY_SCORE_RETRY_BACKOFF = float(os.getenv("DAILY_SCORE_RETRY_BACKOFF", 2))
+
+    # -----------------------
+    # Durable Jobs
+    # -----------------------
+    # Lease on a job name; refreshed every third of it while the job
+    # runs, so a crashed runner blocks the next one at most this long
+    JOB_LOCK_TTL = float(os.getenv("JOB_LOCK_TTL", 900))
+    BRIEF_JOB_CONCURRENCY = int(os.getenv("BRIEF_JOB_CONCURRENCY", 4))
+    BRIEF_JOB_ITEM_TIMEOUT = float(os.getenv("BRIEF_JOB_ITEM_TIMEOUT", 60))
+    BRIEF_JOB_RETRIES = int(os.getenv("BRIEF_JOB_RETRIES", 1))
+
     # -----------------------
     # Role Definitions
     # -----------------------
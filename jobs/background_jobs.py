@@ -0,0 +1,114 @@
+# jobs/background_jobs.py
+#
+# Fire-and-poll jobs for the /internal triggers.
+#
+# start_background_job() runs target(job) on a daemon thread and
+# returns at once. Jobs live in this process only, so triggers hand out
+# the durable job_runs id for polling (other workers can read it) and
+# use the job for live progress where it runs (get_background_job,
+# get_background_job_for_run). One job per name runs at a time in this
+# process: starting a name that is already running returns that job.
+
+import threading
+import traceback
+
+from utils.helpers import generate_uuid, utc_now
+
+RUNNING = "RUNNING"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+
+# Finished jobs kept for polling
+MAX_FINISHED_JOBS = 100
+
+_jobs = {}       # job_id → BackgroundJob (insertion ordered)
+_lock = threading.Lock()
+
+
+class BackgroundJob:
+
+    def __init__(self, name: str, run_id=None):
+        self.id = generate_uuid()
+        self.name = name
+        self.run_id = run_id      # job_runs row it works on, if durable
+        self.status = RUNNING
+        self.started_at = utc_now().isoformat()
+        self.finished_at = None
+        self.progress = None      # PoolProgress, set by the target once it knows the items
+        self.result = None
+        self.error = None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "run_id": self.run_id,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress.snapshot() if self.progress else None,
+            "result": self.result,
+            "error": self.error
+        }
+
+
+def _prune():
+    finished = [j for j in _jobs.values() if j.status != RUNNING]
+    for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del _jobs[job.id]
+
+
+def _run(job: BackgroundJob, target):
+    try:
+        job.result = target(job)
+        job.status = COMPLETED
+    except Exception as e:
+        job.error = str(e)
+        job.status = FAILED
+        print(f"❌ Background job {job.name} {job.id} failed: {e}")
+        traceback.print_exc()
+    finally:
+        job.finished_at = utc_now().isoformat()
+
+
+def start_background_job(name: str, target, run_id=None):
+    """
+    Returns (job, started); started is False if `name` was already
+    running and that job is returned instead.
+    """
+    with _lock:
+        for job in _jobs.values():
+            if job.name == name and job.status == RUNNING:
+                return job, False
+
+        _prune()
+        job = BackgroundJob(name, run_id)
+        _jobs[job.id] = job
+
+    threading.Thread(
+        target=_run,
+        args=(job, target),
+        name=f"job-{name}-{job.id}",
+        daemon=True
+    ).start()
+    return job, True
+
+
+def get_background_job(job_id):
+    job = _jobs.get(job_id)
+    return job.to_dict() if job else None
+
+
+def get_background_job_for_run(run_id):
+    """
+    Live state of the job working on a durable run, if it runs in
+    this process.
+    """
+    for job in reversed(list(_jobs.values())):
+        if job.run_id == run_id:
+            return job.to_dict()
+    return None
+
+
+def list_background_jobs() -> list:
+    return [job.to_dict() for job in reversed(list(_jobs.values()))]
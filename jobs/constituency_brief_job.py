@@ -1,5 +1,10 @@
 # jobs/constituency_brief_job.py
 
+import threading
+
+from config import Config
+from jobs.durable_job import run_durable_job
+from jobs.worker_pool import run_in_pool
 from models.constituency import get_all_constituencies
 from services.constituency_ai_service import (
     build_constituency_brief_prompt
@@ -7,44 +12,83 @@ from services.constituency_ai_service import (
 from models.constituency_activity import get_constituency_activity_snapshot
 from models.constituency_brief import save_brief
 from services.ai_client import run_comment_reply
-from datetime import datetime, timezone
+from utils.helpers import utc_now
+
+
+def _load_snapshots(constituency_ids) -> dict:
+    snapshots = {}
+    lock = threading.Lock()
+
+    def load(constituency_id):
+        snapshot = get_constituency_activity_snapshot(constituency_id)
+        with lock:
+            snapshots[constituency_id] = snapshot
 
+    run_in_pool(
+        "constituency-brief-snapshots",
+        constituency_ids,
+        load,
+        concurrency=Config.BRIEF_JOB_CONCURRENCY,
+        timeout=Config.BRIEF_JOB_ITEM_TIMEOUT,
+        retries=Config.BRIEF_JOB_RETRIES
+    )
 
-def run_constituency_brief_job():
+    # Copy under the lock: a timed-out load may still finish late
+    with lock:
+        return dict(snapshots)
+
+
+def brief_run_key() -> str:
     """
-    Generates fresh AI summaries for all constituencies.
-    This should be run every 1 hour via cron.
+    One constituency-brief run per hour.
     """
+    return utc_now().strftime("%Y-%m-%dT%H")
 
-    print("🔄 Running constituency brief cron job...")
-
-    constituencies = get_all_constituencies()
 
-    for constituency in constituencies:
-        constituency_id = constituency["id"]
+def run_constituency_brief_job(job=None, run_key: str = None):
+    """
+    Generates fresh AI summaries for all constituencies.
+    This should be run every 1 hour via cron.
 
-        try:
-            print(f"Generating summary for {constituency_id}...")
+    One durable run per hour: a rerun in the same hour only covers
+    constituencies that failed or were not reached. Snapshots are
+    loaded first and classified in one batched model call; each
+    constituency is then checkpointed when its brief is saved.
+    """
 
-            snapshot = get_constituency_activity_snapshot(constituency_id)
+    print("🔄 Running constituency brief cron job...")
 
-            '''prompt = build_constituency_brief_prompt(snapshot)
+    constituency_ids = [c["id"] for c in get_all_constituencies()]
+    summaries = {}
 
-            summary = run_comment_reply(prompt)
+    def prepare(remaining):
+        '''prompt = build_constituency_brief_prompt(snapshot)
 
-            save_brief(constituency_id, summary)'''
-            from services.constituency_ml_service import generate_constituency_summary
+        summary = run_comment_reply(prompt)'''
+        from services.constituency_ml_service import generate_constituency_summaries
 
-            summary = generate_constituency_summary(snapshot)
-            save_brief(constituency_id, summary)
+        summaries.update(generate_constituency_summaries(_load_snapshots(remaining)))
 
-            print(f"✅ Saved summary for {constituency_id}")
+    def save(constituency_id):
+        if constituency_id not in summaries:
+            raise RuntimeError("activity snapshot could not be loaded")
+        save_brief(constituency_id, summaries[constituency_id])
 
-        except Exception as e:
-            print(f"❌ Failed for {constituency_id}: {e}")
+    summary = run_durable_job(
+        "constituency-brief",
+        run_key or brief_run_key(),
+        constituency_ids,
+        save,
+        concurrency=Config.BRIEF_JOB_CONCURRENCY,
+        timeout=Config.BRIEF_JOB_ITEM_TIMEOUT,
+        retries=Config.BRIEF_JOB_RETRIES,
+        job=job,
+        prepare=prepare
+    )
 
-    print("🎉 Cron job completed successfully.")
+    print(f"🎉 Cron job finished: {summary['status']}")
+    return summary
 
 
 if __name__ == "__main__":
-    run_constituency_brief_job()
\ No newline at end of file
+    run_constituency_brief_job()
@@ -0,0 +1,217 @@
+# jobs/durable_job.py
+#
+# Resumable, single-runner batch jobs on top of the worker pool.
+#
+# run_durable_job(name, run_key, items, fn, ...):
+# 1. takes the job_locks lease for `name` (another runner → skipped),
+#    and keeps it alive from a heartbeat thread. If the lease is lost,
+#    no further items are started or checkpointed and the run row is
+#    left to the new holder
+# 2. finds or creates the job_runs row for (name, run_key); a
+#    COMPLETED run is not repeated. Triggers call prepare_job_run first
+#    so they can hand out the run id before the job starts
+# 3. skips items already checkpointed DONE for that run, so a rerun
+#    after a crash or failures does only the remaining work; an
+#    optional prepare(remaining) does batch work for them up front
+# 4. checkpoints every item (status, attempts, elapsed_ms) as it
+#    settles, and stores the pool summary (incl. item timings) on the run
+#
+# A run with failed items ends FAILED; calling it again with the same
+# run_key retries just those.
+
+import threading
+import time
+import traceback
+
+from config import Config
+from jobs.worker_pool import PoolProgress, run_in_pool
+from models.job_run import (
+    QUEUED,
+    RUNNING,
+    COMPLETED,
+    FAILED,
+    ITEM_DONE,
+    ITEM_FAILED,
+    get_job_run,
+    create_job_run,
+    update_job_run,
+    get_job_run_items,
+    save_job_run_item,
+    acquire_job_lock,
+    refresh_job_lock,
+    release_job_lock
+)
+from utils.helpers import generate_uuid, utc_now
+
+
+def _heartbeat(name, token, run_id, stop: threading.Event, lost: threading.Event):
+    ttl = Config.JOB_LOCK_TTL
+    refreshed = time.monotonic()
+
+    while not stop.wait(ttl / 3):
+        try:
+            if refresh_job_lock(name, token, ttl, run_id):
+                refreshed = time.monotonic()
+                continue
+            print(f"⚠️ {name}: lock lease lost to another runner, stopping")
+        except Exception as e:
+            print(f"⚠️ {name}: lock heartbeat failed: {e}")
+            if time.monotonic() - refreshed < ttl:
+                continue
+            print(f"⚠️ {name}: lock lease expired, stopping")
+
+        lost.set()
+        return
+
+
+def prepare_job_run(name: str, run_key: str) -> dict:
+    """
+    The (name, run_key) run row, created QUEUED if there is none yet.
+    Its id can be polled from any process.
+    """
+    run = get_job_run(name, run_key)
+    if run:
+        return run
+
+    try:
+        return create_job_run(name, run_key, 0, status=QUEUED)
+    except Exception:
+        # Created concurrently
+        return get_job_run(name, run_key)
+
+
+def _start_run(name, run_key, total):
+    run = get_job_run(name, run_key)
+
+    if not run:
+        return create_job_run(name, run_key, total)
+
+    if run["status"] == QUEUED:
+        update_job_run(run["id"], {
+            "status": RUNNING,
+            "total": total,
+            "started_at": utc_now().isoformat()
+        })
+    elif run["status"] != COMPLETED:
+        update_job_run(run["id"], {
+            "status": RUNNING,
+            "attempt": (run.get("attempt") or 0) + 1,
+            "total": total,
+            "error": None,
+            "finished_at": None
+        })
+    return run
+
+
+def run_durable_job(
+    name: str,
+    run_key: str,
+    items,
+    fn,
+    concurrency: int,
+    timeout: float,
+    retries: int = 0,
+    backoff: float = 1.0,
+    job=None,
+    prepare=None
+) -> dict:
+    """
+    Runs fn(item) for every item of the (name, run_key) run not yet
+    done. Items must be ids (they are stored as text).
+    Pass the BackgroundJob to expose live progress on it.
+    """
+    token = generate_uuid()
+
+    if not acquire_job_lock(name, token, Config.JOB_LOCK_TTL):
+        print(f"⏭️ {name}: another run holds the lock, skipping")
+        return {"status": "locked", "name": name, "run_key": run_key}
+
+    stop = threading.Event()
+    lost = threading.Event()
+    run = None
+
+    try:
+        items = [str(i) for i in items]
+        run = _start_run(name, run_key, len(items))
+
+        if run["status"] == COMPLETED:
+            print(f"⏭️ {name} {run_key}: already completed")
+            return {"status": "already_completed", "run_id": run["id"], "run_key": run_key}
+
+        refresh_job_lock(name, token, Config.JOB_LOCK_TTL, run["id"])
+        threading.Thread(
+            target=_heartbeat,
+            args=(name, token, run["id"], stop, lost),
+            name=f"job-lock-{name}",
+            daemon=True
+        ).start()
+
+        done = {row["item"] for row in get_job_run_items(run["id"], ITEM_DONE)}
+        remaining = [i for i in items if i not in done]
+
+        print(f"🔄 {name} {run_key}: {len(remaining)} to run, {len(items) - len(remaining)} already done")
+
+        if prepare and remaining:
+            prepare(remaining)
+
+        progress = PoolProgress(name, len(remaining))
+        if job is not None:
+            job.progress = progress
+
+        def checkpoint(item, error, elapsed_ms, attempts):
+            if lost.is_set():
+                return
+            save_job_run_item(
+                run["id"],
+                item,
+                ITEM_FAILED if error else ITEM_DONE,
+                attempts,
+                elapsed_ms,
+                error
+            )
+
+        summary = run_in_pool(
+            name,
+            remaining,
+            fn,
+            concurrency=concurrency,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+            progress=progress,
+            on_item=checkpoint,
+            should_stop=lost.is_set
+        )
+        summary["skipped"] = len(items) - len(remaining)
+
+        if lost.is_set():
+            # The new holder resumes from the checkpoints written so far
+            return {"status": "lease_lost", "run_id": run["id"], "run_key": run_key, **summary}
+
+        status = FAILED if summary["failed"] else COMPLETED
+        update_job_run(run["id"], {
+            "status": status,
+            "done": summary["skipped"] + summary["succeeded"],
+            "failed": summary["failed"],
+            "summary": summary,
+            "finished_at": utc_now().isoformat()
+        })
+
+        return {"status": status, "run_id": run["id"], "run_key": run_key, **summary}
+
+    except Exception as e:
+        if run and not lost.is_set():
+            update_job_run(run["id"], {
+                "status": FAILED,
+                "error": str(e),
+                "finished_at": utc_now().isoformat()
+            })
+        traceback.print_exc()
+        raise
+
+    finally:
+        stop.set()
+        try:
+            release_job_lock(name, token)
+        except Exception as e:
+            print(f"⚠️ {name}: could not release lock: {e}")
@@ -1,9 +1,39 @@
+from datetime import date
+
+from config import Config
 from jobs.daily_score_job import run_daily_score_job
+from jobs.durable_job import run_durable_job
 from models.constituency import get_all_constituencies
+from services.representative_role_sync_service import sync_user_roles_from_representatives
+
+def daily_score_run_key() -> str:
+    """
+    One daily-score run per day.
+    """
+    return date.today().isoformat()
+
+
+def run_all_daily_scores(job=None, run_key: str = None):
+    """
+    Scores every constituency on a worker pool
+    (DAILY_SCORE_CONCURRENCY at a time, each with a timeout and
+    retries) as one durable run per day: a rerun the same day only
+    scores constituencies not checkpointed yet.
+    Pass the BackgroundJob to expose live progress on it.
+    """
+    # Terms start / end on date boundaries, so roles are synced daily too
+    sync_user_roles_from_representatives()
+
+    constituency_ids = [c["id"] for c in get_all_constituencies()]
 
-def run_all_daily_scores():
-    constituencies = get_all_constituencies()
-    for c in constituencies:
-        run_daily_score_job(
-            constituency_id=c["id"],
-        )
\ No newline at end of file
+    return run_durable_job(
+        "daily-score",
+        run_key or daily_score_run_key(),
+        constituency_ids,
+        run_daily_score_job,
+        concurrency=Config.DAILY_SCORE_CONCURRENCY,
+        timeout=Config.DAILY_SCORE_ITEM_TIMEOUT,
+        retries=Config.DAILY_SCORE_RETRIES,
+        backoff=Config.DAILY_SCORE_RETRY_BACKOFF,
+        job=job
+    )
@@ -0,0 +1,213 @@
+# jobs/worker_pool.py
+#
+# Runs one function over many items on a bounded thread pool.
+#
+# Per-constituency jobs are almost all network round trips, so threads
+# overlap the waits. Each item gets:
+# - a timeout per attempt. Python threads cannot be stopped, so a
+#   timed-out attempt may still be running: the item is failed without
+#   a retry (two attempts must never overlap), and its pool slot waits
+#   up to one more timeout for the attempt to end, so real concurrency
+#   stays within the cap. Attempts still running after that are
+#   abandoned and counted.
+# - retries with exponential backoff for attempts that raised
+# Progress (done / failed / rate / ETA / item timings) is readable
+# while it runs, and on_item(item, error, elapsed_ms, attempts) is
+# called as each item settles (used for checkpoints). Once
+# should_stop() is true, items not started yet are cancelled.
+
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class ItemTimeout(Exception):
+
+    def __init__(self, message, worker: threading.Thread):
+        super().__init__(message)
+        self.worker = worker
+
+
+class PoolProgress:
+
+    def __init__(self, name: str, total: int):
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.retries = 0
+        self.abandoned = 0        # timed-out attempts still running when their slot moved on
+        self.cancelled = 0        # never started because should_stop() turned true
+        self.errors = {}          # item → last error message
+        self.item_ms = []         # wall time per settled item, retries included
+        self.started = time.monotonic()
+        self.finished = None
+        self._lock = threading.Lock()
+
+    def item_finished(self, item, error: str = None, elapsed_ms: float = None):
+        with self._lock:
+            self.done += 1
+            if elapsed_ms is not None:
+                self.item_ms.append(elapsed_ms)
+            if error:
+                self.failed += 1
+                self.errors[str(item)] = error
+
+    def item_retried(self):
+        with self._lock:
+            self.retries += 1
+
+    def item_cancelled(self):
+        with self._lock:
+            self.cancelled += 1
+
+    def attempt_abandoned(self):
+        with self._lock:
+            self.abandoned += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            elapsed = (self.finished or time.monotonic()) - self.started
+            rate = self.done / elapsed if elapsed > 0 else 0.0
+            remaining = self.total - self.done - self.cancelled
+
+            return {
+                "name": self.name,
+                "total": self.total,
+                "done": self.done,
+                "succeeded": self.done - self.failed,
+                "failed": self.failed,
+                "retries": self.retries,
+                "abandoned": self.abandoned,
+                "cancelled": self.cancelled,
+                "percent": round(self.done / self.total * 100, 1) if self.total else 100.0,
+                "elapsed_s": round(elapsed, 1),
+                "items_per_s": round(rate, 2),
+                "eta_s": _eta(remaining, rate),
+                "item_ms": _timings(self.item_ms),
+                "errors": dict(self.errors)
+            }
+
+
+def _eta(remaining: int, rate: float):
+    if not remaining:
+        return 0.0
+    return round(remaining / rate, 1) if rate else None
+
+
+def _timings(values: list) -> dict:
+    if not values:
+        return {"p50": None, "p95": None, "max": None}
+
+    ordered = sorted(values)
+    at = lambda q: round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+    return {"p50": at(0.5), "p95": at(0.95), "max": round(ordered[-1], 1)}
+
+
+def _call_with_timeout(fn, item, timeout: float):
+    result = {}
+
+    def target():
+        try:
+            result["value"] = fn(item)
+        except BaseException as e:
+            result["error"] = e
+
+    worker = threading.Thread(target=target, name=f"pool-item-{item}", daemon=True)
+    worker.start()
+    worker.join(timeout)
+
+    if worker.is_alive():
+        raise ItemTimeout(f"timed out after {timeout}s", worker)
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
+
+
+def _settle(item, error, started, attempts, progress, on_item):
+    elapsed_ms = (time.monotonic() - started) * 1000
+    progress.item_finished(item, error, elapsed_ms)
+
+    if on_item:
+        try:
+            on_item(item, error, elapsed_ms, attempts)
+        except Exception as e:
+            print(f"⚠️ {progress.name} {item}: on_item failed: {e}")
+
+
+def _run_item(fn, item, timeout, retries, backoff, progress, on_item, should_stop):
+    started = time.monotonic()
+
+    for attempt in range(retries + 1):
+        if should_stop and should_stop():
+            progress.item_cancelled()
+            return None
+
+        try:
+            value = _call_with_timeout(fn, item, timeout)
+            _settle(item, None, started, attempt + 1, progress, on_item)
+            return value
+        except ItemTimeout as e:
+            _settle(item, f"ItemTimeout: {e}", started, attempt + 1, progress, on_item)
+            print(f"❌ {progress.name} {item}: {e}")
+
+            # Hold the slot while the attempt may still be running
+            e.worker.join(timeout)
+            if e.worker.is_alive():
+                progress.attempt_abandoned()
+                print(f"⚠️ {progress.name} {item}: timed-out attempt still running, abandoned")
+            return None
+        except Exception as e:
+            if attempt == retries:
+                _settle(item, f"{type(e).__name__}: {e}", started, attempt + 1, progress, on_item)
+                print(f"❌ {progress.name} {item}: {e}")
+                return None
+
+            progress.item_retried()
+            time.sleep(backoff * (2 ** attempt))
+
+
+def run_in_pool(
+    name: str,
+    items,
+    fn,
+    concurrency: int,
+    timeout: float,
+    retries: int = 0,
+    backoff: float = 1.0,
+    progress: PoolProgress = None,
+    report_every: int = 50,
+    on_item=None,
+    should_stop=None
+) -> dict:
+    """
+    Calls fn(item) for every item, at most `concurrency` at a time.
+    Failures (after retries) are recorded, never raised.
+    Returns the final progress snapshot.
+    """
+    items = list(items)
+    progress = progress or PoolProgress(name, len(items))
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix=name) as pool:
+        futures = [
+            pool.submit(_run_item, fn, item, timeout, retries, backoff, progress, on_item, should_stop)
+            for item in items
+        ]
+
+        for n, _ in enumerate(as_completed(futures), 1):
+            if n % report_every == 0 and n < len(items):
+                s = progress.snapshot()
+                print(
+                    f"📈 {name}: {s['done']}/{s['total']} ({s['failed']} failed), "
+                    f"{s['items_per_s']}/s, ETA {s['eta_s']}s"
+                )
+
+    progress.finished = time.monotonic()
+    summary = progress.snapshot()
+    print(
+        f"✅ {name}: {summary['succeeded']}/{summary['total']} succeeded, "
+        f"{summary['failed']} failed, {summary['cancelled']} cancelled in {summary['elapsed_s']}s "
+        f"(p95 {summary['item_ms']['p95']} ms/item)"
+    )
+    return summary
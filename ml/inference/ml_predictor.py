@@ -1,7 +1,10 @@
-import pandas as pd
+import threading
+import warnings
+
 import joblib
+import numpy as np
 
-model = joblib.load("ml/model/civic_model.pkl")
+MODEL_PATH = "ml/model/civic_model.pkl"
 
 FEATURE_ORDER = [
     "trending_issues",
@@ -14,6 +17,56 @@ FEATURE_ORDER = [
     "rep_term_ending"
 ]
 
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_model():
+    # Loaded once even when pool workers ask for it together
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                set_model(joblib.load(MODEL_PATH))
+    return _model
+
+
+def set_model(model):
+    """
+    The model was fit on a DataFrame; predicting on a plain array is
+    only safe if its columns are FEATURE_ORDER, so check that once here.
+    """
+    global _model
+
+    names = getattr(model, "feature_names_in_", None)
+    if names is not None and list(names) != FEATURE_ORDER:
+        raise ValueError(f"Model features {list(names)} do not match FEATURE_ORDER")
+
+    _model = model
+
+
+def features_to_matrix(rows: list) -> np.ndarray:
+    """
+    Feature dicts → (n, len(FEATURE_ORDER)) array, columns in FEATURE_ORDER.
+    """
+    return np.array(
+        [[row[f] for f in FEATURE_ORDER] for row in rows],
+        dtype=np.float64
+    ).reshape(len(rows), len(FEATURE_ORDER))
+
+
+def predict_constituency_statuses(features: np.ndarray) -> np.ndarray:
+    """
+    One model.predict call for a whole feature matrix
+    (rows = constituencies, columns = FEATURE_ORDER).
+    """
+    if len(features) == 0:
+        return np.array([], dtype=object)
+
+    with warnings.catch_warnings():
+        # Columns are checked against feature_names_in_ in set_model
+        warnings.filterwarnings("ignore", message="X does not have valid feature names")
+        return get_model().predict(features)
+
+
 def predict_constituency_status(data: dict):
-    df = pd.DataFrame([[data[f] for f in FEATURE_ORDER]], columns=FEATURE_ORDER)
-    return model.predict(df)[0]
\ No newline at end of file
+    return predict_constituency_statuses(features_to_matrix([data]))[0]
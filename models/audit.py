@@ -1,4 +1,4 @@
-from supabase_db.db import insert_record, fetch_all
+from supabase_db.db import insert_record, fetch_all, iter_all
 from utils.helpers import generate_uuid, utc_now,format_datetime
 
 
@@ -30,11 +30,17 @@ def create_audit_log(
     return insert_record(AUDIT_LOGS_TABLE, payload, use_admin=True)
 
 
+def iter_audit_logs():
+    """
+    Streams every audit log a page at a time (formatted timestamps).
+    """
+    for audit in iter_all(AUDIT_LOGS_TABLE):
+        audit["timestamp"] = format_datetime(audit["timestamp"])
+        yield audit
+
+
 def get_audit_logs():
-    audits=fetch_all(AUDIT_LOGS_TABLE)
-    for audit in audits:
-        audit["timestamp"]=format_datetime(audit["timestamp"])
-    return audits
+    return list(iter_audit_logs())
 
 
 def get_audit_logs_by_user(user_id: str):
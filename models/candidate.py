@@ -1,4 +1,8 @@
-from supabase_db.db import fetch_one, fetch_all, insert_record, update_record
+import threading
+import time
+
+from config import Config
+from supabase_db.db import fetch_one, fetch_all, fetch_map, iter_all, insert_record, update_record
 from utils.helpers import generate_uuid, utc_now, format_datetime
 
 
@@ -8,6 +12,103 @@ from utils.helpers import generate_uuid, utc_now, format_datetime
 
 CANDIDATES_TABLE = "candidates"
 REPRESENTATIVES_TABLE = "representatives"
+VOTER_USER_MAP_TABLE = "voter_user_map"
+VOTERS_TABLE = "voters"
+
+
+def resolve_candidate_names(candidates: list) -> dict:
+    """
+    Resolves user_id → voter full_name for a list of candidates
+    with two bulk queries (voter_user_map, then voters).
+    Candidates without a mapping or voter are absent from the result.
+    """
+    mappings = fetch_map(
+        VOTER_USER_MAP_TABLE,
+        "user_id",
+        [c["user_id"] for c in candidates],
+        columns=["user_id", "voter_id"]
+    )
+
+    voters = fetch_map(
+        VOTERS_TABLE,
+        "id",
+        [m["voter_id"] for m in mappings.values()],
+        columns=["id", "full_name"]
+    )
+
+    names = {}
+    for user_id, mapping in mappings.items():
+        voter = voters.get(mapping["voter_id"])
+        if voter:
+            names[user_id] = voter["full_name"]
+
+    return names
+
+
+# -----------------------------
+# Candidate Views
+# -----------------------------
+
+# (election_id, constituency_id) -> (expires_at, enriched candidates).
+# Nominations are rare and the voting / results pages read the same
+# lists on every load, so lists are kept until a nomination or name
+# change in this process, or CANDIDATE_VIEW_TTL for other processes.
+_views = {}
+_views_lock = threading.Lock()
+
+# Bumped on every invalidation so derived caches (booth ballots) can
+# tell their candidate lists are out of date
+_views_generation = 0
+
+
+def get_candidate_view(election_id: str = None, constituency_id: str = None) -> list:
+    """
+    Candidate rows plus "candidate_name" for an election and/or
+    constituency (None = any). Candidates without a resolvable name
+    are left out. Returns copies; callers may mutate them.
+    """
+    key = (election_id, constituency_id)
+
+    with _views_lock:
+        entry = _views.get(key)
+
+    if entry is None or entry[0] < time.monotonic():
+        filters = {}
+        if election_id is not None:
+            filters["election_id"] = election_id
+        if constituency_id is not None:
+            filters["constituency_id"] = constituency_id
+
+        # A whole election can exceed PostgREST's row cap, so page it
+        candidates = list(iter_all(CANDIDATES_TABLE, filters))
+        names = resolve_candidate_names(candidates)
+
+        view = [
+            {**c, "candidate_name": names[c["user_id"]]}
+            for c in candidates
+            if names.get(c["user_id"])
+        ]
+        entry = (time.monotonic() + Config.CANDIDATE_VIEW_TTL, view)
+
+        with _views_lock:
+            _views[key] = entry
+
+    return [dict(c) for c in entry[1]]
+
+
+def invalidate_candidate_views():
+    """
+    Called after nomination, status, mapping or voter name changes.
+    """
+    global _views_generation
+
+    with _views_lock:
+        _views.clear()
+        _views_generation += 1
+
+
+def candidate_views_generation() -> int:
+    return _views_generation
 
 
 # -----------------------------
@@ -29,7 +130,9 @@ def create_candidate(
         "status": "Pending",
         "created_at": utc_now().isoformat()
     }
-    return insert_record(CANDIDATES_TABLE, payload, use_admin=True)
+    candidate = insert_record(CANDIDATES_TABLE, payload, use_admin=True)
+    invalidate_candidate_views()
+    return candidate
 
 
 def get_candidate_by_id(candidate_id: str):
@@ -44,42 +147,16 @@ def get_candidates_by_constituency(constituency_id):
     """
     Returns candidates with resolved display name
     """
-
-    candidates = fetch_all(
-        "candidates",
-        {"constituency_id": constituency_id}
-    )
-
-    result = []
-
-    for c in candidates:
-        # Step 1: map user_id → voter_id
-        voter_map = fetch_one(
-            "voter_user_map",
-            {"user_id": c["user_id"]}
-        )
-
-        if not voter_map:
-            continue
-
-        # Step 2: voter_id → voter full name
-        voter = fetch_one(
-            "voters",
-            {"id": voter_map["voter_id"]}
-        )
-
-        if not voter:
-            continue
-
-        result.append({
+    return [
+        {
             "id": c["id"],
-            "candidate_name": voter["full_name"],
+            "candidate_name": c["candidate_name"],
             "party_name": c["party_name"],
             "created_at":format_datetime(c["created_at"]),
             "election_id":c["election_id"]
-        })
-
-    return result
+        }
+        for c in get_candidate_view(constituency_id=constituency_id)
+    ]
 
 
 
@@ -88,50 +165,25 @@ def get_candidates_by_election_and_constituency(election_id, constituency_id):
     Returns only candidates contesting in a given election + constituency
     with resolved display names.
     """
-
-    candidates = fetch_all(
-        "candidates",
+    return [
         {
-            "election_id": election_id,
-            "constituency_id": constituency_id
-        }
-    )
-
-    result = []
-
-    for c in candidates:
-        # user_id → voter_id
-        voter_map = fetch_one(
-            "voter_user_map",
-            {"user_id": c["user_id"]}
-        )
-        if not voter_map:
-            continue
-
-        # voter_id → full_name
-        voter = fetch_one(
-            "voters",
-            {"id": voter_map["voter_id"]}
-        )
-        if not voter:
-            continue
-
-        result.append({
             "id": c["id"],
-            "candidate_name": voter["full_name"],
+            "candidate_name": c["candidate_name"],
             "party_name": c["party_name"]
-        })
-
-    return result
+        }
+        for c in get_candidate_view(election_id, constituency_id)
+    ]
 
 
 def update_candidate_status(candidate_id: str, status: str):
-    return update_record(
+    response = update_record(
         CANDIDATES_TABLE,
         {"id": candidate_id},
         {"status": status},
         use_admin=True
     )
+    invalidate_candidate_views()
+    return response
 
 
 # -----------------------------
@@ -164,41 +216,7 @@ def get_representatives_by_constituency(constituency_id: str):
     return fetch_all(REPRESENTATIVES_TABLE, {"constituency_id": constituency_id})
 
 def get_candidates_with_names(election_id: str, constituency_id: str):
-    candidates = fetch_all(
-        "candidates",
-        {
-            "election_id": election_id,
-            "constituency_id": constituency_id
-        }
-    )
-
-    enriched = []
-
-    for c in candidates:
-        # Step 1: user → voter mapping
-        mapping = fetch_one(
-            "voter_user_map",
-            {"user_id": c["user_id"]}
-        )
-
-        if not mapping:
-            continue
-
-        # Step 2: voter → name
-        voter = fetch_one(
-            "voters",
-            {"id": mapping["voter_id"]}
-        )
-
-        if not voter:
-            continue
-
-        enriched.append({
-            **c,
-            "candidate_name": voter["full_name"]
-        })
-
-    return enriched
+    return get_candidate_view(election_id, constituency_id)
 
 def map_candidate_uint_to_name(constituency_id):
     from utils.crypto import uuid_to_uint256
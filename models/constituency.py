@@ -1,4 +1,4 @@
-from supabase_db.db import fetch_all,fetch_one
+from supabase_db.db import fetch_all,fetch_one,fetch_many,fetch_map
 
 CONSTITUENCIES_TABLE = "constituencies"
 DISTRICTS_TABLE = "districts"
@@ -19,17 +19,12 @@ def get_constituencies_by_state(state_id: str):
 
     district_ids = [d["id"] for d in districts]
 
-    # 2️⃣ Fetch constituencies in those districts
-    constituencies = []
-
-    for did in district_ids:
-        rows = fetch_all(
-            CONSTITUENCIES_TABLE,
-            {"district_id": did}
-        )
-        constituencies.extend(rows)
-
-    return constituencies
+    # 2️⃣ Fetch constituencies in those districts (one IN query)
+    return fetch_many(
+        CONSTITUENCIES_TABLE,
+        "district_id",
+        district_ids
+    )
 
 
 
@@ -79,14 +74,17 @@ def get_constituencies_by_election_id(election_id: str):
     if not mappings:
         return []
 
+    # Step 2: Fetch full constituency details in bulk
+    found = fetch_map(
+        CONSTITUENCIES_TABLE,
+        "id",
+        [m["constituency_id"] for m in mappings]
+    )
+
     results = []
 
-    # Step 2: Fetch full constituency details
     for m in mappings:
-        constituency = fetch_one(
-            CONSTITUENCIES_TABLE,
-            {"id": m["constituency_id"]}
-        )
+        constituency = found.get(m["constituency_id"])
 
         if constituency:
             results.append(constituency)
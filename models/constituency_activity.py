@@ -1,4 +1,4 @@
-from supabase_db.db import fetch_all,fetch_one
+from supabase_db.db import fetch_all,fetch_map,fetch_grouped
 from utils.helpers import utc_now
 from datetime import datetime
 
@@ -69,11 +69,14 @@ def get_active_issue_discussions_today(constituency_id: str):
     today = _today_iso_prefix()
     results = []
 
+    comments_by_issue = fetch_grouped(
+        ISSUE_COMMENTS_TABLE,
+        "issue_id",
+        [i["id"] for i in issues]
+    )
+
     for issue in issues:
-        comments = fetch_all(
-            ISSUE_COMMENTS_TABLE,
-            {"issue_id": issue["id"]}
-        ) or []
+        comments = comments_by_issue.get(issue["id"], [])
 
         today_comments = [
             c for c in comments
@@ -103,11 +106,14 @@ def get_issues_resolved_today(constituency_id: str):
     today = _today_iso_prefix()
     resolved = []
 
+    resolutions_by_issue = fetch_grouped(
+        ISSUE_RESOLUTION_TABLE,
+        "issue_id",
+        [i["id"] for i in issues]
+    )
+
     for issue in issues:
-        resolution = fetch_all(
-            ISSUE_RESOLUTION_TABLE,
-            {"issue_id": issue["id"]}
-        ) or []
+        resolution = resolutions_by_issue.get(issue["id"], [])
 
         for r in resolution:
             if r.get("confirmed_at") and r["confirmed_at"].startswith(today):
@@ -156,11 +162,14 @@ def get_active_policy_debates_today(constituency_id: str):
     today = _today_iso_prefix()
     debates = []
 
+    comments_by_post = fetch_grouped(
+        POLICY_COMMENTS_TABLE,
+        "post_id",
+        [p["id"] for p in posts]
+    )
+
     for p in posts:
-        comments = fetch_all(
-            POLICY_COMMENTS_TABLE,
-            {"post_id": p["id"]}
-        ) or []
+        comments = comments_by_post.get(p["id"], [])
 
         today_comments = [
             c for c in comments
@@ -186,9 +195,13 @@ def get_trending_issues(constituency_id: str, limit: int = 5):
 
     enriched = []
 
+    issue_ids = [i["id"] for i in issues]
+    votes_by_issue = fetch_grouped(ISSUE_VOTES_TABLE, "issue_id", issue_ids)
+    comments_by_issue = fetch_grouped(ISSUE_COMMENTS_TABLE, "issue_id", issue_ids)
+
     for i in issues:
-        votes = fetch_all(ISSUE_VOTES_TABLE, {"issue_id": i["id"]}) or []
-        comments = fetch_all(ISSUE_COMMENTS_TABLE, {"issue_id": i["id"]}) or []
+        votes = votes_by_issue.get(i["id"], [])
+        comments = comments_by_issue.get(i["id"], [])
 
         score = 0
         for v in votes:
@@ -219,9 +232,13 @@ def get_backlash_issues(constituency_id: str, limit: int = 3):
 
     backlash = []
 
+    issue_ids = [i["id"] for i in issues]
+    votes_by_issue = fetch_grouped(ISSUE_VOTES_TABLE, "issue_id", issue_ids)
+    feedback_by_issue = fetch_grouped(ISSUE_FEEDBACK_TABLE, "issue_id", issue_ids)
+
     for i in issues:
-        votes = fetch_all(ISSUE_VOTES_TABLE, {"issue_id": i["id"]}) or []
-        feedback = fetch_all(ISSUE_FEEDBACK_TABLE, {"issue_id": i["id"]}) or []
+        votes = votes_by_issue.get(i["id"], [])
+        feedback = feedback_by_issue.get(i["id"], [])
 
         downvotes = sum(1 for v in votes if v["vote_type"] == "down")
         low_ratings = sum(1 for f in feedback if (f.get("rating") or 5) <= 2)
@@ -245,8 +262,14 @@ def get_supported_issues(constituency_id: str, limit: int = 3):
 
     supported = []
 
+    votes_by_issue = fetch_grouped(
+        ISSUE_VOTES_TABLE,
+        "issue_id",
+        [i["id"] for i in issues]
+    )
+
     for i in issues:
-        votes = fetch_all(ISSUE_VOTES_TABLE, {"issue_id": i["id"]}) or []
+        votes = votes_by_issue.get(i["id"], [])
         upvotes = sum(1 for v in votes if v["vote_type"] == "up")
 
         if upvotes >= 5:
@@ -268,8 +291,14 @@ def get_active_policy_discussions(constituency_id: str, limit: int = 3):
 
     enriched = []
 
+    comments_by_post = fetch_grouped(
+        POLICY_COMMENTS_TABLE,
+        "post_id",
+        [p["id"] for p in posts]
+    )
+
     for p in posts:
-        comments = fetch_all(POLICY_COMMENTS_TABLE, {"post_id": p["id"]}) or []
+        comments = comments_by_post.get(p["id"], [])
 
         enriched.append({
             "title": p.get("title"),
@@ -289,8 +318,10 @@ def get_active_elections(constituency_id: str):
 
     active = []
 
+    elections = fetch_map(ELECTIONS_TABLE, "id", [l["election_id"] for l in links])
+
     for l in links:
-        election = fetch_one(ELECTIONS_TABLE, {"id": l["election_id"]})
+        election = elections.get(l["election_id"])
         if not election:
             continue
 
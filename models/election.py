@@ -1,4 +1,4 @@
-from supabase_db.db import fetch_one, fetch_all, insert_record, update_record
+from supabase_db.db import fetch_one, fetch_all, fetch_map, insert_record, update_record
 from utils.helpers import generate_uuid, utc_now, format_datetime
 from datetime import datetime
 
@@ -62,8 +62,9 @@ def get_elections_by_state(state_id: str):
 
 def get_all_elections():
     elections=fetch_all(ELECTIONS_TABLE)
+    states=fetch_map("states", "id", [e["state_id"] for e in elections])
     for election in elections:
-        state=get_state_name_by_state_id(election['state_id'])
+        state=states[election['state_id']]
         election["state_name"]=state["state_name"]
         election["_start_time"]=format_datetime(election["start_time"])
         election["_end_time"]=election["end_time"]
@@ -107,13 +108,17 @@ def get_constituencies_for_election(election_id):
         {"election_id": election_id}
     )
 
+    constituencies = fetch_map(
+        "constituencies",
+        "id",
+        [m["constituency_id"] for m in mappings],
+        columns=["id", "constituency_name"]
+    )
+
     results = []
 
     for m in mappings:
-        constituency = fetch_one(
-            "constituencies",
-            {"id": m["constituency_id"]}
-        )
+        constituency = constituencies.get(m["constituency_id"])
 
         if not constituency:
             continue
@@ -193,22 +198,15 @@ def get_active_elections_by_constituency(constituency_id: str):
 
     election_ids = [row["election_id"] for row in mappings]
 
-    # 2️⃣ Fetch ACTIVE elections only
-    elections = []
-
-    for eid in election_ids:
-        election = fetch_one(
-            ELECTIONS_TABLE,
-            {
-                "id": eid,
-                "status": "ACTIVE"
-            }
-        )
-
-        if election:
-            elections.append(election)
+    # 2️⃣ Fetch ACTIVE elections only (one IN query)
+    active = fetch_map(
+        ELECTIONS_TABLE,
+        "id",
+        election_ids,
+        filters={"status": "ACTIVE"}
+    )
 
-    return elections
+    return [active[eid] for eid in dict.fromkeys(election_ids) if eid in active]
 
 def get_current_active_election():
     now = utc_now().isoformat()
@@ -254,12 +252,17 @@ def get_district_name_by_district_id(district_id):
     return fetch_one("districts", {"id": district_id})
 
 def update_election(election_id, update_data):
-    return update_record(
+    from services.ballot_cache import invalidate_ballots
+
+    rows = update_record(
         "elections",
         {"id": election_id},
         update_data,
         use_admin=True
     )
+    # Cached ballots carry the end time
+    invalidate_ballots(election_id)
+    return rows
 
 
 
@@ -314,10 +317,12 @@ def get_elections_by_constituency(constituency_id: str):
     # Step 2: extract election IDs
     election_ids = [m["election_id"] for m in mappings]
 
-    # Step 3: fetch elections one by one
+    # Step 3: fetch elections in bulk
+    found = fetch_map(ELECTIONS_TABLE, "id", election_ids)
+
     elections = []
     for eid in election_ids:
-        e = fetch_one(ELECTIONS_TABLE, {"id": eid})
+        e = found.get(eid)
         if e:
             # format times same as your state function
             e["start_time"] = format_datetime(e["start_time"])
@@ -346,10 +351,11 @@ def get_approved_elections():
     """
 
     elections = fetch_all(ELECTIONS_TABLE, {"status": "Approved"})
+    states = fetch_map("states", "id", [e["state_id"] for e in elections])
 
     for election in elections:
         # Add state name (like in get_all_elections)
-        state = get_state_name_by_state_id(election["state_id"])
+        state = states.get(election["state_id"])
         if state:
             election["state_name"] = state["state_name"]
 
@@ -386,46 +392,15 @@ def get_candidates_by_constituency_and_election(constituency_id: str, election_i
     Returns candidates for a given constituency + election
     with resolved display name
     """
+    from models.candidate import get_candidate_view
 
-    # Step 1: Fetch candidates matching both filters
-    candidates = fetch_all(
-        "candidates",
+    return [
         {
-            "constituency_id": constituency_id,
-            "election_id": election_id
-        }
-    )
-
-    if not candidates:
-        return []
-
-    result = []
-
-    for c in candidates:
-        # Step 2: map user_id → voter_id
-        voter_map = fetch_one(
-            "voter_user_map",
-            {"user_id": c["user_id"]}
-        )
-
-        if not voter_map:
-            continue
-
-        # Step 3: voter_id → voter full name
-        voter = fetch_one(
-            "voters",
-            {"id": voter_map["voter_id"]}
-        )
-
-        if not voter:
-            continue
-
-        result.append({
             "id": c["id"],
-            "candidate_name": voter["full_name"],
+            "candidate_name": c["candidate_name"],
             "party_name": c["party_name"],
             "created_at": format_datetime(c["created_at"]),
             "election_id": c["election_id"]
-        })
-
-    return result
\ No newline at end of file
+        }
+        for c in get_candidate_view(election_id, constituency_id)
+    ]
\ No newline at end of file
@@ -0,0 +1,60 @@
+# models/election_snapshot.py
+#
+# Materialized per-election results + dashboard aggregates.
+#
+# LIVE  → refreshed from vote-count deltas while polling / counting
+# FINAL → written at closure (with the assigned winners), never changes
+
+from supabase_db.db import fetch_one, insert_record, update_record, upsert_record
+from utils.helpers import utc_now
+
+TABLE = "election_snapshots"
+
+LIVE = "LIVE"
+FINAL = "FINAL"
+
+
+def get_snapshot(election_id):
+    return fetch_one(TABLE, {"election_id": election_id}, use_admin=True)
+
+
+def save_snapshot(election_id, status: str, results: dict, dashboard: dict, replace_final: bool = False):
+    """
+    results   → {constituency_id: {"candidates": [...], "winner": id, "runner_up": id}}
+    dashboard → get_election_dashboard payload
+
+    Only closure passes replace_final. Any other write (a LIVE refresh
+    in flight here or in another process) only replaces a LIVE row;
+    if the row is already FINAL, it is returned unchanged.
+    """
+    payload = {
+        "election_id": election_id,
+        "status": status,
+        "results": results,
+        "dashboard": dashboard,
+        "updated_at": utc_now().isoformat()
+    }
+
+    if replace_final:
+        upsert_record(TABLE, payload, conflict_columns=["election_id"], use_admin=True)
+        return payload
+
+    if update_record(TABLE, {"election_id": election_id, "status": LIVE}, payload, use_admin=True):
+        return payload
+
+    # No LIVE row: either none yet, or closure already wrote FINAL
+    existing = get_snapshot(election_id)
+    if existing is None:
+        try:
+            insert_record(TABLE, payload, use_admin=True)
+            return payload
+        except Exception:
+            # Created concurrently
+            existing = get_snapshot(election_id)
+
+    if existing and existing["status"] == FINAL:
+        return existing
+
+    # Created as LIVE concurrently: ours is as fresh, write it over
+    update_record(TABLE, {"election_id": election_id, "status": LIVE}, payload, use_admin=True)
+    return payload
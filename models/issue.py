@@ -1,4 +1,4 @@
-from supabase_db.db import fetch_one, fetch_all, insert_record, update_record
+from supabase_db.db import fetch_one, fetch_all, fetch_many, insert_record, update_record
 from utils.helpers import generate_uuid, utc_now
 
 
@@ -208,32 +208,57 @@ def get_comment_author_alias(user_id: str):
     return alias["random_username"] if alias else "Anonymous"
 
 
-def get_issues_for_elected_rep_term(constituency_id: str):
+def get_issues_for_elected_rep_term(constituency_id: str, issues: list = None):
     """
     Get issues created during the elected representative's term
-    along with the rep's user_id.
+    along with the rep's user_id. Pass `issues` (the constituency's
+    issues) if already loaded.
     """
 
     from models.representative import get_representatives_by_constituency
-    from datetime import datetime
 
     reps = get_representatives_by_constituency(constituency_id)
 
-    elected_rep = next(
+    elected_rep = get_term_rep(reps)
+
+    if not elected_rep or not elected_rep.get("term_start"):
+        return []
+
+    rep_user_id = elected_rep.get("user_id")
+
+    if issues is None:
+        issues = fetch_all(ISSUES_TABLE, {"constituency_id": constituency_id})
+
+    filtered_issues = []
+
+    for issue in issues:
+        if is_issue_in_rep_term(issue, elected_rep):
+            issue_copy = issue.copy()
+            issue_copy["rep_user_id"] = rep_user_id
+            filtered_issues.append(issue_copy)
+
+    return filtered_issues
+
+
+def get_term_rep(reps: list):
+    """
+    The ELECTED_REP row whose term issues are scored.
+    """
+    return next(
         (r for r in reps if r.get("type") == "ELECTED_REP"),
         None
     )
 
-    if not elected_rep:
-        return []
 
-    rep_user_id = elected_rep.get("user_id")
+def is_issue_in_rep_term(issue: dict, rep: dict) -> bool:
+    from datetime import datetime
 
-    term_start = elected_rep.get("term_start")
-    term_end = elected_rep.get("term_end")
+    term_start = rep.get("term_start")
+    term_end = rep.get("term_end")
+    created_at = issue.get("created_at")
 
-    if not term_start:
-        return []
+    if not term_start or not created_at:
+        return False
 
     term_start_date = datetime.fromisoformat(str(term_start))
     term_end_date = (
@@ -242,34 +267,17 @@ def get_issues_for_elected_rep_term(constituency_id: str):
         else None
     )
 
-    issues = fetch_all(ISSUES_TABLE, {"constituency_id": constituency_id})
-
-    filtered_issues = []
-
-    for issue in issues:
-        created_at = issue.get("created_at")
-        if not created_at:
-            continue
-
-        created_date = datetime.fromisoformat(
-            created_at.replace("Z", "+00:00")
-        )
+    created_date = datetime.fromisoformat(
+        created_at.replace("Z", "+00:00")
+    )
 
-        if created_date >= term_start_date:
-            if term_end_date:
-                if created_date <= term_end_date:
-                    issue_copy = issue.copy()
-                    issue_copy["rep_user_id"] = rep_user_id
-                    filtered_issues.append(issue_copy)
-            else:
-                issue_copy = issue.copy()
-                issue_copy["rep_user_id"] = rep_user_id
-                filtered_issues.append(issue_copy)
+    if created_date < term_start_date:
+        return False
 
-    return filtered_issues
+    return not term_end_date or created_date <= term_end_date
 
 
-def get_issues_with_acceptance_time(constituency_id: str):
+def get_issues_with_acceptance_time(constituency_id: str, issues: list = None):
     """
     Returns issues during elected rep term
     along with:
@@ -277,16 +285,18 @@ def get_issues_with_acceptance_time(constituency_id: str):
       - accepted_at (timestamp when status first changed to 'Accepted')
     """
 
-    from models.issue_timeline import get_issue_timeline
+    from models.issue_timeline import get_issue_timelines
     from datetime import datetime
 
-    issues = get_issues_for_elected_rep_term(constituency_id)
+    issues = get_issues_for_elected_rep_term(constituency_id, issues)
+
+    timelines = get_issue_timelines([i.get("id") for i in issues])
 
     enriched_issues = []
 
     for issue in issues:
         issue_id = issue.get("id")
-        timeline = get_issue_timeline(issue_id)
+        timeline = timelines.get(issue_id, [])
 
         accepted_at = None
 
@@ -327,8 +337,5 @@ def get_issue_comments_by_constituency(constituency_id):
     # -----------------------------------
     # Get all comments for those issues
     # -----------------------------------
-    comments = []
-    for issue_id in issue_ids:
-        issue_comments = fetch_all("issue_comments", {"issue_id": issue_id}) or []
-        comments.extend(issue_comments)
+    comments = fetch_many("issue_comments", "issue_id", issue_ids)
     return comments
\ No newline at end of file
@@ -1,4 +1,4 @@
-from supabase_db.db import insert_record, fetch_all
+from supabase_db.db import insert_record, fetch_all, fetch_grouped
 from utils.helpers import generate_uuid, utc_now
 
 TABLE = "issue_status_timeline"
@@ -27,3 +27,10 @@ def add_issue_status(
 
 def get_issue_timeline(issue_id):
     return fetch_all(TABLE, {"issue_id": issue_id})
+
+
+def get_issue_timelines(issue_ids):
+    """
+    Timelines for many issues in one query: {issue_id: [entries]}
+    """
+    return fetch_grouped(TABLE, "issue_id", issue_ids)
@@ -0,0 +1,175 @@
+# models/job_run.py
+#
+# Durable state for the batch jobs in jobs/.
+#
+# job_runs       one row per (name, run_key): a logical run such as
+#                "daily-score" for one date. Re-running the same key
+#                resumes it. Its id is what triggers hand out for
+#                polling (any process can read it). status (QUEUED
+#                until a runner picks it up), attempt, total / done / failed,
+#                summary (json), error, started_at / finished_at.
+# job_run_items  checkpoint per (run_id, item): status, attempts,
+#                elapsed_ms, error, finished_at.
+# job_locks      one lease per job name (token, run_id, locked_until)
+#                so two cron invocations never run a job together.
+#                Expired leases can be taken over.
+
+from datetime import datetime, timedelta
+
+from supabase_db.db import fetch_one, fetch_all, iter_all, count_rows, insert_record, update_record, upsert_record
+from utils.helpers import generate_uuid, utc_now
+
+RUNS_TABLE = "job_runs"
+ITEMS_TABLE = "job_run_items"
+LOCKS_TABLE = "job_locks"
+
+QUEUED = "QUEUED"
+RUNNING = "RUNNING"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+
+ITEM_DONE = "DONE"
+ITEM_FAILED = "FAILED"
+
+
+# -----------------------------
+# Runs
+# -----------------------------
+
+def get_job_run(name: str, run_key: str):
+    return fetch_one(RUNS_TABLE, {"name": name, "run_key": run_key}, use_admin=True)
+
+
+def get_job_run_by_id(run_id):
+    return fetch_one(RUNS_TABLE, {"id": run_id}, use_admin=True)
+
+
+def get_recent_job_runs(name: str, limit: int = 20):
+    return fetch_all(
+        RUNS_TABLE,
+        {"name": name},
+        use_admin=True,
+        order_by=("started_at", "desc"),
+        limit=limit
+    )
+
+
+def create_job_run(name: str, run_key: str, total: int, status: str = RUNNING):
+    rows = insert_record(
+        RUNS_TABLE,
+        {
+            "id": generate_uuid(),
+            "name": name,
+            "run_key": run_key,
+            "status": status,
+            "attempt": 1,
+            "total": total,
+            "done": 0,
+            "failed": 0,
+            "started_at": utc_now().isoformat()
+        },
+        use_admin=True
+    )
+    return rows[0] if rows else None
+
+
+def update_job_run(run_id, payload: dict):
+    return update_record(RUNS_TABLE, {"id": run_id}, payload, use_admin=True)
+
+
+# -----------------------------
+# Item Checkpoints
+# -----------------------------
+
+def get_job_run_items(run_id, status: str = None):
+    """
+    Paged on item, so runs larger than PostgREST's row cap come back whole.
+    """
+    filters = {"run_id": run_id}
+    if status:
+        filters["status"] = status
+    return list(iter_all(ITEMS_TABLE, filters, use_admin=True, key="item"))
+
+
+def count_job_run_items(run_id, status: str) -> int:
+    return count_rows(ITEMS_TABLE, {"run_id": run_id, "status": status}, use_admin=True)
+
+
+def save_job_run_item(run_id, item: str, status: str, attempts: int, elapsed_ms: float, error: str = None):
+    return upsert_record(
+        ITEMS_TABLE,
+        {
+            "run_id": run_id,
+            "item": item,
+            "status": status,
+            "attempts": attempts,
+            "elapsed_ms": round(elapsed_ms, 1),
+            "error": error,
+            "finished_at": utc_now().isoformat()
+        },
+        conflict_columns=["run_id", "item"],
+        use_admin=True
+    )
+
+
+# -----------------------------
+# Locks
+# -----------------------------
+
+def _expired(lock: dict) -> bool:
+    until = lock.get("locked_until")
+    return not until or datetime.fromisoformat(until) <= utc_now()
+
+
+def acquire_job_lock(name: str, token: str, ttl_seconds: float, run_id=None) -> bool:
+    """
+    Takes the lease for `name` if it is free or expired.
+    Returns False if another holder has a live lease.
+    """
+    locked_until = (utc_now() + timedelta(seconds=ttl_seconds)).isoformat()
+    lock = fetch_one(LOCKS_TABLE, {"name": name}, use_admin=True)
+
+    if not lock:
+        try:
+            insert_record(
+                LOCKS_TABLE,
+                {"name": name, "token": token, "run_id": run_id, "locked_until": locked_until},
+                use_admin=True
+            )
+            return True
+        except Exception:
+            # Lost the race to create the row
+            return False
+
+    if not _expired(lock):
+        return False
+
+    # Take over only if nobody else did since we read it
+    rows = update_record(
+        LOCKS_TABLE,
+        {"name": name, "token": lock["token"]},
+        {"token": token, "run_id": run_id, "locked_until": locked_until},
+        use_admin=True
+    )
+    return bool(rows)
+
+
+def refresh_job_lock(name: str, token: str, ttl_seconds: float, run_id=None) -> bool:
+    """
+    Extends our lease. False means it expired and was taken over.
+    """
+    payload = {"locked_until": (utc_now() + timedelta(seconds=ttl_seconds)).isoformat()}
+    if run_id:
+        payload["run_id"] = run_id
+
+    rows = update_record(LOCKS_TABLE, {"name": name, "token": token}, payload, use_admin=True)
+    return bool(rows)
+
+
+def release_job_lock(name: str, token: str):
+    return update_record(
+        LOCKS_TABLE,
+        {"name": name, "token": token},
+        {"locked_until": None},
+        use_admin=True
+    )
@@ -0,0 +1,43 @@
+# models/merkle_accumulator.py
+
+from supabase_db.db import fetch_one, insert_record, update_record
+from utils.helpers import generate_uuid, utc_now
+
+TABLE = "merkle_accumulators"
+
+
+def get_accumulator_state(election_id):
+    return fetch_one(TABLE, {"election_id": election_id}, use_admin=True)
+
+
+def create_accumulator_state(election_id, state: dict):
+    return insert_record(
+        TABLE,
+        {
+            "id": generate_uuid(),
+            "election_id": election_id,
+            **state,
+            "updated_at": utc_now().isoformat()
+        },
+        use_admin=True
+    )
+
+
+def compare_and_set_accumulator_state(election_id, expected_count: int, state: dict) -> bool:
+    """
+    Writes the new frontier only if nobody appended since we read it
+    (leaf_count still equals expected_count). Returns False on conflict.
+    """
+    rows = update_record(
+        TABLE,
+        {
+            "election_id": election_id,
+            "leaf_count": expected_count
+        },
+        {
+            **state,
+            "updated_at": utc_now().isoformat()
+        },
+        use_admin=True
+    )
+    return bool(rows)
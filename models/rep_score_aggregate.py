@@ -0,0 +1,69 @@
+# models/rep_score_aggregate.py
+#
+# Running scoring aggregates, one row per representative user.
+# state → see services/rep_score_aggregates.py; version is bumped on
+# every write so concurrent updaters can compare-and-set.
+
+from supabase_db.db import fetch_one, fetch_many, insert_record, update_record
+from utils.helpers import utc_now
+
+TABLE = "rep_score_aggregates"
+
+
+def get_rep_aggregates(rep_user_id):
+    return fetch_one(TABLE, {"rep_user_id": rep_user_id}, use_admin=True)
+
+
+def get_rep_aggregates_for_users(rep_user_ids):
+    return fetch_many(TABLE, "rep_user_id", rep_user_ids, use_admin=True)
+
+
+def create_rep_aggregates(rep_user_id, state: dict) -> bool:
+    """
+    First row for a rep (version 1). Returns False if another writer
+    created it first.
+    """
+    now = utc_now().isoformat()
+
+    try:
+        insert_record(
+            TABLE,
+            {
+                "rep_user_id": rep_user_id,
+                "state": state,
+                "version": 1,
+                "rebuilt_at": now,
+                "updated_at": now
+            },
+            use_admin=True
+        )
+        return True
+    except Exception:
+        return False
+
+
+def compare_and_set_rep_aggregates(rep_user_id, expected_version: int, state: dict, rebuilt: bool = False) -> bool:
+    """
+    Writes the new state only if nobody wrote since we read it
+    (version still equals expected_version). Returns False on conflict.
+    rebuilt=True also stamps rebuilt_at (state built from history).
+    """
+    now = utc_now().isoformat()
+    payload = {
+        "state": state,
+        "version": expected_version + 1,
+        "updated_at": now
+    }
+    if rebuilt:
+        payload["rebuilt_at"] = now
+
+    rows = update_record(
+        TABLE,
+        {
+            "rep_user_id": rep_user_id,
+            "version": expected_version
+        },
+        payload,
+        use_admin=True
+    )
+    return bool(rows)
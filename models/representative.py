@@ -1,4 +1,4 @@
-from supabase_db.db import fetch_one, fetch_all, insert_record, update_record
+from supabase_db.db import fetch_one, fetch_all, fetch_many, fetch_map, insert_record, update_record, upsert_record
 from utils.helpers import generate_uuid, utc_now
 from datetime import date
 
@@ -145,8 +145,15 @@ def get_active_representatives(today: date):
     return active
 
 
-def get_all_representatives():
-    return fetch_all(REPRESENTATIVES_TABLE)
+def get_all_representatives(columns="*"):
+    return fetch_all(REPRESENTATIVES_TABLE, columns=columns)
+
+
+def get_representatives_by_users(user_ids, columns="*"):
+    """
+    All representative rows (any term, any status) for these users.
+    """
+    return fetch_many(REPRESENTATIVES_TABLE, "user_id", user_ids, columns=columns)
 
 
 def get_rep_by_election_id_constituency_id(election_id: str, constituency_id: str):
@@ -178,20 +185,28 @@ def get_representatives_with_photo(constituency_id: str):
     if not reps:
         return []
 
+    # Step 1 — voter ids mapped to these users (bulk)
+    voter_maps = fetch_map(
+        VOTER_MAP_TABLE,
+        "user_id",
+        [rep.get("user_id") for rep in reps]
+    )
+
+    # Step 2 — photos for those voters (bulk)
+    voters = fetch_map(
+        VOTERS_TABLE,
+        "id",
+        [m.get("voter_id") for m in voter_maps.values()],
+        columns=["id", "photo_url"]
+    )
+
     for rep in reps:
         photo_url = None
 
-        # Step 1 — find voter id mapped to this user
-        voter_map = fetch_one(
-            VOTER_MAP_TABLE,
-            {"user_id": rep.get("user_id")}
-        )
+        voter_map = voter_maps.get(rep.get("user_id"))
 
         if voter_map:
-            voter = fetch_one(
-                VOTERS_TABLE,
-                {"id": voter_map.get("voter_id")}
-            )
+            voter = voters.get(voter_map.get("voter_id"))
 
             if voter:
                 photo_url = voter.get("photo_url")
@@ -236,6 +251,11 @@ def insert_daily_rep_score(
     impact_score: float,
     score_date: date
 ):
+    """
+    One row per (rep_user_id, election_id, score_date): a concurrent
+    or repeated write for the same day leaves the first one in place,
+    so duplicates never skew the rolling averages.
+    """
     payload = {
         "id": generate_uuid(),
         "rep_user_id": rep_user_id,
@@ -251,7 +271,13 @@ def insert_daily_rep_score(
         "created_at": utc_now().isoformat()
     }
 
-    return insert_record(REP_DAILY_SCORE_TABLE, payload, use_admin=True)
+    return upsert_record(
+        REP_DAILY_SCORE_TABLE,
+        payload,
+        conflict_columns=["rep_user_id", "election_id", "score_date"],
+        use_admin=True,
+        ignore_duplicates=True
+    )
 
 def get_daily_rep_score(
     rep_user_id: str,
@@ -0,0 +1,24 @@
+from supabase_db.db import fetch_one, upsert_record
+from utils.helpers import utc_now
+
+TABLE = "sync_watermarks"
+
+
+def get_watermark(name: str):
+    """
+    Returns the last synced ISO timestamp for a sync job, or None.
+    """
+    row = fetch_one(TABLE, {"name": name}, use_admin=True)
+    return row["synced_at"] if row else None
+
+
+def set_watermark(name: str, synced_at: str = None):
+    return upsert_record(
+        TABLE,
+        {
+            "name": name,
+            "synced_at": synced_at or utc_now().isoformat()
+        },
+        conflict_columns=["name"],
+        use_admin=True
+    )
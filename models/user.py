@@ -1,4 +1,4 @@
-from supabase_db.db import fetch_one, fetch_all, insert_record, update_record
+from supabase_db.db import fetch_one, fetch_all, fetch_map, insert_record, update_record, update_many
 from utils.helpers import generate_uuid, utc_now
 from utils.helpers import normalize_role
 from models.voter import get_voter_user_mapping_by_user
@@ -97,6 +97,30 @@ def update_user_role(user_id: str, role: str):
         use_admin=True
     )
 
+
+def get_users_by_ids(user_ids) -> dict:
+    """
+    Bulk lookup: {user_id: user}
+    """
+    return fetch_map(USERS_TABLE, "id", user_ids, use_admin=True)
+
+
+def bulk_update_user_roles(roles: dict) -> int:
+    """
+    Writes new roles for many users: one update per role, touching
+    only the role column (other fields changed meanwhile are kept).
+
+    roles → {user_id: new_role}
+    """
+    by_role = {}
+    for user_id, role in roles.items():
+        by_role.setdefault(role, []).append(user_id)
+
+    return sum(
+        update_many(USERS_TABLE, "id", user_ids, {"role": role}, use_admin=True)
+        for role, user_ids in by_role.items()
+    )
+
 def get_display_name_by_user_id(user_id: str) -> str:
     """
     Returns display name based on role:
@@ -1,6 +1,6 @@
 # models/vote_merkle_proof.py
 
-from supabase_db.db import insert_record, fetch_one
+from supabase_db.db import insert_record, insert_records, fetch_one
 from utils.helpers import generate_uuid, utc_now
 
 TABLE = "vote_merkle_proofs"
@@ -20,6 +20,38 @@ def store_merkle_proof(election_id, receipt_hash, proof):
     )
 
 
+PROOF_INSERT_CHUNK_SIZE = 1000
+
+
+def store_merkle_proofs(election_id, proofs, chunk_size=PROOF_INSERT_CHUNK_SIZE):
+    """
+    Bulk version of store_merkle_proof.
+    proofs → iterable of (receipt_hash, proof); consumed chunk by chunk
+    so the full payload list is never held in memory.
+    """
+    created_at = utc_now().isoformat()
+    stored = 0
+    batch = []
+
+    for receipt_hash, proof in proofs:
+        batch.append({
+            "id": generate_uuid(),
+            "election_id": election_id,
+            "receipt_hash": receipt_hash,
+            "proof": proof,
+            "created_at": created_at
+        })
+
+        if len(batch) >= chunk_size:
+            stored += insert_records(TABLE, batch, use_admin=True, chunk_size=chunk_size)
+            batch = []
+
+    if batch:
+        stored += insert_records(TABLE, batch, use_admin=True, chunk_size=chunk_size)
+
+    return stored
+
+
 def get_merkle_proof(election_id, receipt_hash):
     return fetch_one(
         TABLE,
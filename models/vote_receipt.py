@@ -1,17 +1,26 @@
-from supabase_db.db import fetch_all, insert_record
+from supabase_db.db import fetch_all, iter_all, count_rows, insert_record, update_record
 
 VOTE_RECEIPTS_TABLE = "vote_receipts"
 
-def store_receipt(election_id: str, receipt_hash: str):
+def store_receipt(election_id: str, receipt_hash: str, leaf_index: int = None):
     insert_record(
         "vote_receipts",
         {
             "election_id": election_id,
             "receipt_hash": receipt_hash,
+            "leaf_index": leaf_index,
         }
     )
 
 
+def set_receipt_leaf_index(election_id: str, receipt_hash: str, leaf_index: int):
+    return update_record(
+        VOTE_RECEIPTS_TABLE,
+        {"election_id": election_id, "receipt_hash": receipt_hash},
+        {"leaf_index": leaf_index}
+    )
+
+
 def get_all_receipts_for_election(election_id: str):
     rows = fetch_all(
         table="vote_receipts",
@@ -24,10 +33,33 @@ def get_all_receipts_for_election(election_id: str):
 
 def get_receipts_by_election(election_id):
     """
-    Returns all vote receipts for an election.
+    Returns all vote receipts for an election in Merkle leaf order.
     Used for Merkle tree construction.
+
+    Streamed in pages (a single read stops at PostgREST's row cap)
+    keyed on receipt_hash, then sorted by leaf_index; receipts the
+    accumulator never indexed go last. Raises if the rows read do not
+    match the receipt count, so a root is never built over a partial
+    set.
     """
-    return fetch_all(
+    filters = {"election_id": election_id}
+
+    receipts = list(iter_all(
         VOTE_RECEIPTS_TABLE,
-        {"election_id": election_id}
-    )
\ No newline at end of file
+        filters,
+        columns=["receipt_hash", "leaf_index"],
+        key="receipt_hash"
+    ))
+
+    expected = count_rows(VOTE_RECEIPTS_TABLE, filters)
+    if len(receipts) != expected:
+        raise RuntimeError(
+            f"Read {len(receipts)} of {expected} receipts for election {election_id}"
+        )
+
+    receipts.sort(key=lambda r: (
+        r["leaf_index"] is None,
+        r["leaf_index"] if r["leaf_index"] is not None else 0,
+        r["receipt_hash"]
+    ))
+    return receipts
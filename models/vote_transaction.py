@@ -0,0 +1,86 @@
+# models/vote_transaction.py
+#
+# Durable queue of castVote transactions.
+#
+# PENDING   → waiting to be signed and sent
+# SENT      → signed and broadcast (or re-broadcasting), waiting for a
+#             receipt (tx_hash, raw_tx, nonce, gas_price set)
+# CONFIRMED → mined successfully
+# REVERTED  → mined but castVote reverted; the vote is not counted
+#             until an admin requeues it (blocks election closure)
+# FAILED    → given up on by an admin
+
+from supabase_db.db import fetch_one, fetch_all, count_rows, insert_record, update_record
+from utils.helpers import generate_uuid, utc_now
+
+TABLE = "vote_transactions"
+
+PENDING = "PENDING"
+SENT = "SENT"
+CONFIRMED = "CONFIRMED"
+REVERTED = "REVERTED"
+FAILED = "FAILED"
+
+
+def enqueue_vote_transaction(election_id, candidate_id, receipt_hash):
+    now = utc_now().isoformat()
+
+    rows = insert_record(
+        TABLE,
+        {
+            "id": generate_uuid(),
+            "election_id": election_id,
+            "candidate_id": candidate_id,
+            "receipt_hash": receipt_hash,
+            "status": PENDING,
+            "attempts": 0,
+            "created_at": now,
+            "updated_at": now
+        },
+        use_admin=True
+    )
+    if not rows:
+        # The vote must not be reported as cast if it was never queued
+        raise RuntimeError(f"Vote transaction for receipt {receipt_hash} was not queued")
+    return rows[0]
+
+
+def get_vote_transaction(tx_id):
+    return fetch_one(TABLE, {"id": tx_id}, use_admin=True)
+
+
+def get_vote_transactions_by_status(status: str, limit: int = None):
+    return fetch_all(
+        TABLE,
+        {"status": status},
+        use_admin=True,
+        order_by=("created_at", "asc"),
+        limit=limit
+    )
+
+
+def count_vote_transactions(election_id, status: str) -> int:
+    return count_rows(TABLE, {"election_id": election_id, "status": status}, use_admin=True)
+
+
+def claim_vote_transaction(tx_id, expected_status: str, payload: dict) -> bool:
+    """
+    Moves a row out of expected_status only if no other worker did
+    first. Returns False if the row was already taken.
+    """
+    rows = update_record(
+        TABLE,
+        {"id": tx_id, "status": expected_status},
+        {**payload, "updated_at": utc_now().isoformat()},
+        use_admin=True
+    )
+    return bool(rows)
+
+
+def update_vote_transaction(tx_id, payload: dict):
+    return update_record(
+        TABLE,
+        {"id": tx_id},
+        {**payload, "updated_at": utc_now().isoformat()},
+        use_admin=True
+    )
@@ -1,6 +1,11 @@
-from supabase_db.db import fetch_one, fetch_all, insert_record, update_record
+from itertools import islice
+
+from config import Config
+from supabase_db.db import fetch_one, fetch_map, iter_all, insert_record, update_record
 from utils.helpers import generate_uuid,generate_voter_id, utc_now
 from supabase_db.client import supabase_public, supabase_admin
+from services.voter_index import invalidate_voter_index, INDEX_COLUMNS
+from models.candidate import invalidate_candidate_views
 
 
 # -----------------------------
@@ -44,7 +49,9 @@ def create_voter(
         "created_at": utc_now().isoformat(),
         "updated_at": utc_now().isoformat()
     }
-    return insert_record(VOTERS_TABLE, payload, use_admin=True)
+    voter = insert_record(VOTERS_TABLE, payload, use_admin=True)
+    invalidate_voter_index()
+    return voter
 
 
 def get_voter_by_id(voter_id: str):
@@ -55,48 +62,53 @@ def get_voter_by_voter_id_number(voter_id_number: str):
     return fetch_one(VOTERS_TABLE, {"voter_id_number": voter_id_number})
 
 
-def get_voters_by_constituency(constituency_id: str):
+def iter_voters_by_constituency(constituency_id: str):
     """
-    Returns voters with booth_name and booth_number instead of booth_id
+    Streams voters with booth_name and booth_number instead of booth_id,
+    resolving booths once per page.
     """
 
-    voters = fetch_all(
-        VOTERS_TABLE,
-        {"constituency_id": constituency_id}
-    )
+    voters = iter_all(VOTERS_TABLE, {"constituency_id": constituency_id})
 
-    if not voters:
-        return []
+    while True:
+        page = list(islice(voters, Config.SUPABASE_PAGE_SIZE))
 
-    result = []
+        if not page:
+            return
 
-    for voter in voters:
-        booth = None
+        booths = fetch_map(
+            "booths",
+            "id",
+            [v.get("booth_id") for v in page],
+            columns=["id", "booth_name", "booth_number"]
+        )
 
-        if voter.get("booth_id"):
-            booth = fetch_one(
-                "booths",
-                {"id": voter["booth_id"]}
-            )
+        for voter in page:
+            booth = booths.get(voter.get("booth_id"))
 
-        result.append({
-            "id": voter["id"],
-            "voter_id_number": voter["voter_id_number"],
-            "full_name": voter["full_name"],
-            "guardian_name": voter["guardian_name"],
-            "gender": voter["gender"],
-            "date_of_birth": voter["date_of_birth"],
-            "address": voter["address"],
-            "booth_name": booth["booth_name"] if booth else None,
-            "booth_number": booth["booth_number"] if booth else None,
-            "is_active": voter["is_active"]
-        })
+            yield {
+                "id": voter["id"],
+                "voter_id_number": voter["voter_id_number"],
+                "full_name": voter["full_name"],
+                "guardian_name": voter["guardian_name"],
+                "gender": voter["gender"],
+                "date_of_birth": voter["date_of_birth"],
+                "address": voter["address"],
+                "booth_name": booth["booth_name"] if booth else None,
+                "booth_number": booth["booth_number"] if booth else None,
+                "is_active": voter["is_active"]
+            }
 
-    return result
+
+def get_voters_by_constituency(constituency_id: str):
+    """
+    Returns voters with booth_name and booth_number instead of booth_id
+    """
+    return list(iter_voters_by_constituency(constituency_id))
 
 
 def update_voter_details(voter_id, data,use_admin=True):
-    return (
+    response = (
         supabase_public
         .table("voters")
         .update(data)
@@ -104,16 +116,28 @@ def update_voter_details(voter_id, data,use_admin=True):
         .execute()
     )
 
+    # Verification updates don't touch indexed columns
+    if set(data) & set(INDEX_COLUMNS):
+        invalidate_voter_index()
+
+    # Candidate lists show voter names
+    if "full_name" in data:
+        invalidate_candidate_views()
+
+    return response
+
 
 
 
 def deactivate_voter(voter_id: str):
-    return update_record(
+    response = update_record(
         VOTERS_TABLE,
         {"id": voter_id},
         {"is_active": False, "updated_at": utc_now().isoformat()},
         use_admin=True
     )
+    invalidate_voter_index()
+    return response
 
 
 # -----------------------------
@@ -127,7 +151,9 @@ def map_voter_to_user(voter_id: str, user_id: str):
         "user_id": user_id,
         "created_at": utc_now().isoformat()
     }
-    return insert_record(VOTER_USER_MAP_TABLE, payload, use_admin=True)
+    mapping = insert_record(VOTER_USER_MAP_TABLE, payload, use_admin=True)
+    invalidate_candidate_views()
+    return mapping
 
 
 def get_voter_user_mapping_by_user(user_id: str):
@@ -138,7 +164,7 @@ def get_voter_user_mapping_by_voter(voter_id: str):
     return fetch_one(VOTER_USER_MAP_TABLE, {"voter_id": voter_id})
 
 def get_voters_by_booth(booth_id: str):
-    return fetch_all(VOTERS_TABLE, {"booth_id": booth_id})
+    return list(iter_all(VOTERS_TABLE, {"booth_id": booth_id}))
 
 from supabase_db.db import fetch_one
 
@@ -0,0 +1,72 @@
+# models/voter_import.py
+#
+# Bulk voter-roll import jobs (one uploaded CSV/Parquet file each).
+#
+# QUEUED    → uploaded, waiting for a worker
+# RUNNING   → chunks being validated and upserted
+# COMPLETED → every row processed
+# FAILED    → stopped on an error; resumable from rows_processed
+
+from supabase_db.db import fetch_one, fetch_all, insert_record, update_record
+from utils.helpers import generate_uuid, utc_now
+
+TABLE = "voter_import_jobs"
+
+QUEUED = "QUEUED"
+RUNNING = "RUNNING"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+
+
+def create_import_job(
+    file_path: str,
+    file_format: str,
+    state_id: str,
+    district_id: str,
+    constituency_id: str,
+    booth_id: str = None,
+    created_by: str = None
+):
+    now = utc_now().isoformat()
+
+    rows = insert_record(
+        TABLE,
+        {
+            "id": generate_uuid(),
+            "file_path": file_path,
+            "file_format": file_format,
+            "state_id": state_id,
+            "district_id": district_id,
+            "constituency_id": constituency_id,
+            "booth_id": booth_id,
+            "created_by": created_by,
+            "status": QUEUED,
+            "rows_processed": 0,
+            "rows_imported": 0,
+            "rows_rejected": 0,
+            "errors": [],
+            "error_message": None,
+            "created_at": now,
+            "updated_at": now
+        },
+        use_admin=True
+    )
+    return rows[0] if rows else None
+
+
+def get_import_job(job_id):
+    return fetch_one(TABLE, {"id": job_id}, use_admin=True)
+
+
+def get_import_jobs_by_constituency(constituency_id):
+    return fetch_all(
+        TABLE,
+        {"constituency_id": constituency_id},
+        use_admin=True,
+        order_by=("created_at", "desc")
+    )
+
+
+def update_import_job(job_id, payload: dict):
+    payload = {**payload, "updated_at": utc_now().isoformat()}
+    return update_record(TABLE, {"id": job_id}, payload, use_admin=True)
@@ -1,8 +1,14 @@
-from flask import Blueprint, render_template, session
+import csv
+import io
+
+from flask import Blueprint, render_template, session, jsonify, Response, stream_with_context
 from utils.decorators import login_required, role_required
-from models.audit import get_audit_logs
+from models.audit import get_audit_logs, iter_audit_logs
 from models.user import get_users_by_role
 from models.ledger import get_all_ledger_entries
+from supabase_db.cache import get_cache_stats
+from services.web3_registry import get_rpc_metrics
+from services.election_snapshot_service import get_snapshot_build_stats
 
 bp = Blueprint("admin", __name__, url_prefix="/admin")
 
@@ -30,6 +36,37 @@ def audit_logs():
     return render_template("admin/audit_logs.html", logs=logs)
 
 
+AUDIT_CSV_FIELDS = ["user_id", "action", "entity_type", "entity_id", "timestamp"]
+
+
+@bp.route("/audit-logs/export")
+@login_required
+@role_required("CEC")
+def export_audit_logs():
+    """
+    Full audit trail as CSV, streamed page by page so the export
+    never holds the whole table in memory.
+    """
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=AUDIT_CSV_FIELDS, extrasaction="ignore")
+
+        writer.writeheader()
+        for log in iter_audit_logs():
+            writer.writerow(log)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+        yield buffer.getvalue()
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/csv",
+        headers={"Content-Disposition": "attachment; filename=audit-logs.csv"}
+    )
+
+
 # -----------------------------
 # System Users Overview
 # -----------------------------
@@ -62,3 +99,36 @@ def users():
 def ledger():
     entries = get_all_ledger_entries()
     return render_template("admin/ledger.html", entries=entries)
+
+
+# -----------------------------
+# Reference Cache Stats
+# -----------------------------
+
+@bp.route("/cache-stats")
+@login_required
+@role_required("CEC")
+def cache_stats():
+    return jsonify(get_cache_stats())
+
+
+# -----------------------------
+# Web3 RPC Stats
+# -----------------------------
+
+@bp.route("/rpc-stats")
+@login_required
+@role_required("CEC")
+def rpc_stats():
+    return jsonify(get_rpc_metrics())
+
+
+# -----------------------------
+# Election Snapshot Build Stats
+# -----------------------------
+
+@bp.route("/snapshot-build-stats")
+@login_required
+@role_required("CEC")
+def snapshot_build_stats():
+    return jsonify(get_snapshot_build_stats())
@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash, Response, stream_with_context
 from utils.decorators import login_required, role_required
 from utils.helpers import format_datetime,utc_now
 from services.election_service import (
@@ -8,6 +8,7 @@ from services.election_service import (
 from models.election import get_all_elections, get_elections_by_state,get_district_name_by_district_id,get_approved_elections, get_approved_elections_by_state,get_candidates_by_constituency_and_election
 from models.voter import (
     get_voters_by_constituency,
+    iter_voters_by_constituency,
     get_voters_by_booth,
     create_voter,
     update_voter_details,
@@ -24,6 +25,7 @@ from services.election_activation_service import activate_election_if_needed
 from models.election import get_state_name_by_state_id,get_election_by_id, get_elections_by_constituency
 from models.booth import get_booths_by_constituency
 from supabase_db.client import supabase_admin, supabase_public
+import json
 import uuid
 
 
@@ -362,6 +364,66 @@ def add_voter():
     return redirect(url_for("election_commission.dashboard"))
 
 
+# =====================================================
+# ERO / BLO – BULK VOTER IMPORT
+# =====================================================
+
+@bp.route("/ero/voters/import", methods=["POST"])
+@login_required
+@role_required("ERO", "BLO")
+def import_voters():
+    from services.voter_import_service import start_voter_import
+
+    try:
+        job = start_voter_import(
+            request.files.get("roll_file"),
+            state_id=session.get("state_id"),
+            district_id=session.get("district_id"),
+            constituency_id=session.get("constituency_id"),
+            # BLO imports are pinned to their own booth
+            booth_id=session.get("booth_id") if session.get("role") == "BLO" else None,
+            created_by=session.get("user_id")
+        )
+        flash(f"Voter import started (job {job['id']})", "success")
+
+    except Exception as e:
+        flash(str(e), "error")
+
+    return redirect(url_for("election_commission.dashboard"))
+
+
+@bp.route("/ero/voters/import/<job_id>")
+@login_required
+@role_required("ERO", "BLO")
+def import_voters_status(job_id):
+    from models.voter_import import get_import_job
+    from services.voter_import_service import import_progress
+
+    job = get_import_job(job_id)
+    if not job or job["constituency_id"] != session.get("constituency_id"):
+        return {"error": "Import job not found"}, 404
+
+    return import_progress(job)
+
+
+@bp.route("/ero/voters/import/<job_id>/resume", methods=["POST"])
+@login_required
+@role_required("ERO", "BLO")
+def resume_import_voters(job_id):
+    from models.voter_import import get_import_job
+    from services.voter_import_service import resume_voter_import, is_resumable
+
+    job = get_import_job(job_id)
+    if not job or job["constituency_id"] != session.get("constituency_id"):
+        return {"error": "Import job not found"}, 404
+
+    if not is_resumable(job):
+        return {"error": f"Import is {job['status']}"}, 409
+
+    resume_voter_import(job_id)
+    return {"status": "RESUMED", "rows_processed": job["rows_processed"]}
+
+
 @bp.route("/ero/voters/update/<voter_id>", methods=["POST"])
 @login_required
 @role_required("ERO")
@@ -406,7 +468,7 @@ def remove_voter(voter_id):
 @login_required
 @role_required("ERO")
 def reset_verification():
-    voters = get_voters_by_constituency(session.get("constituency_id"))
+    voters = iter_voters_by_constituency(session.get("constituency_id"))
 
     for v in voters:
         update_voter_details(v["id"], {
@@ -540,7 +602,7 @@ def public_roll_page():
 def api_public_roll(election_id, constituency_id):
 
     from models.election import get_election_by_id
-    from models.voter import get_voters_by_constituency
+    from models.voter import iter_voters_by_constituency
 
     election = get_election_by_id(election_id)
 
@@ -550,13 +612,21 @@ def api_public_roll(election_id, constituency_id):
     if not election.get("draft_roll_released") and not election.get("final_roll_released"):
         return {"error": "Electoral roll not released yet"}
 
-    voters = get_voters_by_constituency(constituency_id)
+    # Same JSON document as before, written out as voters are paged in
+    # so large rolls never sit in memory
+    def generate():
+        yield (
+            '{"election_name": ' + json.dumps(election["election_name"])
+            + ', "is_final": ' + json.dumps(election.get("final_roll_released"))
+            + ', "voters": ['
+        )
+
+        for i, voter in enumerate(iter_voters_by_constituency(constituency_id)):
+            yield ("," if i else "") + json.dumps(voter, default=str)
+
+        yield "]}"
 
-    return {
-        "election_name": election["election_name"],
-        "is_final": election.get("final_roll_released"),
-        "voters": voters
-    }
+    return Response(stream_with_context(generate()), mimetype="application/json")
 
 @bp.route("/api/constituencies/<election_id>")
 def api_constituencies_for_election(election_id):
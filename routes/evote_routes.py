@@ -3,7 +3,7 @@
 from flask import Blueprint, render_template, jsonify, session, request, redirect, flash,url_for
 from utils.decorators import login_required, role_required
 from services.voting_service import submit_vote
-from models.candidate import  get_candidates_by_election_and_constituency
+from services.ballot_cache import get_ballot, voting_closed
 from services.booth_session_service import (
     get_active_voter,
     register_voting_terminal,
@@ -100,22 +100,21 @@ def vote():
         flash("No election set for this booth", "error")
         return redirect(url_for("presiding_officer.dashboard"))
 
-    if election_id:
-        election = get_election_by_id(election_id)
-        now = datetime.utcnow().isoformat()
-
-        if now > election["end_time"]:
-        # Election over → deactivate
-            session.pop("active_election_id", None)
-            session.pop("active_election_name", None)
+    # End time is read fresh; only the candidate list is cached
+    if voting_closed(election_id):
+    # Election over → deactivate
+        session.pop("active_election_id", None)
+        session.pop("active_election_name", None)
 
-            flash("Election has ended", "error")
-            return redirect(url_for("presiding_officer.dashboard"))
+        flash("Election has ended", "error")
+        return redirect(url_for("presiding_officer.dashboard"))
 
     # 🚫 No active voter → lock screen
     if not voter_id:
         return redirect("/evote/waiting")
 
+    ballot = get_ballot(election_id, constituency_id)
+
     # -----------------------------
     # POST → Vote submission
     # -----------------------------
@@ -128,8 +127,9 @@ def vote():
                 vote_payload=request.form.get("candidate_id")
             )
 
-            # End voter session AFTER vote
-            end_voter_session(booth_id)
+            # End voter session AFTER vote (only this voter's, in case
+            # the PO has already authorized the next one)
+            end_voter_session(booth_id, voter_id)
 
             # ✅ Show success page instead of redirect
             receipt_hash = result.get("receipt_hash")
@@ -150,7 +150,7 @@ def vote():
             )
 
             # End voter session AFTER sending receipt
-            end_voter_session(booth_id)
+            end_voter_session(booth_id, voter_id)
 
             flash("Vote recorded and receipt sent", "success")
 
@@ -163,8 +163,4 @@ def vote():
     # -----------------------------
     # GET → Show voting UI
     # -----------------------------
-    candidates = get_candidates_by_election_and_constituency(
-        election_id=election_id,
-        constituency_id=constituency_id
-    )
-    return render_template("evote/vote.html", candidates=candidates)
+    return render_template("evote/vote.html", ballot_html=ballot.html)
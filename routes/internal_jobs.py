@@ -1,5 +1,12 @@
-from flask import Blueprint, request, abort, jsonify
-from jobs.run_daily_jobs import run_all_daily_scores
+from flask import Blueprint, request, abort, jsonify, url_for
+from jobs.background_jobs import (
+    start_background_job,
+    get_background_job,
+    get_background_job_for_run,
+    list_background_jobs
+)
+from jobs.durable_job import prepare_job_run
+from jobs.run_daily_jobs import run_all_daily_scores, daily_score_run_key
 #import os
 
 
@@ -7,14 +14,175 @@ bp = Blueprint("internal_jobs", __name__, url_prefix="/internal")
 
 #SECRET = os.getenv("CRON_SECRET")
 
+
+def _start_durable_job(name, run_key, target):
+    """
+    Starts target(job, run_key=...) in the background. The response
+    points at the durable job_runs row, which every worker can serve;
+    job_id only has live progress on the worker that runs it.
+    """
+    run = prepare_job_run(name, run_key)
+
+    job, started = start_background_job(
+        name,
+        lambda job: target(job, run_key=run_key),
+        run_id=run["id"]
+    )
+
+    return jsonify({
+        "status": "started" if started else "already_running",
+        "run_id": job.run_id,
+        "job_id": job.id,
+        "poll": url_for("internal_jobs.job_run_status", name=name, run_id=job.run_id),
+        "progress": url_for("internal_jobs.job_status", job_id=job.id)
+    }), 202
+
+
 @bp.route("/run-daily-score", methods=["GET"])
 def run_daily_score():
     '''
     if request.headers.get("X-CRON-KEY") != SECRET:
         abort(403)
     '''
-    run_all_daily_scores()
-    return jsonify({"status": "ok"})
+    return _start_durable_job("daily-score", daily_score_run_key(), run_all_daily_scores)
+
+
+# -----------------------------
+# Background Job Status
+# -----------------------------
+
+@bp.route("/jobs", methods=["GET"])
+def jobs():
+    return jsonify({"jobs": list_background_jobs()})
+
+
+@bp.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    """
+    Live progress (done / failed / ETA) and result of a job started
+    by one of the triggers above. Only the worker running it knows
+    it; poll /job-runs/<name>/<run_id> otherwise.
+    """
+    job = get_background_job(job_id)
+    if not job:
+        abort(404)
+    return jsonify(job)
+
+
+@bp.route("/job-runs/<name>", methods=["GET"])
+def job_runs(name):
+    """
+    Durable run history of a job (e.g. daily-score), newest first.
+    ?run_id= adds that run's item checkpoints and timings.
+    """
+    from models.job_run import get_recent_job_runs, get_job_run_items
+
+    response = {"runs": get_recent_job_runs(name)}
+
+    run_id = request.args.get("run_id")
+    if run_id:
+        response["items"] = get_job_run_items(run_id)
+
+    return jsonify(response)
+
+
+@bp.route("/job-runs/<name>/<run_id>", methods=["GET"])
+def job_run_status(name, run_id):
+    """
+    Durable status of one run, served by any worker: the job_runs row,
+    items checkpointed so far, and live progress if the run is
+    executing in this process.
+    """
+    from models.job_run import ITEM_DONE, ITEM_FAILED, get_job_run_by_id, count_job_run_items
+
+    run = get_job_run_by_id(run_id)
+    if not run or run["name"] != name:
+        abort(404)
+
+    return jsonify({
+        "run": run,
+        "checkpoints": {
+            "done": count_job_run_items(run_id, ITEM_DONE),
+            "failed": count_job_run_items(run_id, ITEM_FAILED)
+        },
+        "live": get_background_job_for_run(run_id)
+    })
+
+
+# -----------------------------
+# Scheduled Role Sync
+# -----------------------------
+
+@bp.route("/run-role-sync", methods=["GET"])
+def run_role_sync():
+    """
+    Syncs user roles for reps whose terms started, ended or were
+    terminated since the last run. ?full=1 re-checks every rep user.
+    """
+
+    from services.representative_role_sync_service import sync_user_roles_from_representatives
+
+    summary = sync_user_roles_from_representatives(
+        full=request.args.get("full") == "1"
+    )
+    return jsonify({"status": "ok", **summary})
+
+# -----------------------------
+# VoteCast Event Index
+# -----------------------------
+
+@bp.route("/run-vote-index-sync", methods=["GET"])
+def run_vote_index_sync():
+    """
+    Ingests VoteCast logs from the last indexed block to the chain head.
+    """
+
+    from services.vote_event_indexer import sync_vote_events
+
+    summary = sync_vote_events()
+    return jsonify({"status": "ok", **summary})
+
+# -----------------------------
+# Vote Transaction Queue
+# -----------------------------
+
+@bp.route("/run-vote-tx-worker", methods=["GET"])
+def run_vote_tx_worker():
+    """
+    One worker pass: send queued votes, confirm or replace sent ones.
+    """
+
+    from services.vote_tx_queue import process_vote_transactions
+
+    summary = process_vote_transactions()
+    return jsonify({"status": "ok", **summary})
+
+
+@bp.route("/vote-tx/<tx_id>/requeue", methods=["GET"])
+def requeue_vote_tx(tx_id):
+    """
+    Re-sends a REVERTED vote transaction.
+    """
+
+    from services.vote_tx_queue import requeue_vote_transaction
+
+    if not requeue_vote_transaction(tx_id):
+        abort(409)
+    return jsonify({"status": "requeued", "id": tx_id})
+
+
+@bp.route("/vote-tx/<tx_id>/discard", methods=["GET"])
+def discard_vote_tx(tx_id):
+    """
+    Gives up on a REVERTED vote transaction (?reason=...), so its
+    election can close.
+    """
+
+    from services.vote_tx_queue import discard_vote_transaction
+
+    if not discard_vote_transaction(tx_id, request.args.get("reason", "")):
+        abort(409)
+    return jsonify({"status": "discarded", "id": tx_id})
 
 # -----------------------------
 # Manual Cron Trigger (AI Brief Job)
@@ -27,11 +195,6 @@ def run_brief_job():
     Should be protected and not public.
     """
 
-    from jobs.constituency_brief_job import run_constituency_brief_job
-
-    try:
-        run_constituency_brief_job()
-        return {"message": "Brief job executed successfully"}, 200
+    from jobs.constituency_brief_job import run_constituency_brief_job, brief_run_key
 
-    except Exception as e:
-        return {"error": str(e)}, 500
\ No newline at end of file
+    return _start_durable_job("constituency-brief", brief_run_key(), run_constituency_brief_job)
\ No newline at end of file
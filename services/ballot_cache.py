@@ -0,0 +1,120 @@
+# services/ballot_cache.py
+#
+# Booth ballots, built once per (election, constituency).
+#
+# The candidate list on the e-vote screen is fixed for the whole polling
+# day, so it is rendered to HTML once (at activation, or on the first
+# booth request in a process) and served from memory. A ballot is
+# rebuilt when candidate views are invalidated (nomination / status
+# changes) or after BALLOT_CACHE_TTL seconds.
+#
+# Only the candidates and their HTML are cached. The voting window is
+# checked per request (voting_closed) against the election row, which
+# the reference cache keeps for at most 30 s, so an end time changed
+# on another worker is seen promptly.
+
+import threading
+import time
+
+from datetime import datetime, timezone
+
+from flask import render_template, has_app_context
+from markupsafe import Markup
+
+from config import Config
+from models.candidate import (
+    get_candidate_view,
+    get_candidates_by_election_and_constituency,
+    candidate_views_generation
+)
+from models.election import get_election_by_id, parse_dt
+
+_ballots = {}
+_ballots_lock = threading.Lock()
+
+
+def _utc_naive(value):
+    dt = parse_dt(value)
+    if dt is not None and dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+class Ballot:
+    def __init__(self, election_id, constituency_id: str, candidates: list):
+        self.election_id = election_id
+        self.constituency_id = constituency_id
+        self.candidates = candidates
+        self.generation = candidate_views_generation()
+        self.expires_at = time.monotonic() + Config.BALLOT_CACHE_TTL
+        self._html = None
+
+    def is_current(self) -> bool:
+        return (
+            self.generation == candidate_views_generation()
+            and time.monotonic() < self.expires_at
+        )
+
+    @property
+    def html(self) -> Markup:
+        # Rendered lazily when built outside a request / app context
+        if self._html is None:
+            self._html = Markup(
+                render_template("evote/_ballot.html", candidates=self.candidates)
+            )
+        return self._html
+
+
+def _store(ballot: Ballot) -> Ballot:
+    if has_app_context():
+        ballot.html
+
+    with _ballots_lock:
+        _ballots[(ballot.election_id, ballot.constituency_id)] = ballot
+    return ballot
+
+
+def voting_closed(election_id) -> bool:
+    """
+    True once the election's end time has passed. Read per request,
+    never from a cached ballot.
+    """
+    end_time = _utc_naive(get_election_by_id(election_id)["end_time"])    # naive UTC
+    return end_time is not None and datetime.utcnow() > end_time
+
+
+def get_ballot(election_id, constituency_id) -> Ballot:
+    ballot = _ballots.get((election_id, constituency_id))
+    if ballot is not None and ballot.is_current():
+        return ballot
+
+    candidates = get_candidates_by_election_and_constituency(
+        election_id=election_id,
+        constituency_id=constituency_id
+    )
+    return _store(Ballot(election_id, constituency_id, candidates))
+
+
+def precompute_ballots(election):
+    """
+    Builds every constituency's ballot for an election from one
+    candidate view. Called on activation.
+    """
+    by_constituency = {}
+    for c in get_candidate_view(election["id"]):
+        by_constituency.setdefault(c["constituency_id"], []).append({
+            "id": c["id"],
+            "candidate_name": c["candidate_name"],
+            "party_name": c["party_name"]
+        })
+
+    for constituency_id, candidates in by_constituency.items():
+        _store(Ballot(election["id"], constituency_id, candidates))
+
+    print(f"🗳️ Ballots ready for {election['election_name']}: {len(by_constituency)} constituencies")
+
+
+def invalidate_ballots(election_id=None):
+    with _ballots_lock:
+        for key in [k for k in _ballots if election_id is None or k[0] == election_id]:
+            del _ballots[key]
@@ -5,11 +5,30 @@ from datetime import datetime
 from config import Config
 from utils.crypto import uuid_to_uint256
 from web3 import Web3
+from services.web3_registry import (
+    get_web3,
+    get_voting_contract,
+    get_booth_account,
+    get_gas_price,
+    ensure_connected
+)
+from services.nonce_manager import get_nonce_manager
 
 
 BLOCKCHAIN_MODE = Config.BLOCKCHAIN_MODE
 
 
+# -------------------------------------------------
+# CONTRACT HANDLE
+# -------------------------------------------------
+
+def get_contract():
+    """
+    Shared VotingContract handle (see services/web3_registry).
+    """
+    return get_voting_contract()
+
+
 # -------------------------------------------------
 # STUB IMPLEMENTATION
 # -------------------------------------------------
@@ -39,39 +58,15 @@ def cast_vote_on_chain(election_id, candidate_id, receipt_hash):
 # REAL WEB3 IMPLEMENTATION
 # -------------------------------------------------
 
-def _web3_cast_vote(election_id, candidate_id, receipt_hash):
-    from web3 import Web3
-    import json
-
-    WEB3_PROVIDER = Config.WEB3_PROVIDER_URL
-    CONTRACT_ADDRESS = Config.VOTING_CONTRACT_ADDRESS
-    BOOTH_PRIVATE_KEY = Config.BOOTH_PRIVATE_KEY
-
-    if not all([WEB3_PROVIDER, CONTRACT_ADDRESS, BOOTH_PRIVATE_KEY]):
-        raise Exception("Blockchain configuration missing")
-
-    w3 = Web3(Web3.HTTPProvider(WEB3_PROVIDER))
-
-    if not w3.is_connected():
-        raise Exception("Blockchain node not reachable")
-
-    # Load ABI
-    with open("blockchain/abi/VotingContractABI.json") as f:
-        abi = json.load(f)
-
-    contract = w3.eth.contract(
-        address=Web3.to_checksum_address(CONTRACT_ADDRESS),
-        abi=abi
-    )
+def build_signed_vote_transaction(election_id, candidate_id, nonce: int, gas_price: int):
+    """
+    Signed castVote transaction for the booth key. Signing is local,
+    so the tx hash is known before anything is broadcast.
+    """
+    w3 = get_web3()
+    contract = get_voting_contract()
+    account = get_booth_account()
 
-    account = w3.eth.account.from_key(BOOTH_PRIVATE_KEY)
-    nonce = w3.eth.get_transaction_count(account.address)
-    # 🔑 Convert receipt hash → bytes32
-    receipt_bytes32 = Web3.to_bytes(hexstr=receipt_hash)
-    assert len(receipt_bytes32) == 32
-    print('after:',receipt_bytes32)
-    print('election_id:', election_id)
-    print('candidate_id:', candidate_id)
     txn = contract.functions.castVote(
         uuid_to_uint256(election_id),
         uuid_to_uint256(candidate_id)
@@ -80,113 +75,101 @@ def _web3_cast_vote(election_id, candidate_id, receipt_hash):
         "nonce": nonce,
         "chainId": 11155111,   # Sepolia
         "gas": 300000,
-        "gasPrice": w3.eth.gas_price
+        "gasPrice": gas_price
     })
 
-    signed_txn = w3.eth.account.sign_transaction(txn, BOOTH_PRIVATE_KEY)
-    tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+    return w3.eth.account.sign_transaction(txn, Config.BOOTH_PRIVATE_KEY)
 
-    return tx_hash.hex()
-    
-def count_votes_from_blockchain(election_id: str) -> dict:
-    """
-    Counts votes for an election by reading VoteCast events
-    from the blockchain.
-    """
 
-    from web3 import Web3
-    import json
-    from utils.crypto import uuid_to_uint256
-
-    WEB3_PROVIDER = Config.WEB3_PROVIDER_URL
+def _web3_cast_vote(election_id, candidate_id, receipt_hash):
     CONTRACT_ADDRESS = Config.VOTING_CONTRACT_ADDRESS
+    BOOTH_PRIVATE_KEY = Config.BOOTH_PRIVATE_KEY
 
-    w3 = Web3(Web3.HTTPProvider(WEB3_PROVIDER))
+    if not all([Config.WEB3_PROVIDER_URL, CONTRACT_ADDRESS, BOOTH_PRIVATE_KEY]):
+        raise Exception("Blockchain configuration missing")
+
+    # Pooled provider; node health is probed on a timer, not per vote
+    ensure_connected()
 
-    with open("blockchain/abi/VotingContractABI.json") as f:
-        abi = json.load(f)
+    # 🔑 Receipt hash must be a bytes32
+    assert len(Web3.to_bytes(hexstr=receipt_hash)) == 32
 
-    contract = w3.eth.contract(
-        address=Web3.to_checksum_address(CONTRACT_ADDRESS),
-        abi=abi
+    # Nonce from the local allocator, gas price from a short-lived cache
+    nonces = get_nonce_manager(get_booth_account().address)
+    signed_txn = build_signed_vote_transaction(
+        election_id,
+        candidate_id,
+        nonce=nonces.allocate(),
+        gas_price=get_gas_price()
     )
 
-    election_uint = uuid_to_uint256(election_id)
+    try:
+        tx_hash = get_web3().eth.send_raw_transaction(signed_txn.raw_transaction)
+    except Exception:
+        nonces.resync()
+        raise
+
+    return tx_hash.hex()
 
-    # 🔍 Fetch all VoteCast events for this election
-    events = contract.events.VoteCast.get_logs(
-        fromBlock=0,
-        toBlock="latest",
-        argument_filters={
-            "electionId": election_uint
-        }
-    )
 
-    results = {}
+def enqueue_vote_on_chain(election_id, candidate_id, receipt_hash):
+    """
+    Durably queues the castVote transaction; the vote tx worker signs,
+    sends and confirms it (services/vote_tx_queue). Returns the queue row.
+    """
+    from models.vote_transaction import enqueue_vote_transaction
 
-    for event in events:
-        candidate_id = event["args"]["candidateId"]
+    return enqueue_vote_transaction(election_id, candidate_id, receipt_hash)
 
-        results[candidate_id] = results.get(candidate_id, 0) + 1
+def count_votes_from_blockchain(election_id: str) -> dict:
+    """
+    Counts votes for an election from the indexed VoteCast events.
+    """
+    from services.vote_event_indexer import get_vote_counts
 
-    return results
+    return {
+        int(candidate_id): votes
+        for candidate_id, votes in get_vote_counts(election_id).items()
+    }
 
 def publish_merkle_root_on_chain(election_id, merkle_root):
     if BLOCKCHAIN_MODE == "STUB":
         print(f"[STUB] Published Merkle Root for election {election_id}: {merkle_root}")
         return True
 
-    from web3 import Web3
-    import json
-
-    w3 = Web3(Web3.HTTPProvider(Config.WEB3_PROVIDER_URL))
+    ensure_connected()
 
-    with open("blockchain/abi/VotingContractABI.json") as f:
-        abi = json.load(f)
+    w3 = get_web3()
+    contract = get_voting_contract()
+    account = get_booth_account()
 
-    contract = w3.eth.contract(
-        address=Web3.to_checksum_address(Config.VOTING_CONTRACT_ADDRESS),
-        abi=abi
-    )
-
-    account = w3.eth.account.from_key(Config.BOOTH_PRIVATE_KEY)
-    nonce = w3.eth.get_transaction_count(account.address)
+    # Same key as the votes: the nonce must come from the shared allocator
+    nonces = get_nonce_manager(account.address)
 
     txn = contract.functions.publishMerkleRoot(
         uuid_to_uint256(election_id),
         Web3.to_bytes(hexstr=merkle_root)
     ).build_transaction({
         "from": account.address,
-        "nonce": nonce,
+        "nonce": nonces.allocate(),
         "chainId": 11155111,
         "gas": 200000,
-        "gasPrice": w3.eth.gas_price
+        "gasPrice": get_gas_price()
     })
 
     signed = w3.eth.account.sign_transaction(txn, Config.BOOTH_PRIVATE_KEY)
-    tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+
+    try:
+        tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+    except Exception:
+        nonces.resync()
+        raise
 
     return tx_hash.hex()
 
 def _web3_verify_receipt(election_id, receipt_hash, proof):
-    from web3 import Web3
-    import json
-    from config import Config
-    from utils.crypto import uuid_to_uint256
-
-    w3 = Web3(Web3.HTTPProvider(Config.WEB3_PROVIDER_URL))
-
-    if not w3.is_connected():
-        raise Exception("Blockchain node not reachable")
-
-    # Load ABI
-    with open("blockchain/abi/VotingContractABI.json") as f:
-        abi = json.load(f)
-
-    contract = w3.eth.contract(
-        address=Web3.to_checksum_address(Config.VOTING_CONTRACT_ADDRESS),
-        abi=abi
-    )
+    ensure_connected()
+    contract = get_voting_contract()
 
     # Convert values to correct Solidity types
     election_uint = uuid_to_uint256(election_id)
@@ -1,7 +1,219 @@
+# services/booth_session_service.py
+#
+# Booth voter sessions and the one-terminal-per-booth lock.
+#
+# State lives in a pluggable store (BOOTH_SESSION_BACKEND):
+# - "memory": in-process dicts; single worker / development
+# - "sqlite": SQLite WAL file shared by every worker on the host, so a
+#   PO authorization in one worker is seen by the terminal polling
+#   another
+#
+# Both stores take the terminal lock with an atomic compare-and-set and
+# expire entries: a terminal holds its lock as a lease renewed by its
+# booth-status polls (VOTING_TERMINAL_TTL), an authorized voter session
+# lapses after BOOTH_VOTER_SESSION_TTL.
+
+import os
+import sqlite3
+import threading
+import time
+
 from datetime import datetime
 
-BOOTH_SESSIONS = {}
-ACTIVE_VOTING_TERMINAL = {}  # booth_id -> terminal_session_id
+from config import Config
+
+
+# =====================================================
+# Stores
+# =====================================================
+
+class MemoryBoothStore:
+    """
+    Process-local store; state is lost on restart and not shared
+    between workers.
+    """
+
+    def __init__(self):
+        self._terminals = {}   # booth_id -> (session_id, expires_at)
+        self._sessions = {}    # booth_id -> session dict
+        self._lock = threading.Lock()
+
+    def acquire_terminal(self, booth_id, session_id, ttl: float) -> bool:
+        now = time.time()
+
+        with self._lock:
+            holder = self._terminals.get(booth_id)
+            if holder and holder[0] != session_id and holder[1] >= now:
+                return False
+
+            self._terminals[booth_id] = (session_id, now + ttl)
+            return True
+
+    def renew_terminal(self, booth_id, session_id, ttl: float) -> bool:
+        now = time.time()
+
+        with self._lock:
+            holder = self._terminals.get(booth_id)
+            if not holder or holder[0] != session_id or holder[1] < now:
+                return False
+
+            self._terminals[booth_id] = (session_id, now + ttl)
+            return True
+
+    def release_terminal(self, booth_id):
+        with self._lock:
+            self._terminals.pop(booth_id, None)
+
+    def start_session(self, booth_id, voter_id, ttl: float):
+        with self._lock:
+            self._sessions[booth_id] = {
+                "voter_id": voter_id,
+                "status": "ACTIVE",
+                "started_at": datetime.utcnow().isoformat(),
+                "expires_at": time.time() + ttl
+            }
+
+    def get_session(self, booth_id):
+        session = self._sessions.get(booth_id)
+        if session and session["expires_at"] >= time.time():
+            return session
+        return None
+
+    def end_session(self, booth_id, voter_id=None) -> bool:
+        with self._lock:
+            session = self._sessions.get(booth_id)
+            if not session or (voter_id and session["voter_id"] != voter_id):
+                return False
+
+            del self._sessions[booth_id]
+            return True
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS voting_terminals (
+    booth_id    TEXT PRIMARY KEY,
+    session_id  TEXT NOT NULL,
+    expires_at  REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS voter_sessions (
+    booth_id    TEXT PRIMARY KEY,
+    voter_id    TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    started_at  TEXT NOT NULL,
+    expires_at  REAL NOT NULL
+);
+"""
+
+
+class SQLiteBoothStore:
+    """
+    Shared store in a SQLite WAL file. Every lock change is a single
+    conditional statement, so concurrent workers cannot both win.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def _write(self, sql: str, params: tuple) -> int:
+        with self._lock, self._conn:
+            return self._conn.execute(sql, params).rowcount
+
+    def acquire_terminal(self, booth_id, session_id, ttl: float) -> bool:
+        now = time.time()
+
+        # Upsert only wins if the booth is free, expired or already ours
+        return self._write(
+            "INSERT INTO voting_terminals (booth_id, session_id, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (booth_id) DO UPDATE SET "
+            "session_id = excluded.session_id, expires_at = excluded.expires_at "
+            "WHERE voting_terminals.expires_at < ? "
+            "OR voting_terminals.session_id = excluded.session_id",
+            (booth_id, session_id, now + ttl, now)
+        ) == 1
+
+    def renew_terminal(self, booth_id, session_id, ttl: float) -> bool:
+        now = time.time()
+
+        return self._write(
+            "UPDATE voting_terminals SET expires_at = ? "
+            "WHERE booth_id = ? AND session_id = ? AND expires_at >= ?",
+            (now + ttl, booth_id, session_id, now)
+        ) == 1
+
+    def release_terminal(self, booth_id):
+        self._write("DELETE FROM voting_terminals WHERE booth_id = ?", (booth_id,))
+
+    def start_session(self, booth_id, voter_id, ttl: float):
+        now = time.time()
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM voter_sessions WHERE expires_at < ?", (now,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO voter_sessions "
+                "(booth_id, voter_id, status, started_at, expires_at) "
+                "VALUES (?, ?, 'ACTIVE', ?, ?)",
+                (booth_id, voter_id, datetime.utcnow().isoformat(), now + ttl)
+            )
+
+    def get_session(self, booth_id):
+        row = self._conn.execute(
+            "SELECT voter_id, status, started_at, expires_at FROM voter_sessions "
+            "WHERE booth_id = ? AND expires_at >= ?",
+            (booth_id, time.time())
+        ).fetchone()
+
+        if not row:
+            return None
+
+        voter_id, status, started_at, expires_at = row
+        return {
+            "voter_id": voter_id,
+            "status": status,
+            "started_at": started_at,
+            "expires_at": expires_at
+        }
+
+    def end_session(self, booth_id, voter_id=None) -> bool:
+        if voter_id:
+            return self._write(
+                "DELETE FROM voter_sessions WHERE booth_id = ? AND voter_id = ?",
+                (booth_id, voter_id)
+            ) == 1
+
+        return self._write("DELETE FROM voter_sessions WHERE booth_id = ?", (booth_id,)) == 1
+
+
+BACKENDS = {
+    "memory": MemoryBoothStore,
+    "sqlite": lambda: SQLiteBoothStore(Config.BOOTH_SESSION_DB_PATH),
+}
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_booth_store():
+    """
+    Opened lazily, so each forked worker gets its own connection.
+    """
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            backend = BACKENDS.get(Config.BOOTH_SESSION_BACKEND)
+            if backend is None:
+                raise ValueError(f"Unknown BOOTH_SESSION_BACKEND: {Config.BOOTH_SESSION_BACKEND}")
+            _store = backend()
+
+    return _store
 
 
 # =====================================================
@@ -13,11 +225,9 @@ def register_voting_terminal(booth_id, session_id):
     Register a voting terminal for a booth.
     Only ONE terminal allowed per booth.
     """
-    if booth_id in ACTIVE_VOTING_TERMINAL:
-        return False
-
-    ACTIVE_VOTING_TERMINAL[booth_id] = session_id
-    return True
+    return get_booth_store().acquire_terminal(
+        booth_id, session_id, Config.VOTING_TERMINAL_TTL
+    )
 
 
 def unregister_voting_terminal(booth_id):
@@ -25,14 +235,17 @@ def unregister_voting_terminal(booth_id):
     FORCE release terminal lock for a booth.
     Presiding Officer authority.
     """
-    ACTIVE_VOTING_TERMINAL.pop(booth_id, None)
+    get_booth_store().release_terminal(booth_id)
 
 
 def is_valid_voting_terminal(booth_id, session_id):
     """
     Check if this browser session is the active voting terminal.
+    A successful check renews the terminal's lease.
     """
-    return ACTIVE_VOTING_TERMINAL.get(booth_id) == session_id
+    return get_booth_store().renew_terminal(
+        booth_id, session_id, Config.VOTING_TERMINAL_TTL
+    )
 
 
 # =====================================================
@@ -40,19 +253,19 @@ def is_valid_voting_terminal(booth_id, session_id):
 # =====================================================
 
 def start_voter_session(booth_id, voter_id):
-    BOOTH_SESSIONS[booth_id] = {
-        "voter_id": voter_id,
-        "status": "ACTIVE",
-        "started_at": datetime.utcnow().isoformat()
-    }
+    get_booth_store().start_session(booth_id, voter_id, Config.BOOTH_VOTER_SESSION_TTL)
 
 
-def end_voter_session(booth_id):
-    BOOTH_SESSIONS.pop(booth_id, None)
+def end_voter_session(booth_id, voter_id=None):
+    """
+    Ends the booth's session; with voter_id, only if that voter still
+    holds it.
+    """
+    return get_booth_store().end_session(booth_id, voter_id)
 
 
 def get_active_voter(booth_id):
-    session = BOOTH_SESSIONS.get(booth_id)
+    session = get_booth_store().get_session(booth_id)
     if session and session["status"] == "ACTIVE":
         return session["voter_id"]
     return None
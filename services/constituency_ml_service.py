@@ -1,4 +1,8 @@
-from ml.inference.ml_predictor import predict_constituency_status
+from ml.inference.ml_predictor import (
+    features_to_matrix,
+    predict_constituency_status,
+    predict_constituency_statuses
+)
 
 def snapshot_to_features(snapshot: dict):
     return {
@@ -13,26 +17,43 @@ def snapshot_to_features(snapshot: dict):
     }
 
 
+TEMPLATES = {
+    "stable":
+        "• Civic activity remains stable with no major governance disruptions detected.",
+
+    "public_pressure":
+        "• Citizens are actively raising concerns, indicating strong public engagement in governance.",
+
+    "governance_risk":
+        "• Warning signals detected — rising dissatisfaction or unresolved issues may require intervention.",
+
+    "high_engagement":
+        "• High civic participation observed with strong community support and issue resolutions.",
+
+    "election_activity":
+        "• Electoral processes are active in this constituency. Governance attention is currently election-focused."
+}
+
+
+def summary_for_status(label) -> str:
+    return f"""Today in the constituency:{TEMPLATES.get(label, "• Civic activity is being monitored.")}"""
+
+
 def generate_constituency_summary(snapshot: dict) -> str:
     features = snapshot_to_features(snapshot)
 
     label = predict_constituency_status(features)
 
-    templates = {
-        "stable":
-            "• Civic activity remains stable with no major governance disruptions detected.",
-
-        "public_pressure":
-            "• Citizens are actively raising concerns, indicating strong public engagement in governance.",
+    return summary_for_status(label)
 
-        "governance_risk":
-            "• Warning signals detected — rising dissatisfaction or unresolved issues may require intervention.",
 
-        "high_engagement":
-            "• High civic participation observed with strong community support and issue resolutions.",
-
-        "election_activity":
-            "• Electoral processes are active in this constituency. Governance attention is currently election-focused."
-    }
+def generate_constituency_summaries(snapshots: dict) -> dict:
+    """
+    {constituency_id: snapshot} → {constituency_id: summary} with one
+    batched model call for all of them.
+    """
+    ids = list(snapshots)
+    features = features_to_matrix([snapshot_to_features(snapshots[cid]) for cid in ids])
+    labels = predict_constituency_statuses(features)
 
-    return f"""Today in the constituency:{templates.get(label, "• Civic activity is being monitored.")}"""
\ No newline at end of file
+    return {cid: summary_for_status(label) for cid, label in zip(ids, labels)}
@@ -1,6 +1,7 @@
 from datetime import datetime
 from utils.helpers import utc_now
 from models.election import mark_election_active, parse_dt
+from services.ballot_cache import precompute_ballots
 
 def activate_election_if_needed(election):
     """
@@ -21,4 +22,7 @@ def activate_election_if_needed(election):
         return
 
     mark_election_active(election["id"])
-    print(f"Election activated: {election['election_name']}")
\ No newline at end of file
+    print(f"Election activated: {election['election_name']}")
+
+    # Booth screens serve these for the whole polling day
+    precompute_ballots(election)
\ No newline at end of file
@@ -1,20 +1,28 @@
 from datetime import timedelta
 from models.representative import create_representative
-from services.result_service import get_constituency_results
+from services.result_service import tally_election_results, pick_winner_and_runner_up
+from services.election_snapshot_service import write_final_snapshot
 from models.election import get_constituencies_for_election
 from utils.helpers import parse_iso_date
-import random
 from services.merkle_service import finalize_merkle_tree_for_election
 from services.representative_termination_service import completed_constituency_terms
+from services.representative_role_sync_service import sync_user_roles_for_users
+from services.vote_tx_queue import unsettled_vote_transactions
 
 
 def close_election_and_assign_reps(election):
     """
     Called once when election ends.
     Assigns ELECTED_REP and OPPOSITION_REP for each constituency.
+    Refuses while queued votes are still on their way to the chain.
     """
 
     election_id = election["id"]
+
+    unsettled = unsettled_vote_transactions(election_id)
+    if unsettled:
+        raise ValueError(f"Votes still being submitted: {unsettled}")
+
     constituencies = get_constituencies_for_election(election_id)
     print(constituencies)
 
@@ -24,41 +32,28 @@ def close_election_and_assign_reps(election):
     term_end = term_start.replace(year=term_start.year + 5)
 
 
+    # Final vote counts for every constituency in one pass, after
+    # catching the event index up to the chain head
+    tallies = tally_election_results(
+        election_id,
+        constituency_ids=[c["constituency_id"] for c in constituencies],
+        max_staleness=0
+    )
+
+    picks = {}
+
     for c in constituencies:
         constituency_id = c["constituency_id"]
 
-        # Get final vote counts
-        results = get_constituency_results(
-            election_id=election_id,
-            constituency_id=constituency_id
-        )
+        results = tallies[constituency_id]
         print(results)
         if not results:
             continue
 
-        # Sort by votes desc
-        results.sort(key=lambda x: x["votes"], reverse=True)
-
-        # -----------------------------
-        # WINNER (handle tie)
-        # -----------------------------
-        top_votes = results[0]["votes"]
-        winners = [r for r in results if r["votes"] == top_votes]
-        winner = random.choice(winners)
+        # Winner / runner-up (ties broken at random)
+        winner, runner_up = pick_winner_and_runner_up(results)
+        picks[constituency_id] = (winner, runner_up)
 
-        # Remove winner from list
-        remaining = [r for r in results if r["user_id"] != winner["user_id"]]
-
-        # -----------------------------
-        # RUNNER UP (handle tie)
-        # -----------------------------
-        if remaining:
-            second_votes = remaining[0]["votes"]
-            runners = [r for r in remaining if r["votes"] == second_votes]
-            runner_up = random.choice(runners)
-        else:
-            runner_up = None
-        
         completed_constituency_terms(constituency_id)
         # -----------------------------
         # INSERT REPRESENTATIVES
@@ -88,4 +83,12 @@ def close_election_and_assign_reps(election):
                 party_name=runner_up["party_name"]
             )
 
+        sync_user_roles_for_users([
+            winner["user_id"],
+            runner_up["user_id"] if runner_up else None
+        ])
+
+    # Results are final: materialize them once for every reader
+    write_final_snapshot(election_id, tallies, picks)
+
     finalize_merkle_tree_for_election(election["id"])
@@ -1,11 +1,14 @@
 from datetime import datetime
 from services.election_closure_service import close_election_and_assign_reps
+from services.ballot_cache import invalidate_ballots
+from services.vote_tx_queue import unsettled_vote_transactions
 from utils.helpers import utc_now
 
 def finalize_election_if_needed(election):
     from models.election import get_election_by_id, mark_election_completed, parse_dt
     """
     Finalizes election ONLY ONCE:
+    - Waits until every queued vote is on chain
     - Marks election COMPLETED
     - Assigns representatives
     """
@@ -23,8 +26,17 @@ def finalize_election_if_needed(election):
     if now <= end_dt_str:
         return
 
+    # Queued votes are still being sent; the next call closes it
+    unsettled = unsettled_vote_transactions(election["id"])
+    if unsettled:
+        print(f"⏳ Election {election['id']} not closed yet, votes unsettled: {unsettled}")
+        return
+
     # 1️⃣ Mark election completed
     mark_election_completed(election["id"])
 
     close_election_and_assign_reps(election)
 
+    # 2️⃣ Booth ballots are no longer needed
+    invalidate_ballots(election["id"])
+
@@ -1,47 +1,32 @@
-from supabase_db.db import fetch_one, fetch_all
+from supabase_db.db import fetch_one, fetch_map
 from models.election_insights import (
     get_total_votes,
     constituency_turnout_percentage,
-    first_time_voters,
-    voter_gender_split,
-    age_distribution,
 )
-from services.result_service import (
-    get_final_constituency_results,
-    get_constituency_results
-)
-
-from models.election_insights import get_constituency_name
 
-from models.election_insights import (
-    turnout_by_age_group,
-    gender_turnout_by_age,
-    constituency_demographic_heatmap
-)
+from models.election_insights import party_seat_share, party_vote_share
+from models.candidate import get_candidates_by_election
+from services.election_insights_engine import VoterSnapshot
+from services.election_snapshot_service import get_election_snapshot
 
 import math
 
 ELECTIONS = "elections"
-ELECTION_CONSTITUENCIES = "election_constituencies"
+CONSTITUENCIES = "constituencies"
 
 
 # ---------------------------------------------------
 # 🟣 Party Seat Share (Blockchain winners)
 # ---------------------------------------------------
 
-def compute_party_seat_share(election_id):
-    rows = fetch_all(ELECTION_CONSTITUENCIES, {"election_id": election_id})
+def compute_party_seat_share(results):
+    """
+    results = snapshot results {constituency_id: {"candidates", "winner", ...}}
+    """
     parties = {}
 
-    for r in rows:
-        cid = r["constituency_id"]
-
-        try:
-            result = get_final_constituency_results(election_id, cid)
-        except Exception:
-            continue
-
-        winner = result.get("winner")
+    for entry in results.values():
+        winner = _candidate(entry, entry.get("winner"))
         if not winner:
             continue
 
@@ -52,21 +37,23 @@ def compute_party_seat_share(election_id):
     return parties
 
 
+def _candidate(entry, candidate_id):
+    for c in entry["candidates"]:
+        if c["candidate_id"] == candidate_id:
+            return c
+    return None
+
+
 # ---------------------------------------------------
 # 📊 Party Vote Share %
 # ---------------------------------------------------
 
-def compute_party_vote_share(election_id):
-    rows = fetch_all(ELECTION_CONSTITUENCIES, {"election_id": election_id})
-
+def compute_party_vote_share(results):
     party_votes = {}
     total_votes = 0
 
-    for r in rows:
-        cid = r["constituency_id"]
-        results = get_constituency_results(election_id, cid)
-
-        for c in results:
+    for entry in results.values():
+        for c in entry["candidates"]:
             party = c["party_name"]
             votes = c["votes"]
 
@@ -84,29 +71,25 @@ def compute_party_vote_share(election_id):
 # 🏆 Victory Margins
 # ---------------------------------------------------
 
-def compute_victory_margins(election_id):
-    rows = fetch_all(ELECTION_CONSTITUENCIES, {"election_id": election_id})
+def compute_victory_margins(results):
     margins = []
+    names = fetch_map(CONSTITUENCIES, "id", list(results))
 
-    for r in rows:
-        cid = r["constituency_id"]
-
-        try:
-            res = get_final_constituency_results(election_id, cid)
-        except Exception:
-            continue
-
-        winner = res.get("winner")
-        runner = res.get("runner_up")
+    for cid, entry in results.items():
+        winner = _candidate(entry, entry.get("winner"))
+        runner = _candidate(entry, entry.get("runner_up"))
 
         if not winner or not runner:
             continue
 
         margin = winner["votes"] - runner["votes"]
+        constituency = names.get(cid)
 
         margins.append({
             "constituency_id": cid,
-            "constituency_name": get_constituency_name(cid),
+            "constituency_name": (
+                constituency["constituency_name"] if constituency else "Unknown Constituency"
+            ),
             "margin": margin,
             "winner": winner["candidate_name"],
             "party": winner["party_name"]
@@ -120,8 +103,8 @@ def compute_victory_margins(election_id):
 # 📈 Turnout Leaderboard
 # ---------------------------------------------------
 
-def turnout_leaderboard(election_id):
-    turnout = constituency_turnout_percentage(election_id)
+def turnout_leaderboard(election_id, turnout=None):
+    turnout = list(turnout if turnout is not None else constituency_turnout_percentage(election_id))
     turnout.sort(key=lambda x: x["turnout_percent"], reverse=True)
     return turnout
 
@@ -130,22 +113,20 @@ def turnout_leaderboard(election_id):
 # 🗺 Engagement Score (Heatmap Index)
 # ---------------------------------------------------
 
-def constituency_heatmap_score(election_id):
-    turnout = constituency_turnout_percentage(election_id)
+def constituency_heatmap_score(election_id, turnout=None):
+    if turnout is None:
+        turnout = constituency_turnout_percentage(election_id)
     scores = []
 
     for t in turnout:
-        cid = t["constituency_id"]
         turnout_pct = t["turnout_percent"]
-
-        results = get_constituency_results(election_id, cid)
         total_votes = t["votes_cast"]
 
         score = turnout_pct + math.log(total_votes + 1)
 
         scores.append({
-            "constituency_id": cid,
-            "constituency_name": get_constituency_name(cid),
+            "constituency_id": t["constituency_id"],
+            "constituency_name": t["constituency_name"],
             "score": round(score, 2),
             "turnout": turnout_pct,
             "votes": total_votes
@@ -159,35 +140,62 @@ def constituency_heatmap_score(election_id):
 # 🟢 MAIN DASHBOARD SERVICE
 # ---------------------------------------------------
 
-def get_election_dashboard(election_id):
-    election = fetch_one(ELECTIONS, {"id": election_id})
-    if not election:
-        return None
-
+def build_election_dashboard(election, results, final: bool):
+    """
+    Full dashboard payload from snapshot results (see
+    services/election_snapshot_service). Seat share and margins are
+    only reported once the election has ended.
+    """
+    election_id = election["id"]
     election_start = election["start_time"]
 
-    turnout_data = constituency_turnout_percentage(election_id)
+    # One columnar snapshot of voters + vote status feeds every
+    # demographic breakdown below
+    snapshot = VoterSnapshot(election_id, election_start)
+
+    constituency_ids = list({
+        c["constituency_id"] for c in get_candidates_by_election(election_id)
+    })
+    turnout_data = snapshot.turnout_by_constituency(constituency_ids)
 
-    insights = {
+    return {
         # Core metrics
         "total_votes": get_total_votes(election_id),
         "turnout_by_constituency": turnout_data,
-        "first_time_voters": first_time_voters(election_start),
-        "gender_split": voter_gender_split(election_id),
-        "age_distribution": age_distribution(election_id, election_start),
-        "age_turnout": turnout_by_age_group(election_id, election_start),
-        "gender_turnout_by_age": gender_turnout_by_age(election_id, election_start),
-        "demographic_heatmap": constituency_demographic_heatmap(election_id, election_start),
+        "first_time_voters": snapshot.first_time_voters(),
+        "gender_split": snapshot.gender_split(),
+        "age_distribution": snapshot.age_distribution(),
+        "age_turnout": snapshot.turnout_by_age_group(),
+        "gender_turnout_by_age": snapshot.gender_turnout_by_age(),
+        "demographic_heatmap": snapshot.demographic_heatmap(),
 
         # Blockchain derived metrics
-        "party_seat_share": compute_party_seat_share(election_id),
-        "party_vote_share": compute_party_vote_share(election_id),
-        "victory_margins": compute_victory_margins(election_id),
+        "party_seat_share": compute_party_seat_share(results) if final else {},
+        "party_vote_share": compute_party_vote_share(results),
+        "victory_margins": compute_victory_margins(results) if final else [],
 
         # Rankings
-        "turnout_leaderboard": turnout_leaderboard(election_id),
-        "constituency_heatmap": constituency_heatmap_score(election_id),
-        
+        "turnout_leaderboard": turnout_leaderboard(election_id, turnout_data),
+        "constituency_heatmap": constituency_heatmap_score(election_id, turnout_data),
+
+        "final": final,
     }
 
-    return insights
\ No newline at end of file
+
+def get_election_dashboard(election_id, winners=None, vote_map=None):
+    """
+    Served from the election snapshot. winners / vote_map (optional)
+    override the blockchain-derived party seat and vote shares.
+    """
+    election = fetch_one(ELECTIONS, {"id": election_id})
+    if not election:
+        return None
+
+    insights = dict(get_election_snapshot(election_id)["dashboard"])
+
+    if winners:
+        insights["party_seat_share"] = party_seat_share(election_id, winners)
+    if vote_map:
+        insights["party_vote_share"] = party_vote_share(election_id, vote_map)
+
+    return insights
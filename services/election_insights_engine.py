@@ -0,0 +1,212 @@
+# services/election_insights_engine.py
+#
+# Columnar election demographics.
+#
+# Replaces the row-by-row demographic functions that lived in
+# models/election_insights, which re-downloaded the active voters and
+# vote_status tables and parsed every DOB string in a Python loop.
+# VoterSnapshot takes the voter columns
+# from the shared voter index (services/voter_index, DOBs already
+# parsed to day numbers), streams only this election's vote_status and
+# computes every breakdown with vectorized group-bys. Output shapes
+# match the original functions so templates and API consumers are
+# unchanged.
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from services.voter_index import resolve_voters, NO_DOB
+from supabase_db.db import iter_all, fetch_map
+
+VOTE_STATUS = "vote_status"
+CONSTITUENCIES = "constituencies"
+
+AGE_BUCKETS = ["18-25", "26-40", "41-60", "60+"]
+GENDERS = ["Male", "Female", "Other"]
+
+_EPOCH = date(1970, 1, 1)
+
+
+def _day_number(value) -> int:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        value = value.date()
+    return (value - _EPOCH).days
+
+
+class VoterSnapshot:
+    """
+    One election's voters as columns:
+
+    constituency_id, gender, dob_day, active, voted
+    """
+
+    def __init__(self, election_id: str, election_start):
+        self.election_id = election_id
+        self.start_day = _day_number(election_start)
+
+        voted_ids = [
+            r["voter_id"] for r in iter_all(
+                VOTE_STATUS,
+                {"election_id": election_id, "has_voted": True},
+                columns=["voter_id"],
+                key="voter_id"
+            )
+        ]
+
+        index, positions = resolve_voters(voted_ids)
+
+        # One vote_status row per (voter_id, election_id), so this is
+        # 0 or 1 per voter
+        votes = np.bincount(positions[positions >= 0], minlength=len(index))
+
+        # Voters who voted but are no longer active still count
+        # towards vote-based breakdowns (gender split, heatmap)
+        keep = index.active | (votes > 0)
+
+        dob_day = index.dob_day[keep].astype("float64")
+        dob_day[dob_day == NO_DOB] = np.nan
+
+        df = pd.DataFrame({
+            "constituency_id": index.constituencies.decode(index.constituency[keep]),
+            "gender": index.genders.decode(index.gender[keep]),
+            "dob_day": dob_day,
+            "active": index.active[keep],
+            "votes": votes[keep].astype("int64")
+        })
+        df["voted"] = df["votes"] > 0
+
+        df["age"] = (self.start_day - df["dob_day"]) // 365
+
+        df["age_bucket"] = pd.cut(
+            df["age"],
+            bins=[18, 26, 41, 61, np.inf],
+            labels=AGE_BUCKETS,
+            right=False
+        )
+
+        self.df = df
+        self.registered = self.df[self.df["active"]]
+
+    # ---------------------------------------------------
+    # BREAKDOWNS
+    # ---------------------------------------------------
+
+    def first_time_voters(self) -> dict:
+        reg = self.registered
+        count = int(reg["age"].between(18, 19).sum())
+        total = len(reg)
+
+        return {
+            "count": count,
+            "percentage": round(count / total * 100, 2) if total else 0
+        }
+
+    def gender_split(self) -> dict:
+        total = int(self.df["votes"].sum())
+        if not total:
+            return {**{g: 0 for g in GENDERS}, **{f"{g}_pct": 0 for g in GENDERS}}
+
+        counts = self.df.groupby("gender")["votes"].sum()
+
+        result = {g: int(counts.get(g, 0)) for g in GENDERS}
+        for g in GENDERS:
+            result[f"{g}_pct"] = round(result[g] / total * 100, 2)
+
+        return result
+
+    def _age_counts(self) -> pd.DataFrame:
+        reg = self.registered.dropna(subset=["age_bucket"])
+        return (
+            reg.groupby("age_bucket", observed=False)
+            .agg(registered=("active", "size"), voted=("voted", "sum"))
+            .reindex(AGE_BUCKETS, fill_value=0)
+        )
+
+    def age_distribution(self) -> dict:
+        counts = self._age_counts()
+        return {
+            b: {
+                "registered": int(counts.at[b, "registered"]),
+                "voted": int(counts.at[b, "voted"])
+            }
+            for b in AGE_BUCKETS
+        }
+
+    def turnout_by_age_group(self) -> dict:
+        buckets = self.age_distribution()
+        for b in buckets.values():
+            b["turnout_pct"] = round(b["voted"] / (b["registered"] or 1) * 100, 2)
+        return buckets
+
+    def gender_turnout_by_age(self) -> dict:
+        voted = self.registered[self.registered["voted"]].dropna(subset=["age_bucket"])
+
+        table = pd.crosstab(voted["age_bucket"], voted["gender"])
+        table = table.reindex(
+            index=AGE_BUCKETS,
+            columns=sorted(set(GENDERS) | set(table.columns)),
+            fill_value=0
+        )
+
+        return {
+            b: {g: int(n) for g, n in table.loc[b].items()}
+            for b in AGE_BUCKETS
+        }
+
+    def demographic_heatmap(self) -> dict:
+        voted = self.df[self.df["voted"]]
+        if voted.empty:
+            return {}
+
+        table = (
+            voted.groupby(["constituency_id", "gender"])["votes"].sum()
+            .unstack(fill_value=0)
+        )
+
+        names = fetch_map(CONSTITUENCIES, "id", list(table.index))
+
+        heatmap = {}
+        for cid, row in table.iterrows():
+            constituency = names.get(cid)
+            cname = constituency["constituency_name"] if constituency else "Unknown Constituency"
+
+            entry = heatmap.setdefault(
+                cname, {"total": 0, "Male": 0, "Female": 0, "Other": 0}
+            )
+            for g, n in row.items():
+                entry[g] = entry.get(g, 0) + int(n)
+                entry["total"] += int(n)
+
+        return heatmap
+
+    def turnout_by_constituency(self, constituency_ids) -> list:
+        """
+        Same rows as constituency_turnout_percentage for the given
+        constituencies, from the snapshot instead of per-seat queries.
+        """
+        registered = self.registered.groupby("constituency_id").size()
+        voted = self.df.groupby("constituency_id")["votes"].sum()
+        names = fetch_map(CONSTITUENCIES, "id", constituency_ids)
+
+        results = []
+        for cid in constituency_ids:
+            registered_count = int(registered.get(cid, 0))
+            voted_count = int(voted.get(cid, 0))
+            turnout = (voted_count / registered_count * 100) if registered_count else 0
+            constituency = names.get(cid)
+
+            results.append({
+                "constituency_id": cid,
+                "constituency_name": (
+                    constituency["constituency_name"] if constituency else "Unknown Constituency"
+                ),
+                "registered_voters": registered_count,
+                "votes_cast": voted_count,
+                "turnout_percent": round(turnout, 2)
+            })
+
+        return results
@@ -0,0 +1,219 @@
+# services/election_snapshot_service.py
+#
+# Serves results and dashboard aggregates from models/election_snapshot
+# instead of recomputing them per request.
+#
+# - Closure writes a FINAL snapshot with the winners it assigned; it is
+#   never recomputed, so results night traffic is one row read.
+# - LIVE snapshots are refreshed at most every
+#   ELECTION_SNAPSHOT_REFRESH_SECONDS, and only rebuilt when the indexed
+#   vote counts moved (per-candidate deltas are applied to the stored
+#   rows; winners are re-picked only where counts changed).
+
+import threading
+
+from collections import deque
+from datetime import timedelta
+
+from config import Config
+from models.election import get_election_by_id, get_constituencies_for_election
+from models.election_snapshot import get_snapshot, save_snapshot, LIVE, FINAL
+from services.blockchain_reader import get_vote_counts_from_chain
+from services.result_service import tally_election_results, pick_winner_and_runner_up
+from utils.crypto import uuid_to_uint256
+from utils.helpers import utc_now
+from utils.instrumentation import track_operations
+
+RESULT_FIELDS = ("candidate_id", "user_id", "candidate_name", "party_name", "votes")
+
+# Recent snapshot builds with their DB query / chain read counts
+_build_log = deque(maxlen=50)
+
+_refresh_locks = {}
+_refresh_locks_guard = threading.Lock()
+
+
+def _refresh_lock(election_id):
+    with _refresh_locks_guard:
+        return _refresh_locks.setdefault(election_id, threading.Lock())
+
+
+def _entry(rows: list, winner=None, runner_up=None, pick=True) -> dict:
+    rows = [{k: r[k] for k in RESULT_FIELDS} for r in rows]
+
+    if pick:
+        winner, runner_up = pick_winner_and_runner_up(rows)
+    else:
+        rows.sort(key=lambda x: x["votes"], reverse=True)
+
+    return {
+        "candidates": rows,
+        "winner": winner["candidate_id"] if winner else None,
+        "runner_up": runner_up["candidate_id"] if runner_up else None
+    }
+
+
+def _has_ended(election) -> bool:
+    return utc_now().isoformat() > election["end_time"]
+
+
+def _build(election, results: dict, status: str, replace_final: bool = False):
+    from services.election_insight_service import build_election_dashboard
+
+    dashboard = build_election_dashboard(
+        election,
+        results,
+        final=_has_ended(election)
+    )
+    return save_snapshot(election["id"], status, results, dashboard, replace_final)
+
+
+# -------------------------------------------------
+# WRITE
+# -------------------------------------------------
+
+def _tracked(kind: str, election_id, build, *args):
+    """
+    Runs one snapshot build, logging how many DB queries, chain reads
+    and RPCs it made.
+    """
+    with track_operations() as stats:
+        snapshot = build(*args)
+
+    entry = {
+        "election_id": election_id,
+        "kind": kind,
+        "at": utc_now().isoformat(),
+        **stats.summary()
+    }
+    _build_log.append(entry)
+
+    print(
+        f"📊 Snapshot {kind} {election_id}: "
+        f"{entry.get('db_queries', 0)} DB queries, "
+        f"{entry.get('chain_reads', 0)} chain reads, "
+        f"{entry.get('chain_rpc', 0)} RPCs, {entry['elapsed_ms']} ms"
+    )
+    return snapshot
+
+
+def get_snapshot_build_stats() -> list:
+    return list(_build_log)
+
+
+def write_final_snapshot(election_id, tallies: dict, picks: dict):
+    """
+    Called by closure with the tallies it used and the winners it
+    assigned: picks = {constituency_id: (winner_row, runner_up_row)}.
+    """
+    return _tracked("final", election_id, _write_final, election_id, tallies, picks)
+
+
+def _write_final(election_id, tallies: dict, picks: dict):
+    results = {}
+
+    for cid, rows in tallies.items():
+        winner, runner_up = picks.get(cid, (None, None))
+        results[cid] = _entry(rows, winner, runner_up, pick=False)
+
+    return _build(get_election_by_id(election_id), results, FINAL, replace_final=True)
+
+
+def _apply_vote_deltas(results: dict, counts: dict) -> set:
+    """
+    Updates stored vote counts in place; returns constituencies whose
+    counts changed.
+    """
+    changed = set()
+
+    for cid, entry in results.items():
+        for row in entry["candidates"]:
+            votes = counts.get(str(uuid_to_uint256(row["candidate_id"])), 0)
+            if votes != row["votes"]:
+                row["votes"] = votes
+                changed.add(cid)
+
+    return changed
+
+
+def refresh_election_snapshot(election_id, snapshot=None):
+    kind = "build" if snapshot is None else "refresh"
+    return _tracked(kind, election_id, _refresh, election_id, snapshot)
+
+
+def _refresh(election_id, snapshot=None):
+    election = get_election_by_id(election_id)
+    status = FINAL if election["status"] == "COMPLETED" else LIVE
+
+    if snapshot is None:
+        constituency_ids = [
+            c["constituency_id"] for c in get_constituencies_for_election(election_id)
+        ]
+        tallies = tally_election_results(election_id, constituency_ids)
+        results = {cid: _entry(rows) for cid, rows in tallies.items()}
+        return _build(election, results, status)
+
+    results = snapshot["results"]
+    changed = _apply_vote_deltas(results, get_vote_counts_from_chain(election_id))
+
+    for cid in changed:
+        results[cid] = _entry(results[cid]["candidates"])
+
+    ended_now = _has_ended(election) and not snapshot["dashboard"].get("final")
+
+    if changed or ended_now or status != snapshot["status"]:
+        return _build(election, results, status)
+
+    # Nothing moved: only bump the freshness stamp
+    return save_snapshot(election_id, snapshot["status"], results, snapshot["dashboard"])
+
+
+# -------------------------------------------------
+# READ
+# -------------------------------------------------
+
+def _is_fresh(snapshot) -> bool:
+    max_age = timedelta(seconds=Config.ELECTION_SNAPSHOT_REFRESH_SECONDS)
+    return snapshot["updated_at"] > (utc_now() - max_age).isoformat()
+
+
+def get_election_snapshot(election_id):
+    """
+    FINAL snapshots as stored; LIVE ones refreshed when stale.
+    """
+    snapshot = get_snapshot(election_id)
+
+    if snapshot and (snapshot["status"] == FINAL or _is_fresh(snapshot)):
+        return snapshot
+
+    with _refresh_lock(election_id):
+        # Another request may have refreshed it while we waited
+        latest = get_snapshot(election_id)
+        if latest and (latest["status"] == FINAL or _is_fresh(latest)):
+            return latest
+
+        return refresh_election_snapshot(election_id, latest)
+
+
+def get_snapshot_constituency_results(election_id, constituency_id):
+    """
+    {"winner", "runner_up", "all_candidates"} from the snapshot, shaped
+    like get_final_constituency_results.
+    """
+    snapshot = get_election_snapshot(election_id)
+    entry = snapshot["results"].get(constituency_id)
+
+    if entry is None:
+        return {"winner": None, "runner_up": None, "all_candidates": []}
+
+    rows = [
+        {k: r[k] for k in ("candidate_id", "candidate_name", "party_name", "votes")}
+        for r in entry["candidates"]
+    ]
+    by_id = {r["candidate_id"]: r for r in rows}
+
+    return {
+        "winner": by_id.get(entry["winner"]),
+        "runner_up": by_id.get(entry["runner_up"]),
+        "all_candidates": rows
+    }
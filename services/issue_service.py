@@ -12,6 +12,7 @@ from utils.helpers import sha256_hash
 from models.issue import get_issue_comments as fetch_comments
 from models.issue import update_issue_status
 from models.issue_timeline import add_issue_status
+from services.rep_score_aggregates import record_issue_status, record_issue_comment
 from models.issue import (
     get_user_issue_vote,
     upsert_issue_vote,
@@ -102,6 +103,8 @@ def comment_on_issue(issue_id, user_id, comment, parent_comment_id=None):
         comment=comment,
         parent_comment_id=parent_comment_id
     )
+    record_issue_comment(issue_id, user_id)
+
     # 🔥 AI trigger
     if should_trigger_ai_reply(comment):
 
@@ -153,6 +156,7 @@ def comment_on_issue(issue_id, user_id, comment, parent_comment_id=None):
                 },
                 use_admin=True
             )
+            record_issue_comment(issue_id, ai_user_id)
 
         except AIClientError:
             pass
@@ -172,6 +176,7 @@ def citizen_confirm_resolution(issue_id: str, user_id: str):
         changed_by=user_id,
         note="Citizen confirmed resolution"
     )
+    record_issue_status(issue_id, "Closed")
 
     create_audit_log(
         user_id=user_id,
@@ -210,6 +215,7 @@ def accept_issue(issue_id, rep_id, note, estimated_start):
         note=note,
         estimated_start_at=estimated_start,
     )
+    record_issue_status(issue_id, "Accepted")
 
 def mark_in_progress(issue_id, rep_id, note, estimated_completion):
     update_issue_status(issue_id, "In Progress")
@@ -221,6 +227,7 @@ def mark_in_progress(issue_id, rep_id, note, estimated_completion):
         note=note,
         estimated_completion_at=estimated_completion
     )
+    record_issue_status(issue_id, "In Progress")
 
 def _resolve_issue(issue_id: str, resolved_by: str,note: str):
     issue = get_issue_by_id(issue_id)
@@ -239,6 +246,7 @@ def _resolve_issue(issue_id: str, resolved_by: str,note: str):
         changed_by=resolved_by,
         note=note
     )
+    record_issue_status(issue_id, "Resolved")
 
     # 3. Audit
     create_audit_log(
@@ -258,6 +266,7 @@ def reject_issue(issue_id, rep_id, note):
         changed_by=rep_id,
         note=note
     )
+    record_issue_status(issue_id, "Rejected")
 
 def close_issue(issue_id, citizen_id):
     update_issue_status(issue_id, "Closed")
@@ -268,6 +277,7 @@ def close_issue(issue_id, citizen_id):
         changed_by=citizen_id,
         note="Citizen confirmed resolution"
     )
+    record_issue_status(issue_id, "Closed")
 
 def toggle_issue_vote(issue_id: str, user_id: str, vote_type: str):
     """
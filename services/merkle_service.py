@@ -1,14 +1,111 @@
 # services/merkle_service.py
 
+import time
+from config import Config
 from models.vote_receipt import get_receipts_by_election
-from models.vote_merkle_proof import store_merkle_proof
-from utils.merkle import get_merkle_root, get_merkle_proof,build_merkle_tree
+from models.vote_merkle_proof import store_merkle_proofs
+from models.merkle_accumulator import (
+    get_accumulator_state,
+    create_accumulator_state,
+    compare_and_set_accumulator_state
+)
+from utils.merkle import MerkleTree, CompactMerkleTree, MerkleAccumulator
 from services.blockchain_service import publish_merkle_root_on_chain
 
 
+ACCUMULATOR_MAX_RETRIES = 20
+
+
+# -------------------------------------------------
+# Incremental accumulator (fed while polling)
+# -------------------------------------------------
+
+def _load_accumulator(election_id):
+    row = get_accumulator_state(election_id)
+    return row, (MerkleAccumulator.from_dict(row) if row else MerkleAccumulator())
+
+
+def append_receipt_to_accumulator(election_id, receipt_hash) -> int:
+    """
+    Appends one receipt to the election's persisted Merkle frontier.
+    Returns the receipt's leaf index.
+
+    Concurrent booths race on the same row, so the write is a
+    compare-and-set on leaf_count and is retried on conflict.
+    """
+    for _ in range(ACCUMULATOR_MAX_RETRIES):
+        row, acc = _load_accumulator(election_id)
+        expected_count = acc.count
+        leaf_index = acc.append(receipt_hash)
+
+        try:
+            if row is None:
+                create_accumulator_state(election_id, acc.to_dict())
+                saved = True
+            else:
+                saved = compare_and_set_accumulator_state(
+                    election_id, expected_count, acc.to_dict()
+                )
+        except Exception:
+            # Another booth created the row first
+            saved = False
+
+        if saved:
+            _maybe_publish_interim_root(election_id, acc)
+            return leaf_index
+
+    raise RuntimeError("Could not append receipt to Merkle accumulator")
+
+
+def get_interim_merkle_root(election_id):
+    """
+    Root over every receipt accumulated so far, in O(log N).
+    """
+    _, acc = _load_accumulator(election_id)
+    return acc.root
+
+
+def _maybe_publish_interim_root(election_id, acc):
+    every = Config.MERKLE_INTERIM_ROOT_EVERY
+    if every and acc.count % every == 0:
+        # The append is already saved; a failed publish must not undo it
+        try:
+            publish_merkle_root_on_chain(election_id, acc.root)
+        except Exception as e:
+            print(f"⚠️ Interim Merkle root publish failed for {election_id}: {e}")
+
+
+# -------------------------------------------------
+# Election close
+# -------------------------------------------------
+
+def _build_tree(receipt_hashes):
+    """
+    Small elections keep the list-of-bytes tree; large ones use the
+    compact contiguous-buffer tree, spilled to mmap files past
+    MERKLE_SPILL_MIN_RECEIPTS.
+    """
+    n = len(receipt_hashes)
+
+    if n < Config.MERKLE_COMPACT_MIN_RECEIPTS:
+        return MerkleTree(receipt_hashes)
+
+    return CompactMerkleTree(
+        receipt_hashes,
+        spill_to_disk=n >= Config.MERKLE_SPILL_MIN_RECEIPTS,
+        spill_dir=Config.MERKLE_SPILL_DIR
+    )
+
+
 def finalize_merkle_tree_for_election(election_id):
     """
     Called ONCE after election ends.
+
+    If the accumulator covers every receipt its root is published
+    straight away (O(log N)); proofs are then generated from the
+    receipts in leaf order. Should the rebuilt root disagree (votes
+    cast before the accumulator existed, a failed accumulator append),
+    the rebuilt root is the one published.
     """
     receipts = get_receipts_by_election(election_id)
 
@@ -16,15 +113,34 @@ def finalize_merkle_tree_for_election(election_id):
         raise ValueError("No votes found for election")
 
     receipt_hashes = [r["receipt_hash"] for r in receipts]
-    # 1️⃣ Compute root
-    merkle_root = get_merkle_root(receipt_hashes)
 
-    # 2️⃣ Store proof for each receipt
-    for r in receipt_hashes:
-        proof = get_merkle_proof(receipt_hashes, r)
-        store_merkle_proof(election_id, r, proof)
+    # 1️⃣ Root from the accumulator, published before proof generation
+    _, acc = _load_accumulator(election_id)
+    accumulated_root = acc.root if acc.count == len(receipt_hashes) else None
+
+    if accumulated_root:
+        publish_merkle_root_on_chain(election_id, accumulated_root)
+
+    # 2️⃣ Build the tree once and store every proof in bulk
+    started = time.perf_counter()
+    tree = _build_tree(receipt_hashes)
+    merkle_root = tree.root
+
+    try:
+        stored = store_merkle_proofs(election_id, tree.iter_proofs())
+    finally:
+        if isinstance(tree, CompactMerkleTree):
+            tree.close()
+
+    print(
+        f"Merkle tree for {election_id}: {len(receipt_hashes)} receipts, "
+        f"{stored} proofs stored in {time.perf_counter() - started:.2f}s"
+    )
 
-    # 3️⃣ Publish root on-chain
-    publish_merkle_root_on_chain(election_id, merkle_root)
+    # 3️⃣ Publish root on-chain (only if the accumulator was unusable)
+    if merkle_root != accumulated_root:
+        if accumulated_root:
+            print(f"⚠️ Accumulator root mismatch for {election_id}, republishing")
+        publish_merkle_root_on_chain(election_id, merkle_root)
 
     return merkle_root
@@ -0,0 +1,49 @@
+# services/nonce_manager.py
+#
+# Local nonce allocation per signing account.
+#
+# The chain is asked for the pending transaction count once; after
+# that nonces are handed out from memory under a lock, so concurrent
+# sends from the same booth key never reuse a nonce and skip the
+# get_transaction_count round trip. Any send error resyncs from chain.
+
+import threading
+
+from services.web3_registry import get_web3
+
+
+class NonceManager:
+
+    def __init__(self, address: str):
+        self.address = address
+        self._next = None
+        self._lock = threading.Lock()
+
+    def allocate(self) -> int:
+        with self._lock:
+            if self._next is None:
+                self._next = get_web3().eth.get_transaction_count(self.address, "pending")
+
+            nonce = self._next
+            self._next += 1
+            return nonce
+
+    def resync(self):
+        """
+        Forget the local counter; the next allocate() re-reads the chain.
+        """
+        with self._lock:
+            self._next = None
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+def get_nonce_manager(address: str) -> NonceManager:
+    with _managers_lock:
+        manager = _managers.get(address)
+        if manager is None:
+            manager = NonceManager(address)
+            _managers[address] = manager
+        return manager
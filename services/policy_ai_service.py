@@ -3,6 +3,7 @@ from models.rep_policy import (
     update_representative_statement,
     update_opposition_statement
 )
+from services.rep_score_aggregates import record_post_integrity
 from supabase_db.db import update_record
 from utils.helpers import utc_now
 
@@ -30,3 +31,4 @@ def store_ai_analysis(post_id, summary, fact_check, confidence_score,integrity_s
         },
         use_admin=True
     )
+    record_post_integrity(post_id, integrity_score)
@@ -1,5 +1,5 @@
 from datetime import date
-from services.representative_scoring import calculate_representative_score
+from services.rep_score_aggregates import get_incremental_rep_score
 from models.representative import (
     insert_daily_rep_score,
     get_daily_rep_score
@@ -12,7 +12,7 @@ def store_today_rep_score(rep_user_id: str, election_id: str, constituency_id: s
     if existing:
         return "Already stored"
 
-    score = calculate_representative_score(rep_user_id, constituency_id)
+    score = get_incremental_rep_score(rep_user_id, constituency_id)
 
     insert_daily_rep_score(
         rep_user_id=rep_user_id,
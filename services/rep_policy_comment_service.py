@@ -11,6 +11,7 @@ from utils.helpers import utc_now
 from supabase_db.db import insert_record
 from services.ai_client import run_comment_reply
 from services.citizen_service import ensure_citizen_alias
+from services.rep_score_aggregates import record_policy_comment
 from models.rep_policy_comment_votes import (
     get_user_comment_vote,
     upsert_comment_vote,
@@ -27,6 +28,7 @@ def add_comment(post_id, user_id, content, parent_comment_id=None):
         content=content,
         parent_comment_id=parent_comment_id
     )
+    record_policy_comment(post_id, user_id, parent_comment_id)
 
     create_audit_log(
         user_id=user_id,
@@ -101,6 +103,7 @@ def add_comment(post_id, user_id, content, parent_comment_id=None):
         content=content,
         parent_comment_id=parent_comment_id
     )
+    record_policy_comment(post_id, user_id, parent_comment_id)
 
     create_audit_log(
         user_id=user_id,
@@ -139,6 +142,7 @@ def add_comment(post_id, user_id, content, parent_comment_id=None):
                 },
                 use_admin=True
             )
+            record_policy_comment(post_id, user_id, comment[0]["id"])
 
         except AIClientError:
             pass  # AI failure should not break discussion
@@ -21,6 +21,7 @@ from utils.helpers import utc_now
 from models.rep_policy import update_policy_post_images
 from models.rep_policy import get_user_vote, upsert_vote, remove_vote
 from supabase_db.db import fetch_one, fetch_all, insert_record, update_record
+from services.rep_score_aggregates import record_policy_post, record_policy_vote
 
 
 # -------------------------------------------------
@@ -70,6 +71,7 @@ def create_new_policy_post(user_id, role, constituency_id, title, content, image
         content=content,
         image_urls=image_urls
     )
+    record_policy_post(post[0])
 
     # -----------------------------
     # Audit log
@@ -145,6 +147,13 @@ def vote_policy_post(user_id, post_id, vote_value):
     else:
         upsert_vote(post_id, user_id, vote_value)
 
+    old_value = existing["vote_value"] if existing else None
+    record_policy_vote(
+        post_id,
+        old_value,
+        None if old_value == vote_value else vote_value
+    )
+
     create_audit_log(
         user_id=user_id,
         action="VOTE_POLICY_POST",
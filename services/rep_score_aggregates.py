@@ -0,0 +1,502 @@
+# services/rep_score_aggregates.py
+#
+# Incremental representative scoring.
+#
+# Each rep has one rep_score_aggregates row holding running totals for
+# every input of services/representative_scoring:
+#
+#   posts          post_id → month, up / down votes, comments, top-level
+#                  comments, AI integrity score
+#   months         "YYYY-MM" → posts (activity histogram)
+#   constituencies constituency_id → issue counters (acted / resolved /
+#                  closed, response-hour sum + count, impact weight),
+#                  the per-issue status they were derived from, and
+#                  comment counters for participation depth
+#
+# The write paths (issue status changes, posts, post votes, comments,
+# AI analysis) apply deltas to existing rows with a compare-and-set on
+# version. Rows are created by a rebuild from history on first read and
+# rebuilt again after REP_SCORE_REBUILD_DAYS, which also absorbs any
+# delta lost to a failed hook.
+#
+# Reading a score is one row fetch; no history is scanned.
+
+from datetime import datetime, timedelta
+from statistics import mean
+
+from config import Config
+from models.issue import get_issue_by_id, get_term_rep, is_issue_in_rep_term
+from models.rep_policy import REP_POLICY_POSTS_TABLE
+from models.rep_score_aggregate import (
+    get_rep_aggregates,
+    get_rep_aggregates_for_users,
+    create_rep_aggregates,
+    compare_and_set_rep_aggregates
+)
+from models.representative import get_representatives_by_constituency
+from services.representative_scoring import (
+    ScoringContext,
+    accountability_dimension,
+    composite_score,
+    consistency_points,
+    constituency_engagement_points,
+    controversy_penalty,
+    engagement_dimension,
+    impact_dimension,
+    integrity_dimension,
+    issue_impact_weight,
+    issue_scope_points,
+    participation_points,
+    post_quality_points,
+    response_time_points
+)
+from supabase_db.db import fetch_one
+from utils.helpers import utc_now
+
+ACTED = ("Accepted", "In Progress", "Resolved", "Closed")
+RESOLVED = ("Resolved", "Closed")
+
+ISSUE_COUNTERS = ("acted", "resolved", "closed", "response_hours_sum", "response_count", "impact")
+
+AGGREGATE_MAX_RETRIES = 10
+
+
+# -------------------------------------------------
+# STATE
+# -------------------------------------------------
+
+def empty_state() -> dict:
+    return {"posts": {}, "months": {}, "constituencies": {}}
+
+
+def _empty_section() -> dict:
+    return {
+        "issues": {},               # issue_id → {"status", "response_hours", "weight"}
+        "acted": 0,
+        "resolved": 0,
+        "closed": 0,
+        "response_hours_sum": 0.0,
+        "response_count": 0,
+        "impact": 0,
+        "comments_on_others": 0,    # rep's top-level comments on other authors' posts
+        "issue_comments": 0,        # rep's comments on constituency issues
+        "issue_comments_total": 0   # every comment on constituency issues
+    }
+
+
+def _parse_ts(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _month_of(created_at: str) -> str:
+    return _parse_ts(created_at).strftime("%Y-%m")
+
+
+def _issue_counts(entry: dict) -> dict:
+    """
+    What one issue contributes to the section counters.
+    """
+    status = entry["status"]
+    responded = status in ACTED and entry["response_hours"] is not None
+
+    return {
+        "acted": int(status in ACTED),
+        "resolved": int(status in RESOLVED),
+        "closed": int(status == "Closed"),
+        "response_hours_sum": entry["response_hours"] if responded else 0.0,
+        "response_count": int(responded),
+        "impact": entry["weight"] if status in RESOLVED else 0
+    }
+
+
+def _set_issue(section: dict, issue_id, entry: dict):
+    old = section["issues"].get(issue_id)
+    old_counts = _issue_counts(old) if old else dict.fromkeys(ISSUE_COUNTERS, 0)
+    new_counts = _issue_counts(entry)
+
+    for k in ISSUE_COUNTERS:
+        section[k] += new_counts[k] - old_counts[k]
+
+    section["issues"][issue_id] = entry
+
+
+def _add_post(state: dict, post: dict):
+    month = _month_of(post["created_at"])
+
+    state["posts"][post["id"]] = {
+        "month": month,
+        "up": post.get("upvotes", 0) or 0,
+        "down": post.get("downvotes", 0) or 0,
+        "comments": 0,
+        "root_comments": 0,
+        "integrity": (
+            float(post["ai_integrity_score"])
+            if post.get("ai_integrity_score") is not None
+            else None
+        )
+    }
+    state["months"][month] = state["months"].get(month, 0) + 1
+
+
+# -------------------------------------------------
+# REBUILD FROM HISTORY
+# -------------------------------------------------
+
+def build_rep_aggregates(rep_user_id, constituency_id, ctx: ScoringContext = None) -> dict:
+    """
+    Full state for one rep from its ScoringContext (a fixed handful
+    of bulk queries).
+    """
+    ctx = ctx or ScoringContext.load(rep_user_id, constituency_id)
+    state = empty_state()
+
+    for post in ctx.posts:
+        _add_post(state, post)
+
+        entry = state["posts"][post["id"]]
+        entry["comments"] = len(ctx.comments(post["id"]))
+        entry["root_comments"] = len(ctx.top_level_comments(post["id"]))
+
+    section = state["constituencies"][constituency_id] = _empty_section()
+
+    for issue in ctx.term_issues:
+        if issue.get("rep_user_id") != rep_user_id:
+            continue
+
+        _set_issue(section, issue["id"], _issue_entry(issue, issue.get("status"), issue.get("accepted_at")))
+
+    section["comments_on_others"] = sum(
+        1
+        for p in ctx.constituency_posts
+        if p.get("created_by_user_id") != rep_user_id
+        for c in ctx.top_level_comments(p["id"])
+        if c.get("user_id") == rep_user_id
+    )
+
+    section["issue_comments_total"] = len(ctx.issue_comments)
+    section["issue_comments"] = sum(1 for c in ctx.issue_comments if c.get("user_id") == rep_user_id)
+
+    return state
+
+
+def _issue_entry(issue: dict, status: str, accepted_at: str = None) -> dict:
+    response_hours = None
+    if accepted_at:
+        response_hours = (
+            _parse_ts(accepted_at) - _parse_ts(issue["created_at"])
+        ).total_seconds() / 3600
+
+    return {
+        "status": status,
+        "response_hours": response_hours,
+        "weight": issue_impact_weight(issue)
+    }
+
+
+def rebuild_rep_aggregates(rep_user_id, constituency_id, row: dict = None) -> dict:
+    """
+    Replaces the rep's row with a fresh build from history.
+
+    The write is a compare-and-set on the version read before the
+    build (an insert if there was no row), so a delta committed while
+    the history was being read makes the rebuild start over instead of
+    being overwritten. If another process rebuilt meanwhile, its state
+    is used.
+    """
+    for _ in range(AGGREGATE_MAX_RETRIES):
+        state = build_rep_aggregates(rep_user_id, constituency_id)
+
+        if row is None:
+            saved = create_rep_aggregates(rep_user_id, state)
+        else:
+            saved = compare_and_set_rep_aggregates(rep_user_id, row["version"], state, rebuilt=True)
+
+        if saved:
+            print(f"📊 Rebuilt score aggregates for rep {rep_user_id}")
+            return state
+
+        row = get_rep_aggregates(rep_user_id)
+        if row is not None and not _is_stale(row, constituency_id):
+            return row["state"]
+
+    # Still correct as of its read; the next rebuild persists it
+    print(f"⚠️ Score aggregates for rep {rep_user_id}: rebuild gave up after conflicts")
+    return state
+
+
+def _is_stale(row: dict, constituency_id) -> bool:
+    if constituency_id not in row["state"].get("constituencies", {}):
+        return True
+
+    rebuilt_at = row.get("rebuilt_at")
+    if not rebuilt_at:
+        return True
+
+    return utc_now() - _parse_ts(rebuilt_at) > timedelta(days=Config.REP_SCORE_REBUILD_DAYS)
+
+
+def get_rep_state(rep_user_id, constituency_id) -> dict:
+    row = get_rep_aggregates(rep_user_id)
+
+    if row is None or _is_stale(row, constituency_id):
+        return rebuild_rep_aggregates(rep_user_id, constituency_id, row)
+
+    return row["state"]
+
+
+# -------------------------------------------------
+# SCORE
+# -------------------------------------------------
+
+def score_from_aggregates(state: dict, constituency_id) -> dict:
+    """
+    Same breakdown as calculate_representative_score, from the
+    running totals only.
+    """
+    s = state["constituencies"].get(constituency_id) or _empty_section()
+    posts = list(state["posts"].values())
+
+    # Accountability
+    resolution = round(s["resolved"] / s["acted"] * 100, 2) if s["acted"] else 0.0
+    response = (
+        response_time_points(s["response_hours_sum"] / s["response_count"])
+        if s["response_count"] else 0.0
+    )
+    satisfaction = round(s["closed"] / s["resolved"] * 100, 2) if s["resolved"] else 0.0
+
+    # Engagement
+    if posts:
+        post_quality = post_quality_points(
+            sum(p["up"] + p["down"] + p["comments"] for p in posts) / len(posts)
+        )
+        consistency = consistency_points([n for n in state["months"].values() if n])
+    else:
+        post_quality = consistency = 0.0
+
+    # Issue comments count once per constituency issue comment, as in
+    # calculate_participation_depth_score
+    participation = participation_points(
+        s["comments_on_others"] + s["issue_comments"] * s["issue_comments_total"]
+    )
+
+    # Integrity
+    ai_scores = [p["integrity"] for p in posts if p["integrity"] is not None]
+    balance = round(mean(ai_scores), 2) if ai_scores else 50.0
+    controversy = controversy_penalty((p["up"], p["down"]) for p in posts) if posts else 0.0
+
+    # Impact
+    engagement_index = (
+        constituency_engagement_points(sum(p["root_comments"] + p["up"] for p in posts))
+        if posts else 0.0
+    )
+    scope = issue_scope_points(s["impact"]) if s["resolved"] else 0.0
+
+    return composite_score(
+        accountability_dimension(resolution, response, satisfaction),
+        engagement_dimension(post_quality, consistency, participation),
+        integrity_dimension(balance, controversy),
+        impact_dimension(engagement_index, scope)
+    )
+
+
+def get_incremental_rep_score(rep_user_id, constituency_id) -> dict:
+    return score_from_aggregates(get_rep_state(rep_user_id, constituency_id), constituency_id)
+
+
+# -------------------------------------------------
+# DELTAS
+# -------------------------------------------------
+
+def _get_post_owner(post_id):
+    return fetch_one(
+        REP_POLICY_POSTS_TABLE,
+        {"id": post_id},
+        use_admin=True,
+        columns=["id", "created_by_user_id", "constituency_id"]
+    )
+
+
+def _apply(rows, mutate):
+    """
+    mutate(state, rep_user_id) → True if it changed anything.
+    Only existing rows are updated; missing reps are built on read.
+    """
+    for row in rows:
+        rep_user_id = row["rep_user_id"]
+
+        for _ in range(AGGREGATE_MAX_RETRIES):
+            state = row["state"]
+            if not mutate(state, rep_user_id):
+                break
+            if compare_and_set_rep_aggregates(rep_user_id, row["version"], state):
+                break
+
+            row = get_rep_aggregates(rep_user_id)
+            if row is None:
+                break
+        else:
+            print(f"⚠️ Score aggregates for rep {rep_user_id}: gave up after conflicts")
+
+
+def _apply_to(rep_user_id, mutate):
+    row = get_rep_aggregates(rep_user_id)
+    if row:
+        _apply([row], mutate)
+
+
+def _hook(fn):
+    """
+    Aggregates are derived data: a failed update must never fail the
+    write that triggered it (the periodic rebuild catches up).
+    """
+    def wrapper(*args, **kwargs):
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            print(f"⚠️ Score aggregate update {fn.__name__} failed: {e}")
+
+    wrapper.__name__ = fn.__name__
+    wrapper.__doc__ = fn.__doc__
+    return wrapper
+
+
+@_hook
+def record_issue_status(issue_id, status, changed_at: str = None):
+    """
+    Issue moved to `status` (Accepted / In Progress / Resolved / ...).
+    """
+    issue = get_issue_by_id(issue_id)
+    if not issue:
+        return
+
+    constituency_id = issue["constituency_id"]
+    rep = get_term_rep(get_representatives_by_constituency(constituency_id))
+    if not rep or not is_issue_in_rep_term(issue, rep):
+        return
+
+    changed_at = changed_at or utc_now().isoformat()
+
+    def mutate(state, rep_user_id):
+        section = state["constituencies"].get(constituency_id)
+        if section is None:
+            return False
+
+        old = section["issues"].get(issue_id)
+        entry = _issue_entry(issue, status)
+        # Response time runs to the FIRST acceptance
+        entry["response_hours"] = old["response_hours"] if old else None
+        if entry["response_hours"] is None and status == "Accepted":
+            entry["response_hours"] = _issue_entry(issue, status, changed_at)["response_hours"]
+
+        if entry == old:
+            return False
+
+        _set_issue(section, issue_id, entry)
+        return True
+
+    _apply_to(rep["user_id"], mutate)
+
+
+@_hook
+def record_issue_comment(issue_id, user_id):
+    issue = get_issue_by_id(issue_id)
+    if not issue:
+        return
+
+    constituency_id = issue["constituency_id"]
+    rep_user_ids = [r["user_id"] for r in get_representatives_by_constituency(constituency_id)]
+
+    def mutate(state, rep_user_id):
+        section = state["constituencies"].get(constituency_id)
+        if section is None:
+            return False
+
+        section["issue_comments_total"] += 1
+        if user_id == rep_user_id:
+            section["issue_comments"] += 1
+        return True
+
+    _apply(get_rep_aggregates_for_users(rep_user_ids), mutate)
+
+
+@_hook
+def record_policy_post(post: dict):
+    def mutate(state, rep_user_id):
+        if post["id"] in state["posts"]:
+            return False
+
+        _add_post(state, post)
+        return True
+
+    _apply_to(post["created_by_user_id"], mutate)
+
+
+@_hook
+def record_policy_vote(post_id, old_value, new_value):
+    """
+    old_value / new_value → 1, -1 or None (no vote).
+    """
+    post = _get_post_owner(post_id)
+    if not post:
+        return
+
+    def mutate(state, rep_user_id):
+        entry = state["posts"].get(post_id)
+        if entry is None:
+            return False
+
+        entry["up"] += (new_value == 1) - (old_value == 1)
+        entry["down"] += (new_value == -1) - (old_value == -1)
+        return True
+
+    _apply_to(post["created_by_user_id"], mutate)
+
+
+@_hook
+def record_policy_comment(post_id, user_id, parent_comment_id=None):
+    post = _get_post_owner(post_id)
+    if not post:
+        return
+
+    author_id = post["created_by_user_id"]
+    constituency_id = post["constituency_id"]
+    is_root = not parent_comment_id
+
+    def count_on_post(state, rep_user_id):
+        entry = state["posts"].get(post_id)
+        if entry is None:
+            return False
+
+        entry["comments"] += 1
+        entry["root_comments"] += is_root
+        return True
+
+    _apply_to(author_id, count_on_post)
+
+    if is_root and user_id and user_id != author_id:
+        def count_participation(state, rep_user_id):
+            section = state["constituencies"].get(constituency_id)
+            if section is None:
+                return False
+
+            section["comments_on_others"] += 1
+            return True
+
+        _apply_to(user_id, count_participation)
+
+
+@_hook
+def record_post_integrity(post_id, integrity_score):
+    post = _get_post_owner(post_id)
+    if not post:
+        return
+
+    def mutate(state, rep_user_id):
+        entry = state["posts"].get(post_id)
+        if entry is None:
+            return False
+
+        entry["integrity"] = float(integrity_score) if integrity_score is not None else None
+        return True
+
+    _apply_to(post["created_by_user_id"], mutate)
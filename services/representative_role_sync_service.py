@@ -1,48 +1,123 @@
-from utils.helpers import today_ist
+import time
+from utils.helpers import today_ist, utc_now
 from models.representative import (
-    get_active_representatives,
     get_all_representatives,
-    get_terminated_representatives
+    get_representatives_by_users
 )
-from models.user import update_user_role
-from utils.helpers import utc_now
+from models.user import get_users_by_ids, bulk_update_user_roles
+from models.sync_watermark import get_watermark, set_watermark
 
 
-def sync_user_roles_from_representatives():
+ROLE_SYNC_WATERMARK = "representative_roles"
+
+REP_SYNC_COLUMNS = [
+    "user_id", "type", "status", "term_start", "term_end",
+    "created_at", "terminated_at"
+]
+
+
+def _desired_role(reps: list, today: str) -> str:
     """
-    Synchronizes user roles based on representative status.
-    SAFE to run multiple times.
+    ELECTED_REP / OPPOSITION_REP while a non-terminated term covers
+    today, CITIZEN otherwise.
+    """
+    role = "CITIZEN"
+
+    for rep in reps:
+        if rep.get("status") == "TERMINATED":
+            continue
+
+        if rep["term_start"] <= today <= rep["term_end"]:
+            role = rep["type"]
+
+    return role
+
+
+def sync_user_roles_for_users(user_ids) -> dict:
+    """
+    Recomputes roles for the given users only and writes the ones
+    that changed in a single bulk upsert.
     """
+    started = time.perf_counter()
 
-    today = today_ist()
+    user_ids = [u for u in dict.fromkeys(user_ids) if u]
+    if not user_ids:
+        return {"checked": 0, "updated": 0, "duration_ms": 0}
 
-    # 1️⃣ Active representatives
-    active_reps = get_active_representatives(today)
-    active_user_roles = {}
+    today = today_ist().isoformat()
 
-    for rep in active_reps:
-        if rep.get("user_id"):
-            active_user_roles[rep["user_id"]] = rep["type"]
+    reps_by_user = {}
+    for rep in get_representatives_by_users(user_ids, columns=REP_SYNC_COLUMNS):
+        reps_by_user.setdefault(rep["user_id"], []).append(rep)
 
-    # Assign roles to active reps
-    for user_id, role in active_user_roles.items():
-        update_user_role(user_id, role)
+    users = get_users_by_ids(user_ids)
 
-    # 2️⃣ Explicitly downgrade TERMINATED reps
-    terminated_reps = get_terminated_representatives(utc_now().date())
+    changed = {}
+    for user_id in user_ids:
+        user = users.get(user_id)
+        if not user:
+            continue
 
-    for rep in terminated_reps:
-        if rep.get("user_id"):
-            update_user_role(rep["user_id"], "CITIZEN")
+        role = _desired_role(reps_by_user.get(user_id, []), today)
+        if user.get("role") != role:
+            changed[user_id] = role
 
-    # 3️⃣ Handle expired terms (not active anymore but not terminated)
-    all_reps = get_all_representatives()
+    bulk_update_user_roles(changed)
 
-    all_rep_users = {
-        r["user_id"] for r in all_reps if r.get("user_id")
+    summary = {
+        "checked": len(user_ids),
+        "updated": len(changed),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2)
     }
+    print(f"Role sync: {summary}")
+    return summary
+
+
+def _touched_since(rep: dict, since: str, since_date: str, today: str) -> bool:
+    """
+    True if this rep row may have changed its holder's role since the
+    watermark: new row, termination, a term starting, or a term ending.
+    """
+    if (rep.get("created_at") or "") > since:
+        return True
+
+    if (rep.get("terminated_at") or "") > since:
+        return True
+
+    if since_date < rep["term_start"] <= today:
+        return True
+
+    # Term ends are inclusive, so the role flips the day after term_end
+    return since_date <= rep["term_end"] < today
+
+
+def sync_user_roles_from_representatives(full: bool = False) -> dict:
+    """
+    Scheduled role sync.
+
+    Reads the representatives table once (projected), picks the users
+    whose rep rows changed since the last run's watermark and syncs
+    only those. full=True (or no watermark yet) checks every rep user.
+    SAFE to run multiple times.
+    """
+    run_started_at = utc_now().isoformat()
+    today = today_ist().isoformat()
+
+    since = None if full else get_watermark(ROLE_SYNC_WATERMARK)
+
+    reps = get_all_representatives(columns=REP_SYNC_COLUMNS)
+
+    if since is None:
+        user_ids = [r["user_id"] for r in reps]
+    else:
+        since_date = since[:10]
+        user_ids = [
+            r["user_id"] for r in reps
+            if _touched_since(r, since, since_date, today)
+        ]
+
+    summary = sync_user_roles_for_users(user_ids)
 
-    expired_users = all_rep_users - set(active_user_roles.keys())
+    set_watermark(ROLE_SYNC_WATERMARK, run_started_at)
 
-    for user_id in expired_users:
-        update_user_role(user_id, "CITIZEN")
\ No newline at end of file
+    return summary
@@ -28,26 +28,89 @@ FINAL_SCORE = (Accountability × 0.40) + (Engagement × 0.30) + (Integrity × 0.
 
 from datetime import datetime, timedelta
 from models.representative import get_rep_score
-from models.issue import get_issues_by_constituency, get_issue_by_id, get_issues_for_elected_rep_term,get_issues_with_acceptance_time
+from models.issue import get_issues_by_constituency, get_issues_with_acceptance_time
 from models.rep_policy import get_policy_posts_by_constituency, get_policy_posts_by_user
-from models.rep_policy_comments import get_policy_comments
-from supabase_db.db import fetch_all, fetch_one
+from supabase_db.db import fetch_many, fetch_grouped
 from statistics import mean, stdev
+from utils.instrumentation import track_operations
 import math
 
 
+# ============================================================================
+# SCORING CONTEXT
+# ============================================================================
+
+class ScoringContext:
+    """
+    Everything one rep's score reads, loaded once with bulk queries:
+
+    posts              → the rep's policy posts (newest first)
+    constituency_posts → every policy post in the constituency
+    comments_by_post   → {post_id: [comments]} for both post lists
+    term_issues        → issues of the elected rep's term, with
+                         rep_user_id and accepted_at
+    issue_comments     → every comment on the constituency's issues
+    """
+
+    def __init__(self, rep_user_id, constituency_id, posts, constituency_posts,
+                 comments_by_post, term_issues, issue_comments):
+        self.rep_user_id = rep_user_id
+        self.constituency_id = constituency_id
+        self.posts = posts
+        self.constituency_posts = constituency_posts
+        self.comments_by_post = comments_by_post
+        self.term_issues = term_issues
+        self.issue_comments = issue_comments
+
+    @classmethod
+    def load(cls, rep_user_id: str, constituency_id: str):
+        posts = get_policy_posts_by_user(rep_user_id)
+        constituency_posts = get_policy_posts_by_constituency(constituency_id)
+
+        comments_by_post = fetch_grouped(
+            "rep_policy_comments",
+            "post_id",
+            [p["id"] for p in posts + constituency_posts]
+        )
+
+        issues = get_issues_by_constituency(constituency_id) or []
+        term_issues = get_issues_with_acceptance_time(constituency_id, issues)
+        issue_comments = fetch_many("issue_comments", "issue_id", [i["id"] for i in issues])
+
+        return cls(
+            rep_user_id, constituency_id, posts, constituency_posts,
+            comments_by_post, term_issues, issue_comments
+        )
+
+    def comments(self, post_id) -> list:
+        return self.comments_by_post.get(post_id, [])
+
+    def top_level_comments(self, post_id) -> list:
+        """
+        The thread roots get_policy_comments returns: comments without
+        a parent on the same post.
+        """
+        comments = self.comments(post_id)
+        ids = {c["id"] for c in comments}
+        return [c for c in comments if c.get("parent_comment_id") not in ids]
+
+
+def _context(ctx, rep_user_id, constituency_id) -> ScoringContext:
+    return ctx or ScoringContext.load(rep_user_id, constituency_id)
+
+
 # ============================================================================
 # ACCOUNTABILITY DIMENSION (40%)
 # ============================================================================
 
-def calculate_issue_resolution_rate(rep_user_id: str, constituency_id: str) -> float:
+def calculate_issue_resolution_rate(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Calculate the percentage of issues accepted by this rep that were resolved.
     
     Returns:
         float: Score from 0-100 (0% = 0 points, 100% = 100 points)
     """
-    issues = get_issues_for_elected_rep_term(constituency_id)
+    issues = _context(ctx, rep_user_id, constituency_id).term_issues
     
     # Filter issues that rep has taken action on
     accepted_issues = [
@@ -65,7 +128,7 @@ def calculate_issue_resolution_rate(rep_user_id: str, constituency_id: str) -> f
     return round(resolution_rate * 100, 2)
 
 
-def calculate_response_time_score(rep_user_id: str, constituency_id: str) -> float:
+def calculate_response_time_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Calculate score based on average response time to issues.
     
@@ -79,7 +142,7 @@ def calculate_response_time_score(rep_user_id: str, constituency_id: str) -> flo
     Returns:
         float: Score from 0-100
     """
-    issues = get_issues_with_acceptance_time(constituency_id)
+    issues = _context(ctx, rep_user_id, constituency_id).term_issues
     accepted_issues = [
         i for i in issues 
         if i.get("rep_user_id") == rep_user_id
@@ -102,9 +165,13 @@ def calculate_response_time_score(rep_user_id: str, constituency_id: str) -> flo
     if not response_times:
         return 0.0
     
-    avg_response_time = mean(response_times)
-    
-    # Scoring rubric
+    return response_time_points(mean(response_times))
+
+
+def response_time_points(avg_response_time: float) -> float:
+    """
+    Rubric for average hours from issue creation to acceptance.
+    """
     if avg_response_time <= 24:
         return 100.0
     elif avg_response_time <= 72:
@@ -117,14 +184,14 @@ def calculate_response_time_score(rep_user_id: str, constituency_id: str) -> flo
         return 20.0
 
 
-def calculate_citizen_satisfaction_score(rep_user_id: str, constituency_id: str) -> float:
+def calculate_citizen_satisfaction_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Calculate based on percentage of issues where citizen confirmed resolution.
     
     Returns:
         float: Score from 0-100 (percentage of confirmed resolutions)
     """
-    issues = get_issues_for_elected_rep_term(constituency_id)
+    issues = _context(ctx, rep_user_id, constituency_id).term_issues
     resolved_issues = [
         i for i in issues
         if i.get("rep_user_id") == rep_user_id
@@ -145,7 +212,7 @@ def calculate_citizen_satisfaction_score(rep_user_id: str, constituency_id: str)
 
 
 
-def get_accountability_score(rep_user_id: str, constituency_id: str) -> dict:
+def get_accountability_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> dict:
     """
     Calculate overall Accountability Dimension (40% weight).
     
@@ -157,10 +224,16 @@ def get_accountability_score(rep_user_id: str, constituency_id: str) -> dict:
             'total': float  # weighted average
         }
     """
-    resolution_rate = calculate_issue_resolution_rate(rep_user_id, constituency_id)
-    response_time = calculate_response_time_score(rep_user_id, constituency_id)
-    citizen_satisfaction = calculate_citizen_satisfaction_score(rep_user_id, constituency_id)
-    
+    ctx = _context(ctx, rep_user_id, constituency_id)
+
+    return accountability_dimension(
+        calculate_issue_resolution_rate(rep_user_id, constituency_id, ctx),
+        calculate_response_time_score(rep_user_id, constituency_id, ctx),
+        calculate_citizen_satisfaction_score(rep_user_id, constituency_id, ctx)
+    )
+
+
+def accountability_dimension(resolution_rate, response_time, citizen_satisfaction) -> dict:
     # Weighted formula: 50% resolution + 25% response + 25% satisfaction
     total = (resolution_rate * 0.50) + (response_time * 0.25) + (citizen_satisfaction * 0.25)
     
@@ -188,7 +261,7 @@ def count_comments_recursive(comments):
     return total
 
 
-def calculate_policy_post_quality_score(rep_user_id: str, constituency_id: str) -> float:
+def calculate_policy_post_quality_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Calculate quality of policy posts based on engagement metrics.
     
@@ -204,7 +277,8 @@ def calculate_policy_post_quality_score(rep_user_id: str, constituency_id: str)
     Returns:
         float: Score from 0-100
     """
-    posts = get_policy_posts_by_user(rep_user_id)
+    ctx = _context(ctx, rep_user_id, constituency_id)
+    posts = ctx.posts
     
     if not posts:
         return 0.0
@@ -213,11 +287,16 @@ def calculate_policy_post_quality_score(rep_user_id: str, constituency_id: str)
     for post in posts:
         upvotes = post.get("upvotes", 0) or 0
         downvotes = post.get("downvotes", 0) or 0
-        comments = get_policy_comments(post["id"])
-        comment_count = count_comments_recursive(comments) if comments else 0
+        # Every comment in the thread, replies included
+        comment_count = len(ctx.comments(post["id"]))
         total_engagement += upvotes + downvotes + comment_count
-    avg_engagement_per_post = total_engagement / len(posts)
-    
+    return post_quality_points(total_engagement / len(posts))
+
+
+def post_quality_points(avg_engagement_per_post: float) -> float:
+    """
+    Rubric for (votes + comments) per post.
+    """
     if avg_engagement_per_post >= 30:
         return 100.0
     elif avg_engagement_per_post >= 15:
@@ -228,7 +307,7 @@ def calculate_policy_post_quality_score(rep_user_id: str, constituency_id: str)
         return 20.0
 
 
-def calculate_consistency_score(rep_user_id: str, constituency_id: str) -> float:
+def calculate_consistency_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Calculate consistency based on activity spread across term period.
     
@@ -242,7 +321,7 @@ def calculate_consistency_score(rep_user_id: str, constituency_id: str) -> float
     Returns:
         float: Score from 0-100
     """
-    posts = get_policy_posts_by_user(rep_user_id)
+    posts = _context(ctx, rep_user_id, constituency_id).posts
     
     if not posts:
         return 0.0
@@ -253,13 +332,17 @@ def calculate_consistency_score(rep_user_id: str, constituency_id: str) -> float
         created_at = datetime.fromisoformat(post["created_at"].replace("Z", "+00:00"))
         month_key = created_at.strftime("%Y-%m")
         post_months[month_key] = post_months.get(month_key, 0) + 1
-    
-    if len(post_months) == 0:
+
+    return consistency_points(list(post_months.values()))
+
+
+def consistency_points(activity_counts: list) -> float:
+    """
+    Rubric for the spread of posts per active month.
+    """
+    if len(activity_counts) == 0:
         return 0.0
     
-    # Calculate variance in activity
-    activity_counts = list(post_months.values())
-    
     if len(activity_counts) == 1:
         return 50.0  # Only one month of activity
     
@@ -277,9 +360,7 @@ def calculate_consistency_score(rep_user_id: str, constituency_id: str) -> float
     else:
         return 20.0
 
-from models.issue import get_issue_comments_by_constituency
-
-def calculate_participation_depth_score(rep_user_id: str, constituency_id: str) -> float:
+def calculate_participation_depth_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Calculate depth of participation in debates, comments, and discussions.
     
@@ -292,38 +373,43 @@ def calculate_participation_depth_score(rep_user_id: str, constituency_id: str)
         float: Score from 0-100
     """
     try:
+        ctx = _context(ctx, rep_user_id, constituency_id)
+
         # Count comments made by this rep on OTHER reps' posts
         total_comments_made = 0
         
         # Get all policy posts in constituency
-        posts = get_policy_posts_by_constituency(constituency_id)
+        posts = ctx.constituency_posts
         for post in posts:
             if post.get("created_by_user_id") != rep_user_id:  # Comments on OTHER reps' posts
-                print(post["id"])
-                comments = get_policy_comments(post["id"])
+                comments = ctx.top_level_comments(post["id"])
                 rep_comments = [c for c in comments if c.get("user_id") == rep_user_id]
                 total_comments_made += len(rep_comments)
 
-        comments=get_issue_comments_by_constituency(constituency_id)
+        comments = ctx.issue_comments
         for c in comments:
             rep_comments = [c for c in comments if c.get("user_id") == rep_user_id]
             total_comments_made += len(rep_comments)
-        # Scoring rubric
-        if total_comments_made >= 50:
-            return 100.0
-        elif total_comments_made >= 30:
-            return 80.0
-        elif total_comments_made >= 10:
-            return 60.0
-        elif total_comments_made > 0:
-            return 40.0
-        else:
-            return 0.0
+
+        return participation_points(total_comments_made)
     except Exception:
         return 0.0
 
 
-def get_engagement_score(rep_user_id: str, constituency_id: str) -> dict:
+def participation_points(total_comments_made: int) -> float:
+    if total_comments_made >= 50:
+        return 100.0
+    elif total_comments_made >= 30:
+        return 80.0
+    elif total_comments_made >= 10:
+        return 60.0
+    elif total_comments_made > 0:
+        return 40.0
+    else:
+        return 0.0
+
+
+def get_engagement_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> dict:
     """
     Calculate overall Engagement Dimension (30% weight).
     
@@ -335,10 +421,16 @@ def get_engagement_score(rep_user_id: str, constituency_id: str) -> dict:
             'total': float  # weighted average
         }
     """
-    post_quality = calculate_policy_post_quality_score(rep_user_id, constituency_id)
-    consistency = calculate_consistency_score(rep_user_id, constituency_id)
-    participation = calculate_participation_depth_score(rep_user_id, constituency_id)
-    
+    ctx = _context(ctx, rep_user_id, constituency_id)
+
+    return engagement_dimension(
+        calculate_policy_post_quality_score(rep_user_id, constituency_id, ctx),
+        calculate_consistency_score(rep_user_id, constituency_id, ctx),
+        calculate_participation_depth_score(rep_user_id, constituency_id, ctx)
+    )
+
+
+def engagement_dimension(post_quality, consistency, participation) -> dict:
     # Weighted formula: 60% quality + 30% consistency + 10% participation
     total = (post_quality * 0.60) + (consistency * 0.30) + (participation * 0.10)
     
@@ -354,7 +446,7 @@ def get_engagement_score(rep_user_id: str, constituency_id: str) -> dict:
 # INTEGRITY DIMENSION (20%)
 # ============================================================================
 
-def calculate_discourse_balance_score(rep_user_id: str, constituency_id: str) -> float:
+def calculate_discourse_balance_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Calculate AI assessment of balanced, fair discourse.
     
@@ -363,7 +455,7 @@ def calculate_discourse_balance_score(rep_user_id: str, constituency_id: str) ->
     Returns:
         float: Score from 0-100 (average AI confidence score)
     """
-    posts = get_policy_posts_by_user(rep_user_id)
+    posts = _context(ctx, rep_user_id, constituency_id).posts
     if not posts:
         return 50.0  # Neutral if no posts
     
@@ -377,7 +469,7 @@ def calculate_discourse_balance_score(rep_user_id: str, constituency_id: str) ->
         return 50.0
     return round(mean(ai_scores), 2)
 
-def calculate_controversy_penalty(rep_user_id: str, constituency_id: str) -> float:
+def calculate_controversy_penalty(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Calculate penalty for controversial or negative behavior.
     
@@ -389,15 +481,24 @@ def calculate_controversy_penalty(rep_user_id: str, constituency_id: str) -> flo
     Returns:
         float: Penalty score (negative value)
     """
-    posts = get_policy_posts_by_user(rep_user_id)
+    posts = _context(ctx, rep_user_id, constituency_id).posts
     
     if not posts:
         return 0.0  # No penalty if no posts
+
+    return controversy_penalty(
+        (post.get("upvotes", 0) or 0, post.get("downvotes", 0) or 0)
+        for post in posts
+    )
+
+
+def controversy_penalty(post_votes) -> float:
+    """
+    Penalty over (upvotes, downvotes) pairs, one per post.
+    """
     total_penalty = 0
-    
-    for post in posts:
-        upvotes = post.get("upvotes", 0) or 0
-        downvotes = post.get("downvotes", 0) or 0
+
+    for upvotes, downvotes in post_votes:
         total_votes = upvotes + downvotes
         
         if total_votes > 0:
@@ -412,7 +513,7 @@ def calculate_controversy_penalty(rep_user_id: str, constituency_id: str) -> flo
     return max(total_penalty, -30.0)
 
 
-def get_integrity_score(rep_user_id: str, constituency_id: str) -> dict:
+def get_integrity_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> dict:
     """
     Calculate overall Integrity Dimension (20% weight).
     
@@ -423,9 +524,15 @@ def get_integrity_score(rep_user_id: str, constituency_id: str) -> dict:
             'total': float  # balance - penalty
         }
     """
-    balance = calculate_discourse_balance_score(rep_user_id, constituency_id)
-    controversy = calculate_controversy_penalty(rep_user_id, constituency_id)
-    
+    ctx = _context(ctx, rep_user_id, constituency_id)
+
+    return integrity_dimension(
+        calculate_discourse_balance_score(rep_user_id, constituency_id, ctx),
+        calculate_controversy_penalty(rep_user_id, constituency_id, ctx)
+    )
+
+
+def integrity_dimension(balance, controversy) -> dict:
     # Total = balance score plus controversy penalty
     total = max(0, balance + controversy)  # Can't go below 0
     
@@ -440,7 +547,7 @@ def get_integrity_score(rep_user_id: str, constituency_id: str) -> dict:
 # IMPACT DIMENSION (10%)
 # ============================================================================
 
-def calculate_constituency_engagement_index(rep_user_id: str, constituency_id: str) -> float:
+def calculate_constituency_engagement_index(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Measure how engaged the constituency is with this representative.
     
@@ -451,7 +558,8 @@ def calculate_constituency_engagement_index(rep_user_id: str, constituency_id: s
     Returns:
         float: Score from 0-100
     """
-    posts = get_policy_posts_by_user(rep_user_id)
+    ctx = _context(ctx, rep_user_id, constituency_id)
+    posts = ctx.posts
     
     if not posts:
         return 0.0
@@ -461,11 +569,16 @@ def calculate_constituency_engagement_index(rep_user_id: str, constituency_id: s
     total_engagement = 0
     
     for post in posts:
-        comments = get_policy_comments(post["id"])
+        comments = ctx.top_level_comments(post["id"])
         for comment in comments:
             unique_commenters.add(comment.get("user_id"))
             total_engagement += 1
         total_engagement += post.get("upvotes", 0) or 0
+
+    return constituency_engagement_points(total_engagement)
+
+
+def constituency_engagement_points(total_engagement: int) -> float:
     # Scoring: more unique engaged citizens = higher score
     if total_engagement >= 100:
         return 100.0
@@ -479,7 +592,7 @@ def calculate_constituency_engagement_index(rep_user_id: str, constituency_id: s
         return max(20.0, total_engagement * 4)
 
 
-def calculate_issue_scope_impact(rep_user_id: str, constituency_id: str) -> float:
+def calculate_issue_scope_impact(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> float:
     """
     Measure impact based on severity/scope of issues resolved.
     
@@ -491,7 +604,7 @@ def calculate_issue_scope_impact(rep_user_id: str, constituency_id: str) -> floa
     Returns:
         float: Score 0-100 (capped)
     """
-    issues = get_issues_for_elected_rep_term(constituency_id)
+    issues = _context(ctx, rep_user_id, constituency_id).term_issues
     resolved_issues = [
         i for i in issues 
         if i.get("rep_user_id") == rep_user_id
@@ -501,24 +614,28 @@ def calculate_issue_scope_impact(rep_user_id: str, constituency_id: str) -> floa
     if not resolved_issues:
         return 0.0
     
-    critical_keywords = ["health", "safety", "emergency", "critical", "urgent"]
-    major_keywords = ["infrastructure", "transport", "water", "electricity", "road", "street", "education", "public service","sanitation"]
-    
-    total_impact = 0
-    
-    for issue in resolved_issues:
-        category = issue.get("category", "").lower()
-        title = issue.get("title", "").lower()
-        description = issue.get("description", "").lower()
-        
-        # Check category and title for keywords
-        if any(keyword in category or keyword in title or keyword in description for keyword in critical_keywords):
-            total_impact += 100
-        elif any(keyword in category or keyword in title or keyword in description for keyword in major_keywords):
-            total_impact += 60
-        else:
-            total_impact += 30
-    
+    return issue_scope_points(sum(issue_impact_weight(i) for i in resolved_issues))
+
+
+CRITICAL_KEYWORDS = ["health", "safety", "emergency", "critical", "urgent"]
+MAJOR_KEYWORDS = ["infrastructure", "transport", "water", "electricity", "road", "street", "education", "public service","sanitation"]
+
+
+def issue_impact_weight(issue: dict) -> int:
+    category = issue.get("category", "").lower()
+    title = issue.get("title", "").lower()
+    description = issue.get("description", "").lower()
+
+    # Check category and title for keywords
+    if any(keyword in category or keyword in title or keyword in description for keyword in CRITICAL_KEYWORDS):
+        return 100
+    elif any(keyword in category or keyword in title or keyword in description for keyword in MAJOR_KEYWORDS):
+        return 60
+    else:
+        return 30
+
+
+def issue_scope_points(total_impact: float) -> float:
     # Normalize to 0-100 scale
     # Assuming average rep resolves 5-10 issues
     normalized_score = min(100.0, (total_impact / 30) * 10)
@@ -526,7 +643,7 @@ def calculate_issue_scope_impact(rep_user_id: str, constituency_id: str) -> floa
     return round(normalized_score, 2)
 
 
-def get_impact_score(rep_user_id: str, constituency_id: str) -> dict:
+def get_impact_score(rep_user_id: str, constituency_id: str, ctx: ScoringContext = None) -> dict:
     """
     Calculate overall Impact Dimension (10% weight).
     
@@ -537,9 +654,15 @@ def get_impact_score(rep_user_id: str, constituency_id: str) -> dict:
             'total': float  # weighted average
         }
     """
-    engagement = calculate_constituency_engagement_index(rep_user_id, constituency_id)
-    scope_impact = calculate_issue_scope_impact(rep_user_id, constituency_id)
-    
+    ctx = _context(ctx, rep_user_id, constituency_id)
+
+    return impact_dimension(
+        calculate_constituency_engagement_index(rep_user_id, constituency_id, ctx),
+        calculate_issue_scope_impact(rep_user_id, constituency_id, ctx)
+    )
+
+
+def impact_dimension(engagement, scope_impact) -> dict:
     # Weighted formula: 50% engagement + 50% scope impact
     total = (engagement * 0.50) + (scope_impact * 0.50)
     
@@ -554,23 +677,62 @@ def get_impact_score(rep_user_id: str, constituency_id: str) -> dict:
 # FINAL COMPOSITE SCORE
 # ============================================================================
 
-def calculate_representative_score(rep_user_id: str, constituency_id: str) -> dict:
+def calculate_representative_score(
+    rep_user_id: str,
+    constituency_id: str,
+    ctx: ScoringContext = None,
+    profile: bool = False
+) -> dict:
     """
     Calculate comprehensive representative performance score.
     
     Formula:
     FINAL_SCORE = (Accountability × 0.40) + (Engagement × 0.30) 
                   + (Integrity × 0.20) + (Impact × 0.10)
+
+    All dimensions read one ScoringContext. With profile=True the
+    result also carries "profile": {stage: {"db_queries", "elapsed_ms"}}
+    for the load and each dimension.
     
     Returns:
         dict: Complete scoring breakdown with final score
     """
+    stages = {}
 
-    accountability = get_accountability_score(rep_user_id, constituency_id)
-    engagement = get_engagement_score(rep_user_id, constituency_id)
-    integrity = get_integrity_score(rep_user_id, constituency_id)
-    impact = get_impact_score(rep_user_id, constituency_id)
-    
+    def run(stage, fn, *args):
+        if not profile:
+            return fn(*args)
+
+        with track_operations() as stats:
+            result = fn(*args)
+
+        stages[stage] = {
+            "db_queries": stats.total("db_queries"),
+            "elapsed_ms": stats.elapsed_ms
+        }
+        return result
+
+    if ctx is None:
+        ctx = run("load", ScoringContext.load, rep_user_id, constituency_id)
+
+    score = composite_score(
+        run("accountability", get_accountability_score, rep_user_id, constituency_id, ctx),
+        run("engagement", get_engagement_score, rep_user_id, constituency_id, ctx),
+        run("integrity", get_integrity_score, rep_user_id, constituency_id, ctx),
+        run("impact", get_impact_score, rep_user_id, constituency_id, ctx)
+    )
+
+    if profile:
+        score["profile"] = stages
+        print(f"📊 Rep score profile {rep_user_id}: {stages}")
+
+    return score
+
+
+def composite_score(accountability, engagement, integrity, impact) -> dict:
+    """
+    Combines the four dimension dicts into the final score + rating.
+    """
     # Weighted composite score
     final_score = (
         (accountability['total'] * 0.40) +
@@ -4,7 +4,7 @@ from models.representative import (
     update_record
 )
 from utils.helpers import utc_now
-from services.representative_role_sync_service import sync_user_roles_from_representatives
+from services.representative_role_sync_service import sync_user_roles_for_users
 from models.notification import create_notification
 from models.constituency import get_constituency_by_id,get_state_id_by_constituency_id
 
@@ -24,7 +24,7 @@ def terminate_constituency_terms(constituency_id: str):
                 },
                 use_admin=True
             )
-    sync_user_roles_from_representatives()
+    sync_user_roles_for_users([r.get("user_id") for r in reps])
     constituency = get_constituency_by_id(constituency_id)
     state_id = get_state_id_by_constituency_id(constituency_id)
 
@@ -50,4 +50,4 @@ def completed_constituency_terms(constituency_id: str):
                 },
                 use_admin=True
             )
-    sync_user_roles_from_representatives()
\ No newline at end of file
+    sync_user_roles_for_users([r.get("user_id") for r in reps])
\ No newline at end of file
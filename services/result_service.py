@@ -1,6 +1,9 @@
 from utils.crypto import uuid_to_uint256
-from services.blockchain_reader import get_votes_from_chain
-from models.candidate import get_candidates_by_election_and_constituency, get_user_id_by_candidate_id 
+from services.blockchain_reader import get_vote_counts_from_chain
+from models.candidate import (
+    get_candidate_view,
+    get_candidates_by_election_and_constituency
+)
 import random
 from models.election import get_election_by_id
 from utils.helpers import utc_now
@@ -21,6 +24,11 @@ def get_final_constituency_results(election_id, constituency_id):
     if utc_now().isoformat() <= election["end_time"]:
         raise ValueError("Election not completed yet")
 
+    # Closed elections are served from the materialized snapshot
+    if election["status"] == "COMPLETED":
+        from services.election_snapshot_service import get_snapshot_constituency_results
+        return get_snapshot_constituency_results(election_id, constituency_id)
+
     # 1️⃣ Fetch candidates
     candidates = get_candidates_by_election_and_constituency(
         election_id=election_id,
@@ -38,20 +46,31 @@ def get_final_constituency_results(election_id, constituency_id):
             "votes": 0
         }
 
-    # 3️⃣ Count votes from blockchain
-    votes = get_votes_from_chain(election_id)
+    # 3️⃣ Vote counts from the indexed chain events
+    counts = get_vote_counts_from_chain(election_id)
 
-    for v in votes:
-        cid = str(v["candidate_id"])
-        if cid in candidate_map:
-            candidate_map[cid]["votes"] += 1
+    for cid, entry in candidate_map.items():
+        entry["votes"] = counts.get(cid, 0)
 
     results = list(candidate_map.values())
 
-    # 4️⃣ Sort by votes DESC
+    # 4️⃣ Sort + winner / runner-up with tie handling
+    winner, runner_up = pick_winner_and_runner_up(results)
+
+    return {
+        "winner": winner,
+        "runner_up": runner_up,
+        "all_candidates": results
+    }
+
+
+def pick_winner_and_runner_up(results: list):
+    """
+    Sorts results by votes DESC (in place) and picks the winner and
+    runner-up; ties are broken at random among the tied candidates.
+    """
     results.sort(key=lambda x: x["votes"], reverse=True)
 
-    # 5️⃣ Determine winner and runner-up with tie handling
     winner = None
     runner_up = None
 
@@ -61,7 +80,7 @@ def get_final_constituency_results(election_id, constituency_id):
 
         winner = random.choice(top_candidates)
 
-        remaining = [c for c in results if c != winner]
+        remaining = [c for c in results if c is not winner]
 
         if remaining:
             second_votes = remaining[0]["votes"]
@@ -70,43 +89,60 @@ def get_final_constituency_results(election_id, constituency_id):
             ]
             runner_up = random.choice(second_candidates)
 
-    return {
-        "winner": winner,
-        "runner_up": runner_up,
-        "all_candidates": results
-    }
+    return winner, runner_up
 
 
 def get_constituency_results(election_id, constituency_id):
 
-    candidates = get_candidates_by_election_and_constituency(
-        election_id=election_id,
-        constituency_id=constituency_id
-    )
+    return tally_election_results(
+        election_id,
+        constituency_ids=[constituency_id]
+    ).get(constituency_id, [])
 
-    candidate_map = {}
 
-    # 🔑 IMPORTANT: map using uint256(candidate_id)
-    for c in candidates:
-        candidate_uint = str(uuid_to_uint256(c["id"]))
-        user_id = get_user_id_by_candidate_id(c["id"])
+def tally_election_results(election_id, constituency_ids=None, max_staleness: float = None) -> dict:
+    """
+    Vote counts for every constituency of an election in one pass.
+
+    - one cached candidate view for the whole election
+    - one read of the indexed chain counts, mapped back through a
+      uint256(candidate_id) -> candidate index
+
+    Returns { constituency_id: [candidate result, ...] } with the same
+    rows as get_constituency_results. constituency_ids limits the
+    output (constituencies without candidates map to []).
+    max_staleness is passed to the event index (0 = sync first).
+    """
 
-        candidate_map[candidate_uint] = {
-            "candidate_id": c["id"], 
-            "user_id": user_id,      
+    candidates = get_candidate_view(election_id)
+
+    if constituency_ids is not None:
+        wanted = set(constituency_ids)
+        candidates = [c for c in candidates if c["constituency_id"] in wanted]
+
+    results = {cid: [] for cid in (constituency_ids or [])}
+
+    # 🔑 IMPORTANT: chain events carry uint256(candidate_id)
+    by_uint = {}
+
+    for c in candidates:
+        entry = {
+            "candidate_id": c["id"],
+            "user_id": c["user_id"],
             "candidate_name": c["candidate_name"],
             "party_name": c["party_name"],
             "votes": 0
         }
+        by_uint[str(uuid_to_uint256(c["id"]))] = entry
+        results.setdefault(c["constituency_id"], []).append(entry)
 
-    # Read blockchain events
-    votes = get_votes_from_chain(election_id)
-
-    for v in votes:
-        cid = str(v["candidate_id"])  # uint256 from chain
-
-        if cid in candidate_map:
-            candidate_map[cid]["votes"] += 1
+    if not by_uint:
+        return results
 
-    return list(candidate_map.values())
+    # Indexed blockchain counts (uint256 candidate id -> votes)
+    for cid, votes in get_vote_counts_from_chain(election_id, max_staleness).items():
+        entry = by_uint.get(cid)
+        if entry:
+            entry["votes"] = votes
 
+    return results
@@ -0,0 +1,297 @@
+# services/vote_event_indexer.py
+#
+# Local index of on-chain VoteCast events.
+#
+# Instead of every tally re-reading get_logs(from_block=0), a cursor
+# remembers the last indexed block and new blocks are ingested in
+# fixed-size pages. Events and per-(election, candidate) counts are kept
+# in a SQLite file, updated in the same transaction as the cursor, so a
+# crash mid-page never double counts.
+#
+# The log source is pluggable: by default it reads the contract, but
+# RecordedLogSource replays logs saved as JSON, so the indexer can be
+# exercised against fixtures without a node.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from config import Config
+from utils.crypto import uuid_to_uint256
+from utils.instrumentation import record
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexer_state (
+    name        TEXT PRIMARY KEY,
+    last_block  INTEGER NOT NULL,
+    synced_at   REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS vote_events (
+    tx_hash      TEXT NOT NULL,
+    log_index    INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    election_id  TEXT NOT NULL,
+    candidate_id TEXT NOT NULL,
+    timestamp    INTEGER,
+    PRIMARY KEY (tx_hash, log_index)
+);
+
+CREATE INDEX IF NOT EXISTS vote_events_election
+    ON vote_events (election_id, block_number);
+
+CREATE TABLE IF NOT EXISTS vote_counts (
+    election_id  TEXT NOT NULL,
+    candidate_id TEXT NOT NULL,
+    votes        INTEGER NOT NULL,
+    PRIMARY KEY (election_id, candidate_id)
+);
+"""
+
+CURSOR_NAME = "VoteCast"
+
+
+# -------------------------------------------------
+# STORE
+# -------------------------------------------------
+
+class VoteEventStore:
+    """
+    SQLite-backed event store. uint256 ids are kept as decimal text
+    (they do not fit SQLite integers).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def last_block(self):
+        row = self._conn.execute(
+            "SELECT last_block, synced_at FROM indexer_state WHERE name = ?",
+            (CURSOR_NAME,)
+        ).fetchone()
+        return row if row else (None, None)
+
+    def apply_page(self, logs, to_block: int) -> int:
+        """
+        Ingests one page of logs and moves the cursor to `to_block`
+        atomically. Already-seen logs (same tx_hash, log_index) are
+        ignored. Returns the number of new events.
+        """
+        added = 0
+
+        with self._lock, self._conn:
+            for log in logs:
+                args = log["args"]
+                election_id = str(args["electionId"])
+                candidate_id = str(args["candidateId"])
+
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO vote_events "
+                    "(tx_hash, log_index, block_number, election_id, candidate_id, timestamp) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        _hex(log["transactionHash"]),
+                        int(log["logIndex"]),
+                        int(log["blockNumber"]),
+                        election_id,
+                        candidate_id,
+                        int(args["timestamp"]),
+                    )
+                )
+
+                if cur.rowcount:
+                    added += 1
+                    self._conn.execute(
+                        "INSERT INTO vote_counts (election_id, candidate_id, votes) "
+                        "VALUES (?, ?, 1) "
+                        "ON CONFLICT (election_id, candidate_id) "
+                        "DO UPDATE SET votes = votes + 1",
+                        (election_id, candidate_id)
+                    )
+
+            self._conn.execute(
+                "INSERT INTO indexer_state (name, last_block, synced_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET "
+                "last_block = excluded.last_block, synced_at = excluded.synced_at",
+                (CURSOR_NAME, to_block, time.time())
+            )
+
+        return added
+
+    def counts(self, election_uint) -> dict:
+        """
+        {candidate_uint (str): votes}
+        """
+        rows = self._conn.execute(
+            "SELECT candidate_id, votes FROM vote_counts WHERE election_id = ?",
+            (str(election_uint),)
+        ).fetchall()
+        return {candidate_id: votes for candidate_id, votes in rows}
+
+    def events(self, election_uint) -> list:
+        rows = self._conn.execute(
+            "SELECT candidate_id, timestamp FROM vote_events "
+            "WHERE election_id = ? ORDER BY block_number, log_index",
+            (str(election_uint),)
+        ).fetchall()
+        return [{"candidate_id": c, "timestamp": t} for c, t in rows]
+
+    def touch(self):
+        """
+        Marks the cursor fresh without moving it (nothing new on chain).
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE indexer_state SET synced_at = ? WHERE name = ?",
+                (time.time(), CURSOR_NAME)
+            )
+
+
+def _hex(value) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    if hasattr(value, "hex"):
+        value = value.hex()
+    return value if str(value).startswith("0x") else "0x" + str(value)
+
+
+# -------------------------------------------------
+# LOG SOURCES
+# -------------------------------------------------
+
+class ContractLogSource:
+    """
+    Reads VoteCast logs from the deployed contract.
+    """
+
+    def __init__(self, contract=None):
+        if contract is None:
+            from services.blockchain_service import get_contract
+            contract = get_contract()
+        self.contract = contract
+
+    def latest_block(self) -> int:
+        return self.contract.w3.eth.block_number
+
+    def get_logs(self, from_block: int, to_block: int):
+        return self.contract.events.VoteCast.get_logs(
+            from_block=from_block,
+            to_block=to_block
+        )
+
+
+class RecordedLogSource:
+    """
+    Replays logs recorded as JSON:
+    [{"blockNumber", "transactionHash", "logIndex",
+      "args": {"electionId", "candidateId", "timestamp"}}, ...]
+    """
+
+    def __init__(self, logs: list, latest_block: int = None):
+        self.logs = sorted(logs, key=lambda l: (l["blockNumber"], l["logIndex"]))
+        self._latest = latest_block
+
+    @classmethod
+    def from_file(cls, path: str, latest_block: int = None):
+        with open(path) as f:
+            return cls(json.load(f), latest_block)
+
+    def latest_block(self) -> int:
+        if self._latest is not None:
+            return self._latest
+        return self.logs[-1]["blockNumber"] if self.logs else 0
+
+    def get_logs(self, from_block: int, to_block: int):
+        return [l for l in self.logs if from_block <= l["blockNumber"] <= to_block]
+
+
+# -------------------------------------------------
+# INDEXER
+# -------------------------------------------------
+
+_store = None
+_store_lock = threading.Lock()
+_sync_lock = threading.Lock()
+
+
+def get_vote_event_store() -> VoteEventStore:
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = VoteEventStore(Config.VOTE_INDEX_DB_PATH)
+        return _store
+
+
+def sync_vote_events(source=None, store: VoteEventStore = None, page_size: int = None) -> dict:
+    """
+    Ingests every block after the cursor up to the latest confirmed
+    block, page_size blocks per get_logs call.
+    """
+    store = store or get_vote_event_store()
+    page_size = page_size or Config.VOTE_INDEX_PAGE_BLOCKS
+
+    with _sync_lock:
+        source = source or ContractLogSource()
+
+        last_block, _ = store.last_block()
+        start = Config.VOTE_INDEX_START_BLOCK if last_block is None else last_block + 1
+        latest = source.latest_block() - Config.VOTE_INDEX_CONFIRMATIONS
+
+        pages = 0
+        added = 0
+
+        for from_block in range(start, latest + 1, page_size):
+            to_block = min(from_block + page_size - 1, latest)
+            added += store.apply_page(source.get_logs(from_block, to_block), to_block)
+            pages += 1
+
+        if not pages:
+            store.touch()
+
+    return {"from_block": start, "to_block": latest, "pages": pages, "events": added}
+
+
+def _ensure_fresh(store: VoteEventStore, max_staleness: float = None):
+    """
+    Catches the index up unless it was synced within max_staleness
+    (default VOTE_INDEX_MAX_STALENESS) seconds. 0 always syncs.
+    """
+    if max_staleness is None:
+        max_staleness = Config.VOTE_INDEX_MAX_STALENESS
+
+    _, synced_at = store.last_block()
+    if synced_at is None or max_staleness <= 0 or time.time() - synced_at > max_staleness:
+        sync_vote_events(store=store)
+
+
+def get_vote_counts(election_id: str, max_staleness: float = None) -> dict:
+    """
+    {candidate_uint (str): votes} for an election (uuid).
+    Pass max_staleness=0 for counts that must include every
+    confirmed vote (final results).
+    """
+    store = get_vote_event_store()
+    _ensure_fresh(store, max_staleness)
+    record("chain_reads", "vote_counts")
+    return store.counts(uuid_to_uint256(election_id))
+
+
+def get_vote_events(election_id: str) -> list:
+    """
+    [{"candidate_id": uint (str), "timestamp": int}] for an election.
+    """
+    store = get_vote_event_store()
+    _ensure_fresh(store)
+    record("chain_reads", "vote_events")
+    return store.events(uuid_to_uint256(election_id))
@@ -0,0 +1,362 @@
+# services/vote_tx_queue.py
+#
+# Background submission of queued castVote transactions.
+#
+# submit_vote only enqueues (models/vote_transaction); this worker
+# signs, sends and confirms in the background:
+#
+# 1. PENDING rows get a nonce from the local allocator, are signed and
+#    recorded as SENT (with the tx hash and raw tx) *before* broadcast.
+#    A crash or a failed broadcast does not re-sign: the stored raw tx
+#    is re-broadcast as is, so a vote never goes out under two nonces
+#    while the first may still be mined.
+# 2. SENT rows are checked for receipts. A tx the node does not know
+#    (broadcast failed or dropped) is re-broadcast; after
+#    VOTE_TX_MAX_ATTEMPTS failed broadcasts the row goes back to
+#    PENDING with its nonce and raw tx cleared, the allocator resyncs
+#    and admins are alerted. The worker re-signs it on a later pass
+#    (old hashes are kept, so whichever version is mined confirms it).
+#    A tx not mined within VOTE_TX_CONFIRM_TIMEOUT is re-sent with the
+#    same nonce and a gas price bumped by VOTE_TX_GAS_BUMP_PERCENT
+#    (replacement), so at most one version can ever be mined.
+# 3. A mined tx that reverted is REVERTED and admins are alerted. It
+#    stays there until requeue_vote_transaction or
+#    discard_vote_transaction (/internal/vote-tx/<id>/...).
+#
+# Run one worker per signing key (VOTE_TX_WORKER_ENABLED), or drain the
+# queue from /internal/run-vote-tx-worker. Elections are not closed
+# while they have PENDING, SENT or REVERTED rows
+# (unsettled_vote_transactions).
+
+import threading
+import time
+from datetime import timedelta
+
+from config import Config
+from models.election import get_election_by_id
+from models.notification import create_notification
+from models.vote_transaction import (
+    PENDING, SENT, CONFIRMED, REVERTED, FAILED,
+    get_vote_transactions_by_status,
+    count_vote_transactions,
+    claim_vote_transaction,
+    update_vote_transaction
+)
+from services.blockchain_service import build_signed_vote_transaction
+from services.nonce_manager import get_nonce_manager
+from services.web3_registry import get_web3, get_booth_account, get_gas_price
+from utils.helpers import utc_now
+
+
+def _hex(value) -> str:
+    return "0x" + bytes(value).hex()
+
+
+def _bumped(gas_price: int, attempts: int) -> int:
+    factor = (100 + Config.VOTE_TX_GAS_BUMP_PERCENT) / 100
+    return int(gas_price * factor ** attempts)
+
+
+def _is_due(row) -> bool:
+    due = row.get("next_attempt_at")
+    return not due or due <= utc_now().isoformat()
+
+
+def _broadcast(raw_transaction) -> None:
+    try:
+        get_web3().eth.send_raw_transaction(raw_transaction)
+    except Exception as e:
+        # Re-broadcast of a tx the node already has is not an error
+        if "already known" not in str(e).lower():
+            raise
+
+
+def _alert(row, title: str, message: str):
+    """
+    Tells the state's CEO about a vote that is not on chain.
+    """
+    try:
+        election = get_election_by_id(row["election_id"]) or {}
+        create_notification(
+            title=title,
+            message=f"{message} (vote tx {row['id']}, election {row['election_id']})",
+            role_target="CEO",
+            state_id=election.get("state_id")
+        )
+    except Exception as e:
+        print(f"⚠️ Vote tx {row['id']} alert failed: {e}")
+
+
+def _tx_known(tx_hash: str) -> bool:
+    try:
+        get_web3().eth.get_transaction(tx_hash)
+        return True
+    except Exception:
+        return False
+
+
+# -------------------------------------------------
+# SEND
+# -------------------------------------------------
+
+def _send_pending(limit: int) -> int:
+    rows = [r for r in get_vote_transactions_by_status(PENDING, limit) if _is_due(r)]
+    if not rows:
+        return 0
+
+    nonces = get_nonce_manager(get_booth_account().address)
+    gas_price = get_gas_price()
+    sent = 0
+
+    for row in rows:
+        attempts = row.get("attempts") or 0
+        nonce = nonces.allocate()
+        price = _bumped(gas_price, attempts)
+
+        signed = build_signed_vote_transaction(
+            row["election_id"], row["candidate_id"], nonce, price
+        )
+        tx_hash = _hex(signed.hash)
+
+        # Record before broadcast; losing the race means another worker owns it
+        claimed = claim_vote_transaction(row["id"], PENDING, {
+            "status": SENT,
+            "tx_hash": tx_hash,
+            "raw_tx": _hex(signed.raw_transaction),
+            "nonce": nonce,
+            "gas_price": price,
+            "attempts": attempts + 1,
+            "sent_at": utc_now().isoformat(),
+            "last_error": None
+        })
+
+        if not claimed:
+            nonces.resync()
+            continue
+
+        try:
+            _broadcast(signed.raw_transaction)
+            sent += 1
+        except Exception as e:
+            # Ambiguous (it may have reached the node): the row stays
+            # SENT and keeps its nonce; the confirm pass re-broadcasts
+            print(f"⚠️ Vote tx {row['id']} send failed: {e}")
+            update_vote_transaction(row["id"], {"last_error": str(e)})
+
+    return sent
+
+
+def _rebroadcast(row) -> bool:
+    """
+    Re-sends the stored raw tx of a SENT row the node does not know.
+    Returns False once the row has been sent back to PENDING.
+    """
+    try:
+        _broadcast(bytes.fromhex(row["raw_tx"][2:]))
+        return True
+    except Exception as e:
+        failures = (row.get("broadcast_failures") or 0) + 1
+        print(f"⚠️ Vote tx {row['id']} re-broadcast failed: {e}")
+
+        if failures < Config.VOTE_TX_MAX_ATTEMPTS:
+            update_vote_transaction(row["id"], {
+                "broadcast_failures": failures,
+                "last_error": str(e)
+            })
+            return True
+
+        # The node never took it: re-sign from scratch under a new nonce
+        claimed = claim_vote_transaction(row["id"], SENT, {
+            "status": PENDING,
+            "tx_hash": None,
+            "raw_tx": None,
+            "nonce": None,
+            "replaced_tx_hashes": [row["tx_hash"], *(row.get("replaced_tx_hashes") or [])],
+            "broadcast_failures": 0,
+            "next_attempt_at": (utc_now() + timedelta(seconds=Config.VOTE_TX_CONFIRM_TIMEOUT)).isoformat(),
+            "last_error": str(e)
+        })
+        if claimed:
+            get_nonce_manager(get_booth_account().address).resync()
+            _alert(
+                row,
+                "Vote transaction re-queued",
+                f"Broadcast failed {failures} times ({e}); the vote will be re-signed"
+            )
+        return False
+
+
+# -------------------------------------------------
+# CONFIRM
+# -------------------------------------------------
+
+def _receipt(tx_hash):
+    try:
+        return get_web3().eth.get_transaction_receipt(tx_hash)
+    except Exception:
+        return None
+
+
+def _confirm_sent(limit: int) -> dict:
+    summary = {"confirmed": 0, "replaced": 0, "requeued": 0, "reverted": 0}
+
+    rows = get_vote_transactions_by_status(SENT, limit)
+    if not rows:
+        return summary
+
+    timeout = timedelta(seconds=Config.VOTE_TX_CONFIRM_TIMEOUT)
+
+    for row in rows:
+        hashes = [row["tx_hash"], *(row.get("replaced_tx_hashes") or [])]
+        receipt = next(filter(None, (_receipt(h) for h in hashes)), None)
+
+        if receipt is not None:
+            if receipt["status"] == 1:
+                update_vote_transaction(row["id"], {
+                    "status": CONFIRMED,
+                    "tx_hash": _hex(receipt["transactionHash"]),
+                    "block_number": receipt["blockNumber"],
+                    "confirmed_at": utc_now().isoformat()
+                })
+                summary["confirmed"] += 1
+            else:
+                # Reverts are deterministic (e.g. election closed on
+                # chain): retrying blindly won't help, an admin must look
+                update_vote_transaction(row["id"], {
+                    "status": REVERTED,
+                    "block_number": receipt["blockNumber"],
+                    "last_error": "castVote reverted"
+                })
+                _alert(row, "Vote transaction reverted", "castVote reverted on chain; the vote is not counted")
+                summary["reverted"] += 1
+            continue
+
+        if row.get("raw_tx") and not _tx_known(row["tx_hash"]):
+            if not _rebroadcast(row):
+                summary["requeued"] += 1
+            continue
+
+        sent_at = row.get("sent_at")
+        if sent_at and sent_at > (utc_now() - timeout).isoformat():
+            continue
+
+        # Stuck: replace with the same nonce and a higher gas price
+        attempts = row.get("attempts") or 1
+        price = max(_bumped(get_gas_price(), attempts), _bumped(row["gas_price"], 1))
+
+        signed = build_signed_vote_transaction(
+            row["election_id"], row["candidate_id"], row["nonce"], price
+        )
+        tx_hash = _hex(signed.hash)
+
+        update_vote_transaction(row["id"], {
+            "tx_hash": tx_hash,
+            "raw_tx": _hex(signed.raw_transaction),
+            "replaced_tx_hashes": hashes,
+            "gas_price": price,
+            "attempts": attempts + 1,
+            "sent_at": utc_now().isoformat()
+        })
+
+        try:
+            _broadcast(signed.raw_transaction)
+            summary["replaced"] += 1
+        except Exception as e:
+            # "nonce too low": one of the earlier versions was mined;
+            # its receipt is picked up on the next pass
+            print(f"⚠️ Vote tx {row['id']} replacement failed: {e}")
+            update_vote_transaction(row["id"], {"last_error": str(e)})
+
+    return summary
+
+
+# -------------------------------------------------
+# WORKER
+# -------------------------------------------------
+
+def process_vote_transactions(limit: int = None) -> dict:
+    """
+    One pass of the worker: send what is pending, confirm what was sent.
+    """
+    limit = limit or Config.VOTE_TX_BATCH_SIZE
+
+    sent = _send_pending(limit)
+    summary = _confirm_sent(limit)
+
+    return {"sent": sent, **summary}
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _run_forever():
+    while True:
+        try:
+            summary = process_vote_transactions()
+            if any(summary.values()):
+                print("🔗 Vote tx worker:", summary)
+        except Exception as e:
+            print(f"⚠️ Vote tx worker error: {e}")
+
+        time.sleep(Config.VOTE_TX_POLL_INTERVAL)
+
+
+def start_vote_tx_worker():
+    """
+    Starts the background worker thread once per process.
+    """
+    global _worker
+
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_run_forever,
+                name="vote-tx-worker",
+                daemon=True
+            )
+            _worker.start()
+
+    return _worker
+
+
+# -------------------------------------------------
+# ADMIN / CLOSURE
+# -------------------------------------------------
+
+def requeue_vote_transaction(tx_id) -> bool:
+    """
+    Sends a REVERTED vote again under a fresh nonce.
+    """
+    return claim_vote_transaction(tx_id, REVERTED, {
+        "status": PENDING,
+        "tx_hash": None,
+        "raw_tx": None,
+        "nonce": None,
+        "replaced_tx_hashes": [],
+        "broadcast_failures": 0,
+        "next_attempt_at": None
+    })
+
+
+def discard_vote_transaction(tx_id, reason: str) -> bool:
+    """
+    Records that an admin gave up on a REVERTED vote, so the
+    election can close without it.
+    """
+    return claim_vote_transaction(tx_id, REVERTED, {
+        "status": FAILED,
+        "last_error": f"discarded: {reason}"
+    })
+
+
+def unsettled_vote_transactions(election_id) -> dict:
+    """
+    {status: rows} of an election's votes not yet on chain and not
+    given up on. Results must not be tallied while this is non-empty.
+    """
+    counts = {
+        status: count_vote_transactions(election_id, status)
+        for status in (PENDING, SENT, REVERTED)
+    }
+    return {status: n for status, n in counts.items() if n}
@@ -0,0 +1,362 @@
+# services/voter_import_service.py
+#
+# Bulk voter-roll import: uploaded CSV/Parquet → streamed chunks →
+# vectorized validation → one upsert per chunk → checkpoint.
+#
+# - Rows are read VOTER_IMPORT_CHUNK_SIZE at a time; the file is never
+#   loaded whole.
+# - Each chunk is validated with pandas column operations (required
+#   fields, gender, DOB / minimum age, booth belongs to the
+#   constituency, duplicates within the file and against the roll).
+# - Voter ids are derived from (job id, row number), so re-sending a
+#   chunk after a crash upserts the same rows instead of duplicating
+#   them. rows_processed is the resume checkpoint.
+#
+# Bulk rows go on the electoral roll only; login accounts are still
+# created per voter through add_voter.
+
+import os
+import threading
+import uuid
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from models.booth import get_booths_by_constituency
+from models.constituency import get_constituency_by_id
+from models.voter import VOTERS_TABLE
+from models.voter_import import (
+    create_import_job,
+    get_import_job,
+    update_import_job,
+    QUEUED,
+    RUNNING,
+    COMPLETED,
+    FAILED
+)
+from services.voter_index import invalidate_voter_index
+from supabase_db.db import iter_all, upsert_records
+from utils.helpers import utc_now
+
+REQUIRED_COLUMNS = ["full_name", "guardian_name", "gender", "date_of_birth", "address"]
+OPTIONAL_COLUMNS = ["booth_id", "booth_number", "photo_url"]
+GENDERS = {"male": "Male", "female": "Female", "other": "Other"}
+
+FORMATS = {".csv": "csv", ".parquet": "parquet"}
+
+# Namespace for deterministic voter ids: uuid5(job id + row number)
+_VOTER_ID_NAMESPACE = uuid.UUID("8f5b1f7e-3c1a-4d0e-9a57-2f1c6b0d4e21")
+
+_running = set()
+_running_lock = threading.Lock()
+
+
+# -------------------------------------------------
+# READ
+# -------------------------------------------------
+
+def _read_chunks(path: str, file_format: str, skip_rows: int, chunk_size: int):
+    """
+    Yields DataFrames of up to chunk_size rows, all values as strings,
+    starting after the first skip_rows data rows.
+    """
+    if file_format == "csv":
+        yield from pd.read_csv(
+            path,
+            dtype=str,
+            keep_default_na=False,
+            skiprows=range(1, skip_rows + 1),
+            chunksize=chunk_size
+        )
+        return
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet imports need pyarrow installed; upload a CSV instead")
+
+    seen = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        if seen + batch.num_rows <= skip_rows:
+            seen += batch.num_rows
+            continue
+
+        df = batch.to_pandas().iloc[max(skip_rows - seen, 0):]
+        seen += batch.num_rows
+        yield df.astype(str).where(df.notna(), "")
+
+
+# -------------------------------------------------
+# VALIDATE
+# -------------------------------------------------
+
+def _duplicate_key(full_name: pd.Series, guardian_name: pd.Series, dob: pd.Series) -> pd.Series:
+    return (
+        full_name.str.lower().str.split().str.join(" ") + "|"
+        + guardian_name.str.lower().str.split().str.join(" ") + "|"
+        + dob
+    )
+
+
+class ImportContext:
+    """
+    Everything validation needs that does not change between chunks.
+    """
+
+    def __init__(self, job: dict, booths: list, existing_keys: dict, today: date = None):
+        self.job = job
+        self.today = pd.Timestamp(today or utc_now().date())
+
+        booths = [b for b in booths if not job.get("booth_id") or b["id"] == job["booth_id"]]
+        self.booth_ids = {b["id"] for b in booths}
+        self.booth_by_number = {str(b.get("booth_number")): b["id"] for b in booths}
+
+        # duplicate key → voter id, for the roll and rows already accepted
+        self.seen = existing_keys
+
+    @classmethod
+    def load(cls, job: dict):
+        columns = ["id", "full_name", "guardian_name", "date_of_birth"]
+        roll = pd.DataFrame(
+            list(iter_all(
+                VOTERS_TABLE,
+                {"constituency_id": job["constituency_id"]},
+                use_admin=True,
+                columns=columns
+            )),
+            columns=columns
+        ).fillna("").astype(str)
+
+        keys = dict(zip(
+            _duplicate_key(roll["full_name"], roll["guardian_name"], roll["date_of_birth"].str[:10]),
+            roll["id"]
+        ))
+
+        return cls(job, get_booths_by_constituency(job["constituency_id"]), keys)
+
+
+def validate_voter_chunk(df: pd.DataFrame, first_row: int, ctx: ImportContext):
+    """
+    Returns (payloads, rejects) for one chunk.
+    rejects → [{"row": n, "reason": str}], rows numbered from 1.
+    """
+    job = ctx.job
+    df = df.reset_index(drop=True)
+
+    missing_columns = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing_columns:
+        raise ValueError(f"Missing columns: {', '.join(missing_columns)}")
+    if "booth_id" not in df.columns and "booth_number" not in df.columns and not job.get("booth_id"):
+        raise ValueError("Missing column: booth_id or booth_number")
+
+    for c in REQUIRED_COLUMNS + OPTIONAL_COLUMNS:
+        df[c] = df[c].fillna("").astype(str).str.strip() if c in df.columns else ""
+
+    rows = np.arange(first_row + 1, first_row + len(df) + 1)
+    ids = [str(uuid.uuid5(_VOTER_ID_NAMESPACE, f"{job['id']}:{r}")) for r in rows]
+
+    gender = df["gender"].str.lower().map(GENDERS)
+
+    dob = pd.to_datetime(df["date_of_birth"].str[:10], format="%Y-%m-%d", errors="coerce")
+    age_days = (ctx.today - dob).dt.days
+    min_days = int(Config.VOTER_MIN_AGE * 365.25)
+
+    booth = df["booth_id"].where(df["booth_id"].isin(ctx.booth_ids))
+    booth = booth.fillna(df["booth_number"].map(ctx.booth_by_number))
+    if job.get("booth_id"):
+        # Booth-level imports default every row to the job's booth
+        unset = (df["booth_id"] == "") & (df["booth_number"] == "")
+        booth = booth.mask(unset, job["booth_id"])
+
+    checks = [
+        *[(df[c] == "", f"missing {c}") for c in REQUIRED_COLUMNS],
+        (gender.isna(), "invalid gender"),
+        (dob.isna(), "invalid date_of_birth (expected YYYY-MM-DD)"),
+        (age_days < 0, "date_of_birth in the future"),
+        (age_days < min_days, f"under {Config.VOTER_MIN_AGE}"),
+        (booth.isna(), "unknown booth for this constituency")
+    ]
+
+    reason = pd.Series("", index=df.index)
+    for mask, message in checks:
+        reason = reason.mask((reason == "") & mask.fillna(False), message)
+
+    # Duplicates are judged among otherwise valid rows only, so a bad
+    # first copy does not knock out a good second one
+    key = _duplicate_key(df["full_name"], df["guardian_name"], dob.dt.strftime("%Y-%m-%d"))
+    valid = reason == ""
+    # dict.get: mapping with the dict itself copies all of `seen` per chunk
+    known = key.map(ctx.seen.get)
+
+    reason = reason.mask(valid & key.where(valid).duplicated(keep="first"), "duplicate row in file")
+    reason = reason.mask(
+        (reason == "") & known.notna() & (known != pd.Series(ids)),
+        "already on the electoral roll"
+    )
+
+    ok = (reason == "").to_numpy()
+
+    now = utc_now().isoformat()
+    payloads = [
+        {
+            "id": vid,
+            "voter_id_number": f"VTR-{vid.replace('-', '')[:10].upper()}",
+            "full_name": full_name,
+            "guardian_name": guardian_name,
+            "gender": g,
+            "date_of_birth": d,
+            "address": address,
+            "photo_url": photo or None,
+            "state_id": job["state_id"],
+            "district_id": job["district_id"],
+            "constituency_id": job["constituency_id"],
+            "booth_id": b,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now
+        }
+        for vid, full_name, guardian_name, g, d, address, photo, b in zip(
+            np.array(ids)[ok],
+            df["full_name"][ok],
+            df["guardian_name"][ok],
+            gender[ok],
+            dob[ok].dt.strftime("%Y-%m-%d"),
+            df["address"][ok],
+            df["photo_url"][ok],
+            booth[ok]
+        )
+    ]
+
+    ctx.seen.update(zip(key[ok], (p["id"] for p in payloads)))
+
+    rejects = [
+        {"row": int(r), "reason": m}
+        for r, m in zip(rows[~ok], reason[~ok])
+    ]
+    return payloads, rejects
+
+
+# -------------------------------------------------
+# RUN
+# -------------------------------------------------
+
+def start_voter_import(file, state_id, district_id, constituency_id, booth_id=None, created_by=None):
+    """
+    Saves the upload, records the job and starts it in the background.
+    """
+    ext = os.path.splitext(file.filename or "")[1].lower()
+    if ext not in FORMATS:
+        raise ValueError("Upload a .csv or .parquet file")
+
+    if not get_constituency_by_id(constituency_id):
+        raise ValueError("Constituency not found")
+
+    os.makedirs(Config.VOTER_IMPORT_DIR, exist_ok=True)
+    path = os.path.join(Config.VOTER_IMPORT_DIR, f"{uuid.uuid4()}{ext}")
+    file.save(path)
+
+    job = create_import_job(
+        path, FORMATS[ext], state_id, district_id, constituency_id,
+        booth_id=booth_id, created_by=created_by
+    )
+    resume_voter_import(job["id"])
+    return job
+
+
+def resume_voter_import(job_id):
+    """
+    Runs (or resumes) a job in a background thread; no-op if this
+    process is already running it.
+    """
+    with _running_lock:
+        if job_id in _running:
+            return False
+        _running.add(job_id)
+
+    threading.Thread(
+        target=_run_in_background,
+        args=(job_id,),
+        name=f"voter-import-{job_id}",
+        daemon=True
+    ).start()
+    return True
+
+
+def _run_in_background(job_id):
+    try:
+        run_voter_import(job_id)
+    finally:
+        with _running_lock:
+            _running.discard(job_id)
+
+
+def run_voter_import(job_id):
+    job = get_import_job(job_id)
+
+    if not job or job["status"] == COMPLETED:
+        return job
+
+    processed = job["rows_processed"]
+    imported = job["rows_imported"]
+    rejected = job["rows_rejected"]
+    errors = job.get("errors") or []
+
+    update_import_job(job_id, {"status": RUNNING, "error_message": None})
+    print(f"📥 Voter import {job_id}: starting at row {processed}")
+
+    try:
+        ctx = ImportContext.load(job)
+
+        for chunk in _read_chunks(
+            job["file_path"], job["file_format"], processed, Config.VOTER_IMPORT_CHUNK_SIZE
+        ):
+            payloads, rejects = validate_voter_chunk(chunk, processed, ctx)
+
+            # 1️⃣ Write the chunk (idempotent on id)
+            upsert_records(
+                VOTERS_TABLE, payloads, ["id"],
+                use_admin=True, chunk_size=Config.VOTER_IMPORT_CHUNK_SIZE
+            )
+            invalidate_voter_index()
+
+            # 2️⃣ Checkpoint
+            processed += len(chunk)
+            imported += len(payloads)
+            rejected += len(rejects)
+            errors = (errors + rejects)[:Config.VOTER_IMPORT_MAX_ERRORS]
+
+            update_import_job(job_id, {
+                "rows_processed": processed,
+                "rows_imported": imported,
+                "rows_rejected": rejected,
+                "errors": errors
+            })
+            print(f"📥 Voter import {job_id}: {processed} rows ({imported} imported, {rejected} rejected)")
+
+    except Exception as e:
+        update_import_job(job_id, {"status": FAILED, "error_message": str(e)})
+        print(f"❌ Voter import {job_id} failed at row {processed}: {e}")
+        return get_import_job(job_id)
+
+    update_import_job(job_id, {"status": COMPLETED})
+    print(f"✅ Voter import {job_id}: done")
+    return get_import_job(job_id)
+
+
+def import_progress(job) -> dict:
+    return {
+        k: job.get(k)
+        for k in (
+            "id", "status", "rows_processed", "rows_imported", "rows_rejected",
+            "errors", "error_message", "created_at", "updated_at"
+        )
+    }
+
+
+def is_resumable(job) -> bool:
+    return job["status"] in (FAILED, QUEUED) or (
+        job["status"] == RUNNING and job["id"] not in _running
+    )
@@ -0,0 +1,233 @@
+# services/voter_index.py
+#
+# In-memory voter → constituency / booth / gender / birth-day index.
+#
+# Built from one streamed, projected read of the voters table and kept
+# as parallel numpy columns (strings interned to small int codes), so
+# resolving a voted row to its constituency, booth or gender is a dict
+# lookup plus an array read instead of a query.
+#
+# Rebuilt lazily on the next read after:
+# - a roll write in this process (invalidate_voter_index)
+# - VOTER_INDEX_TTL seconds (writes from other processes)
+# - a lookup miss, at most every MISS_REBUILD_SECONDS (new voters)
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from supabase_db.db import iter_all
+
+VOTERS = "voters"
+INDEX_COLUMNS = ["id", "constituency_id", "booth_id", "gender", "date_of_birth", "is_active"]
+
+# dob_day value for missing / unparseable dates of birth
+NO_DOB = np.iinfo(np.int32).min
+
+MISS_REBUILD_SECONDS = 30
+
+
+def parse_dob_days(dobs: pd.Series) -> np.ndarray:
+    """
+    ISO dates → days since epoch (float, NaN where missing/invalid).
+    """
+    parsed = pd.to_datetime(
+        dobs.astype("string").str[:10],
+        format="%Y-%m-%d",
+        errors="coerce"
+    )
+    days = (parsed - pd.Timestamp("1970-01-01")).dt.days
+    return days.to_numpy(dtype="float64", na_value=np.nan)
+
+
+class _Interner:
+    """
+    value → small int code; None → -1.
+    """
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def code(self, value) -> int:
+        if value is None:
+            return -1
+
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def get(self, value) -> int:
+        return self._codes.get(value, -1)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        # Trailing None makes code -1 decode to None
+        return np.array(self.values + [None], dtype=object)[codes]
+
+
+class VoterIndex:
+    """
+    Columns (one slot per voter, aligned by position):
+
+    constituency, booth, gender → int codes (-1 = unset)
+    dob_day                     → int32 days since epoch (NO_DOB = unset)
+    active                      → bool
+    """
+
+    def __init__(self, rows):
+        self.built_at = time.monotonic()
+        self._positions = {}
+
+        self.constituencies = _Interner()
+        self.booths = _Interner()
+        self.genders = _Interner()
+
+        constituency, booth, gender, dobs, active = [], [], [], [], []
+
+        for row in rows:
+            self._positions[row["id"]] = len(constituency)
+            constituency.append(self.constituencies.code(row.get("constituency_id")))
+            booth.append(self.booths.code(row.get("booth_id")))
+            # Same fallback the insight counters always used
+            gender.append(self.genders.code(row.get("gender") or "Other"))
+            dobs.append(row.get("date_of_birth"))
+            active.append(bool(row.get("is_active")))
+
+        self.constituency = np.array(constituency, dtype=np.int32)
+        self.booth = np.array(booth, dtype=np.int32)
+        self.gender = np.array(gender, dtype=np.int16)
+        self.active = np.array(active, dtype=bool)
+
+        days = parse_dob_days(pd.Series(dobs, dtype="object"))
+        self.dob_day = np.where(np.isnan(days), NO_DOB, days).astype(np.int32)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, voter_id):
+        return voter_id in self._positions
+
+    # ---------------------------------------------------
+    # LOOKUPS
+    # ---------------------------------------------------
+
+    def position(self, voter_id) -> int:
+        return self._positions.get(voter_id, -1)
+
+    def positions(self, voter_ids) -> np.ndarray:
+        get = self._positions.get
+        return np.fromiter((get(v, -1) for v in voter_ids), dtype=np.int64)
+
+    def lookup(self, voter_id):
+        i = self.position(voter_id)
+        if i < 0:
+            return None
+
+        dob_day = int(self.dob_day[i])
+        return {
+            "constituency_id": self.constituency_of(i),
+            "booth_id": self.booth_of(i),
+            "gender": self.genders.values[self.gender[i]],
+            "dob_day": None if dob_day == NO_DOB else dob_day,
+            "is_active": bool(self.active[i])
+        }
+
+    def constituency_of(self, position: int):
+        code = self.constituency[position]
+        return self.constituencies.values[code] if code >= 0 else None
+
+    def booth_of(self, position: int):
+        code = self.booth[position]
+        return self.booths.values[code] if code >= 0 else None
+
+    # ---------------------------------------------------
+    # AGGREGATES
+    # ---------------------------------------------------
+
+    def count_by_constituency(self, positions: np.ndarray = None) -> dict:
+        """
+        {constituency_id: n} over the given positions (repeats count),
+        or over active voters when positions is None.
+        """
+        if positions is None:
+            codes = self.constituency[self.active]
+        else:
+            codes = self.constituency[positions[positions >= 0]]
+
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.constituencies.values))
+        return {
+            cid: int(n)
+            for cid, n in zip(self.constituencies.values, counts)
+            if n
+        }
+
+
+# -------------------------------------------------
+# PROCESS-WIDE INDEX
+# -------------------------------------------------
+
+_index = None
+_dirty = False
+_lock = threading.Lock()
+
+
+def _is_fresh(index) -> bool:
+    return (
+        index is not None
+        and not _dirty
+        and time.monotonic() - index.built_at < Config.VOTER_INDEX_TTL
+    )
+
+
+def build_voter_index() -> VoterIndex:
+    started = time.perf_counter()
+    index = VoterIndex(iter_all(VOTERS, use_admin=True, columns=INDEX_COLUMNS))
+
+    print(f"🗂️ Voter index: {len(index)} voters in {time.perf_counter() - started:.2f}s")
+    return index
+
+
+def get_voter_index(rebuild: bool = False) -> VoterIndex:
+    global _index, _dirty
+
+    index = _index
+    if not rebuild and _is_fresh(index):
+        return index
+
+    with _lock:
+        # Another thread may have rebuilt it while we waited
+        if _index is not index and _is_fresh(_index):
+            return _index
+
+        _dirty = False
+        _index = build_voter_index()
+        return _index
+
+
+def invalidate_voter_index():
+    """
+    Called after roll writes; the next read rebuilds.
+    """
+    global _dirty
+    _dirty = True
+
+
+def resolve_voters(voter_ids):
+    """
+    (index, positions) for voter_ids; -1 where unknown. Rebuilds once
+    if some voters are missing (registered after the last build).
+    """
+    voter_ids = list(voter_ids)
+    index = get_voter_index()
+    positions = index.positions(voter_ids)
+
+    if (positions < 0).any() and time.monotonic() - index.built_at > MISS_REBUILD_SECONDS:
+        index = get_voter_index(rebuild=True)
+        positions = index.positions(voter_ids)
+
+    return index, positions
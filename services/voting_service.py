@@ -5,9 +5,11 @@ from models.vote import (
     mark_voter_as_voted
 )
 
-from models.vote_receipt import store_receipt
+from models.vote_receipt import store_receipt, set_receipt_leaf_index
 from utils.crypto import generate_vote_receipt
-from services.blockchain_service import cast_vote_on_chain
+from config import Config
+from services.blockchain_service import cast_vote_on_chain, enqueue_vote_on_chain
+from services.merkle_service import append_receipt_to_accumulator
 
 
 # -----------------------------
@@ -48,12 +50,25 @@ def submit_vote(
 
     # ------------------------------------------------
     # 3. Cast vote on blockchain (NO receipt stored)
+    #    Async mode: durably queue it; the vote tx
+    #    worker signs, sends and confirms it
     # ------------------------------------------------
-    tx_hash = cast_vote_on_chain(
-        election_id=election_id,
-        candidate_id=candidate_id,
-        receipt_hash=receipt_hash
-    )
+    tx_hash = None
+    tx_queue_id = None
+
+    if Config.VOTE_TX_ASYNC and Config.BLOCKCHAIN_MODE == "WEB3":
+        queued = enqueue_vote_on_chain(
+            election_id=election_id,
+            candidate_id=candidate_id,
+            receipt_hash=receipt_hash
+        )
+        tx_queue_id = queued["id"]
+    else:
+        tx_hash = cast_vote_on_chain(
+            election_id=election_id,
+            candidate_id=candidate_id,
+            receipt_hash=receipt_hash
+        )
 
     # ------------------------------------------------
     # 4. Store receipt off-chain (for Merkle proof)
@@ -68,10 +83,22 @@ def submit_vote(
     # ------------------------------------------------
     mark_voter_as_voted(voter_id, election_id)
 
+    # ------------------------------------------------
+    # 5b. Append to the running Merkle root (best effort:
+    #     the vote is already recorded; without a leaf
+    #     index, closure rebuilds the root from receipts)
+    # ------------------------------------------------
+    try:
+        leaf_index = append_receipt_to_accumulator(election_id, receipt_hash)
+        set_receipt_leaf_index(election_id, receipt_hash, leaf_index)
+    except Exception as e:
+        print(f"⚠️ Merkle accumulator append failed for {election_id}: {e}")
+
     # ------------------------------------------------
     # 6. Return receipt to UI
     # ------------------------------------------------
     return {
         "receipt_hash": receipt_hash,
-        "tx_hash": tx_hash
+        "tx_hash": tx_hash,
+        "tx_queue_id": tx_queue_id
     }
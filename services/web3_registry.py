@@ -0,0 +1,210 @@
+# services/web3_registry.py
+#
+# Process-wide Web3 handles.
+#
+# One HTTPProvider (keep-alive session, pooled connections) and one
+# contract object per address are shared by every caller; the ABI is
+# read from disk once. Node health is checked at most every
+# WEB3_HEALTH_CHECK_INTERVAL seconds instead of before every vote, and
+# each JSON-RPC method's latency is recorded for /admin/rpc-stats.
+
+import json
+import threading
+import time
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3, HTTPProvider
+
+from config import Config
+from utils.instrumentation import record
+
+
+VOTING_ABI_PATH = "blockchain/abi/VotingContractABI.json"
+
+_lock = threading.Lock()
+_web3 = None
+_contracts = {}
+
+_health = {"ok": None, "checked_at": 0.0, "error": None}
+_gas_price = {"value": None, "fetched_at": 0.0}
+
+_metrics_lock = threading.Lock()
+_metrics = {}
+
+
+# -------------------------------------------------
+# RPC METRICS
+# -------------------------------------------------
+
+def _record(method: str, elapsed_ms: float, failed: bool):
+    with _metrics_lock:
+        m = _metrics.setdefault(
+            method, {"calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        m["calls"] += 1
+        m["errors"] += int(failed)
+        m["total_ms"] += elapsed_ms
+        m["max_ms"] = max(m["max_ms"], elapsed_ms)
+
+
+def get_rpc_metrics() -> dict:
+    with _metrics_lock:
+        methods = {k: dict(v) for k, v in _metrics.items()}
+
+    for m in methods.values():
+        m["avg_ms"] = round(m["total_ms"] / m["calls"], 2) if m["calls"] else 0
+        m["total_ms"] = round(m["total_ms"], 2)
+        m["max_ms"] = round(m["max_ms"], 2)
+
+    return {"health": dict(_health), "methods": methods}
+
+
+class _TimedHTTPProvider(HTTPProvider):
+    """
+    HTTPProvider that times every JSON-RPC call.
+    """
+
+    def make_request(self, method, params):
+        record("chain_rpc", method)
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = super().make_request(method, params)
+            failed = "error" in response
+            return response
+        except Exception as e:
+            _mark_unhealthy(e)
+            raise
+        finally:
+            _record(method, (time.perf_counter() - started) * 1000, failed)
+
+
+# -------------------------------------------------
+# HANDLES
+# -------------------------------------------------
+
+@lru_cache(maxsize=None)
+def load_abi(path: str = VOTING_ABI_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=Config.WEB3_HTTP_POOL_SIZE,
+        pool_maxsize=Config.WEB3_HTTP_POOL_SIZE
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_web3() -> Web3:
+    global _web3
+
+    if _web3 is not None:
+        return _web3
+
+    with _lock:
+        if _web3 is None:
+            if not Config.WEB3_PROVIDER_URL:
+                raise Exception("Blockchain configuration missing")
+
+            _web3 = Web3(_TimedHTTPProvider(
+                Config.WEB3_PROVIDER_URL,
+                request_kwargs={"timeout": Config.WEB3_REQUEST_TIMEOUT},
+                session=_build_session()
+            ))
+
+    return _web3
+
+
+def get_voting_contract(address: str = None):
+    address = Web3.to_checksum_address(address or Config.VOTING_CONTRACT_ADDRESS)
+
+    contract = _contracts.get(address)
+    if contract is not None:
+        return contract
+
+    w3 = get_web3()
+
+    with _lock:
+        contract = _contracts.get(address)
+        if contract is None:
+            contract = w3.eth.contract(address=address, abi=load_abi())
+            _contracts[address] = contract
+
+    return contract
+
+
+def get_booth_account():
+    """
+    Signing account for the booth key (parsed once).
+    """
+    if not Config.BOOTH_PRIVATE_KEY:
+        raise Exception("Blockchain configuration missing")
+    return _booth_account(Config.BOOTH_PRIVATE_KEY)
+
+
+@lru_cache(maxsize=4)
+def _booth_account(private_key: str):
+    return get_web3().eth.account.from_key(private_key)
+
+
+def get_gas_price() -> int:
+    """
+    Network gas price, refreshed at most every WEB3_GAS_PRICE_TTL seconds.
+    """
+    if time.time() - _gas_price["fetched_at"] >= Config.WEB3_GAS_PRICE_TTL:
+        _gas_price.update({
+            "value": get_web3().eth.gas_price,
+            "fetched_at": time.time()
+        })
+    return _gas_price["value"]
+
+
+def reset_web3():
+    """
+    Drops the shared handles (config change, tests).
+    """
+    global _web3
+
+    with _lock:
+        _web3 = None
+        _contracts.clear()
+        _booth_account.cache_clear()
+        _gas_price.update({"value": None, "fetched_at": 0.0})
+        _health.update({"ok": None, "checked_at": 0.0, "error": None})
+
+
+# -------------------------------------------------
+# HEALTH
+# -------------------------------------------------
+
+def _mark_unhealthy(error):
+    _health.update({"ok": False, "checked_at": time.time(), "error": str(error)})
+
+
+def ensure_connected():
+    """
+    Raises if the node is unreachable. The actual is_connected() probe
+    runs at most once per WEB3_HEALTH_CHECK_INTERVAL while healthy; after
+    a failure every call re-probes so recovery is picked up at once.
+    """
+    fresh = time.time() - _health["checked_at"] < Config.WEB3_HEALTH_CHECK_INTERVAL
+
+    if _health["ok"] and fresh:
+        return
+
+    ok = get_web3().is_connected()
+    _health.update({
+        "ok": ok,
+        "checked_at": time.time(),
+        "error": None if ok else "is_connected() returned False"
+    })
+
+    if not ok:
+        raise Exception("Blockchain node not reachable")
@@ -0,0 +1,184 @@
+-- sql/schema.sql
+--
+-- Tables (and constraints on existing tables) the batch jobs, vote
+-- queue and cached aggregates rely on. Run once in the Supabase SQL
+-- editor; every statement is safe to re-run.
+--
+-- Several code paths depend on these constraints for correctness, not
+-- just speed: upserts name them as conflict targets, and "create the
+-- row, or lose the race" inserts rely on the unique key rejecting the
+-- second writer.
+
+-- -----------------------------
+-- Batch jobs (models/job_run.py)
+-- -----------------------------
+
+create table if not exists job_runs (
+    id          uuid primary key,
+    name        text not null,
+    run_key     text not null,
+    status      text not null check (status in ('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED')),
+    attempt     integer not null default 1,
+    total       integer not null default 0,
+    done        integer not null default 0,
+    failed      integer not null default 0,
+    summary     jsonb,
+    error       text,
+    started_at  timestamptz not null default now(),
+    finished_at timestamptz,
+    unique (name, run_key)
+);
+
+create index if not exists job_runs_name_started_idx on job_runs (name, started_at desc);
+
+create table if not exists job_run_items (
+    run_id      uuid not null references job_runs (id) on delete cascade,
+    item        text not null,
+    status      text not null check (status in ('DONE', 'FAILED')),
+    attempts    integer not null default 0,
+    elapsed_ms  double precision,
+    error       text,
+    finished_at timestamptz,
+    primary key (run_id, item)
+);
+
+create table if not exists job_locks (
+    name         text primary key,
+    token        text not null,
+    run_id       uuid,
+    locked_until timestamptz
+);
+
+-- -----------------------------
+-- Sync watermarks (models/sync_watermark.py)
+-- -----------------------------
+
+create table if not exists sync_watermarks (
+    name      text primary key,
+    synced_at timestamptz not null
+);
+
+-- -----------------------------
+-- Representative scoring
+-- -----------------------------
+
+-- models/rep_score_aggregate.py: version is the compare-and-set token
+create table if not exists rep_score_aggregates (
+    rep_user_id uuid primary key,
+    state       jsonb not null,
+    version     integer not null default 1,
+    rebuilt_at  timestamptz,
+    updated_at  timestamptz not null default now()
+);
+
+-- models/representative.insert_daily_rep_score upserts on this key
+do $$
+begin
+    if not exists (
+        select 1 from pg_constraint
+        where conname = 'representative_daily_scores_rep_election_date_key'
+    ) then
+        alter table representative_daily_scores
+            add constraint representative_daily_scores_rep_election_date_key
+            unique (rep_user_id, election_id, score_date);
+    end if;
+end $$;
+
+-- -----------------------------
+-- Vote status
+-- -----------------------------
+
+-- models/vote.mark_voter_as_voted upserts on this key, and the
+-- turnout insights read an election's vote_status in pages keyed on voter_id
+do $$
+begin
+    if not exists (
+        select 1 from pg_constraint
+        where conname = 'vote_status_voter_election_key'
+    ) then
+        alter table vote_status
+            add constraint vote_status_voter_election_key
+            unique (voter_id, election_id);
+    end if;
+end $$;
+
+-- -----------------------------
+-- Vote transaction queue (models/vote_transaction.py)
+-- -----------------------------
+
+create table if not exists vote_transactions (
+    id                 uuid primary key,
+    election_id        uuid not null,
+    candidate_id       uuid not null,
+    receipt_hash       text not null unique,
+    status             text not null
+                       check (status in ('PENDING', 'SENT', 'CONFIRMED', 'REVERTED', 'FAILED')),
+    attempts           integer not null default 0,
+    tx_hash            text,
+    raw_tx             text,
+    nonce              bigint,
+    gas_price          numeric,
+    replaced_tx_hashes jsonb,
+    broadcast_failures integer not null default 0,
+    block_number       bigint,
+    last_error         text,
+    next_attempt_at    timestamptz,
+    sent_at            timestamptz,
+    confirmed_at       timestamptz,
+    created_at         timestamptz not null default now(),
+    updated_at         timestamptz not null default now()
+);
+
+create index if not exists vote_transactions_status_created_idx on vote_transactions (status, created_at);
+create index if not exists vote_transactions_election_status_idx on vote_transactions (election_id, status);
+
+-- -----------------------------
+-- Merkle accumulator (models/merkle_accumulator.py)
+-- -----------------------------
+
+-- leaf_count is the compare-and-set token
+create table if not exists merkle_accumulators (
+    id          uuid primary key,
+    election_id uuid not null unique,
+    leaf_count  integer not null default 0,
+    last_leaf   text,
+    branch      jsonb not null default '[]'::jsonb,
+    updated_at  timestamptz not null default now()
+);
+
+-- -----------------------------
+-- Election snapshots (models/election_snapshot.py)
+-- -----------------------------
+
+create table if not exists election_snapshots (
+    election_id uuid primary key,
+    status      text not null check (status in ('LIVE', 'FINAL')),
+    results     jsonb not null,
+    dashboard   jsonb,
+    updated_at  timestamptz not null default now()
+);
+
+-- -----------------------------
+-- Voter roll imports (models/voter_import.py)
+-- -----------------------------
+
+create table if not exists voter_import_jobs (
+    id              uuid primary key,
+    file_path       text not null,
+    file_format     text not null,
+    state_id        uuid not null,
+    district_id     uuid not null,
+    constituency_id uuid not null,
+    booth_id        uuid,
+    created_by      uuid,
+    status          text not null check (status in ('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED')),
+    rows_processed  integer not null default 0,
+    rows_imported   integer not null default 0,
+    rows_rejected   integer not null default 0,
+    errors          jsonb not null default '[]'::jsonb,
+    error_message   text,
+    created_at      timestamptz not null default now(),
+    updated_at      timestamptz not null default now()
+);
+
+create index if not exists voter_import_jobs_constituency_idx on voter_import_jobs (constituency_id, created_at desc);
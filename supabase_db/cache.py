@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config import Config
+
+
+# -----------------------------
+# Reference Table TTLs (seconds)
+# -----------------------------
+
+# Only rows fetched by primary key from these tables are cached.
+# Elections change status during polling, so they get a short TTL;
+# geography is effectively static.
+REFERENCE_TABLE_TTLS = {
+    "elections": 30,
+    "candidates": 60,
+    "constituencies": 3600,
+    "districts": 3600,
+    "states": 86400,
+}
+
+
+class ReferenceCache:
+    """
+    Process-wide read-through cache for hot reference rows.
+
+    - per-table TTL (REFERENCE_TABLE_TTLS)
+    - bounded size with LRU eviction
+    - hit / miss / eviction counters per table
+    """
+
+    def __init__(self, max_entries: int, ttls: dict):
+        self.max_entries = max_entries
+        self.ttls = ttls
+        self._entries = OrderedDict()   # (table, id) -> (expires_at, row)
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _count(self, table: str, field: str):
+        stats = self._stats.setdefault(
+            table, {"hits": 0, "misses": 0, "evictions": 0}
+        )
+        stats[field] += 1
+
+    def is_cached_table(self, table: str) -> bool:
+        return Config.REFERENCE_CACHE_ENABLED and table in self.ttls
+
+    def get(self, table: str, row_id):
+        key = (table, row_id)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._count(table, "misses")
+                return None
+
+            self._entries.move_to_end(key)
+            self._count(table, "hits")
+            # Callers mutate rows (formatting, enrichment)
+            return dict(entry[1])
+
+    def put(self, table: str, row_id, row: dict):
+        if row is None:
+            return
+
+        key = (table, row_id)
+        expires_at = time.monotonic() + self.ttls[table]
+
+        with self._lock:
+            self._entries[key] = (expires_at, dict(row))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                (evicted_table, _), _ = self._entries.popitem(last=False)
+                self._count(evicted_table, "evictions")
+
+    def invalidate(self, table: str, row_id=None):
+        """
+        Drop one row, or every row of the table when row_id is None.
+        """
+        with self._lock:
+            if row_id is not None:
+                self._entries.pop((table, row_id), None)
+                return
+
+            for key in [k for k in self._entries if k[0] == table]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            tables = {t: dict(s) for t, s in self._stats.items()}
+            size = len(self._entries)
+
+        for s in tables.values():
+            total = s["hits"] + s["misses"]
+            s["hit_rate"] = round(s["hits"] / total * 100, 2) if total else 0
+
+        return {
+            "size": size,
+            "max_entries": self.max_entries,
+            "tables": tables
+        }
+
+
+reference_cache = ReferenceCache(
+    max_entries=Config.REFERENCE_CACHE_MAX_ENTRIES,
+    ttls=REFERENCE_TABLE_TTLS
+)
+
+
+def invalidate_reference(table: str, filters: dict = None):
+    """
+    Called after writes. A write keyed by id only drops that row;
+    anything broader drops the whole table.
+    """
+    if table not in reference_cache.ttls:
+        return
+
+    if filters and list(filters.keys()) == ["id"]:
+        reference_cache.invalidate(table, filters["id"])
+    else:
+        reference_cache.invalidate(table)
+
+
+def get_cache_stats() -> dict:
+    return reference_cache.stats()
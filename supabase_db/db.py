@@ -1,56 +1,343 @@
 from supabase_db.client import supabase_public, supabase_admin
+from supabase_db.cache import reference_cache, invalidate_reference
+from utils.instrumentation import record
+from config import Config
+
+
+# -----------------------------
+# Query Settings
+# -----------------------------
+
+# PostgREST encodes `in.(...)` filters in the URL, so long id lists
+# are split into chunks to stay under the request line limit.
+IN_FILTER_CHUNK_SIZE = 200
+
+
+def _select_columns(columns) -> str:
+    """
+    Normalize a column projection to a PostgREST select string.
+    Accepts "*", "a,b" or ["a", "b"].
+    """
+    if not columns:
+        return "*"
+
+    if isinstance(columns, str):
+        return columns
+
+    return ",".join(columns)
+
+
+def _execute(query, table: str, op: str):
+    record("db_queries", f"{op} {table}")
+    return query.execute()
+
+
+def _chunked(values: list, size: int):
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
 
 
 # -----------------------------
 # Read Operations
 # -----------------------------
 
-def fetch_one(table: str, filters: dict, use_admin: bool = False):
+def fetch_one(table: str, filters: dict, use_admin: bool = False, columns="*"):
     """
     Fetch a single record from a table based on filters.
+
+    Lookups by primary key alone are served from the reference cache
+    (hot tables) or the active request loader (everything else), so
+    repeated calls cost at most one query.
     """
+    by_id = columns == "*" and list(filters.keys()) == ["id"]
+    cached = by_id and reference_cache.is_cached_table(table)
+
+    if cached:
+        row = reference_cache.get(table, filters["id"])
+        if row is not None:
+            return row
+
+    if by_id and not cached:
+        from supabase_db.loader import get_request_loader
+
+        loader = get_request_loader()
+        if loader is not None:
+            return loader.get(table, filters["id"], use_admin=use_admin)
+
     client = supabase_admin if use_admin else supabase_public
 
-    query = client.table(table).select("*")
+    query = client.table(table).select(_select_columns(columns))
     for key, value in filters.items():
         query = query.eq(key, value)
 
-    response = query.limit(1).execute()
+    response = _execute(query.limit(1), table, "select")
     data = response.data
+    row = data[0] if data else None
+
+    if cached:
+        reference_cache.put(table, filters["id"], row)
 
-    return data[0] if data else None
+    return row
 
 
-def fetch_all(table: str, filters: dict = None, use_admin: bool = False):
+def fetch_all(
+    table: str,
+    filters: dict = None,
+    use_admin: bool = False,
+    columns="*",
+    order_by: tuple = None,
+    limit: int = None
+):
     """
     Fetch all records from a table with optional filters.
+
+    columns  → projection, e.g. ["id", "constituency_id"]
+    order_by → (column, "asc" | "desc")
+    limit    → max rows
     """
     client = supabase_admin if use_admin else supabase_public
 
-    query = client.table(table).select("*")
+    query = client.table(table).select(_select_columns(columns))
 
     if filters:
         for key, value in filters.items():
             query = query.eq(key, value)
 
-    response = query.execute()
+    if order_by:
+        column, direction = order_by
+        query = query.order(column, desc=(direction == "desc"))
+
+    if limit:
+        query = query.limit(limit)
+
+    response = _execute(query, table, "select")
     return response.data
 
 
+def iter_all(
+    table: str,
+    filters: dict = None,
+    use_admin: bool = False,
+    columns="*",
+    page_size: int = None,
+    key: str = "id"
+):
+    """
+    Stream every matching row, one page at a time.
+
+    Keyset pagination on `key` (must be unique within the filters):
+    each page is `key > last seen key ORDER BY key LIMIT page_size`, so
+    deep pages cost the same as the first and PostgREST's row cap
+    never truncates the result. Only one page is held in memory.
+    """
+    page_size = page_size or Config.SUPABASE_PAGE_SIZE
+    client = supabase_admin if use_admin else supabase_public
+
+    select = _select_columns(columns)
+    if select != "*" and key not in select.split(","):
+        select = f"{select},{key}"
+
+    last = None
+
+    while True:
+        query = client.table(table).select(select)
+
+        if filters:
+            for k, value in filters.items():
+                query = query.eq(k, value)
+
+        if last is not None:
+            query = query.gt(key, last)
+
+        rows = _execute(query.order(key).limit(page_size), table, "select").data or []
+
+        yield from rows
+
+        if len(rows) < page_size:
+            return
+
+        last = rows[-1][key]
+
+
+def count_rows(table: str, filters: dict = None, use_admin: bool = False) -> int:
+    """
+    Exact number of matching rows (PostgREST count=exact), without
+    transferring them.
+    """
+    client = supabase_admin if use_admin else supabase_public
+
+    query = client.table(table).select("*", count="exact")
+    if filters:
+        for key, value in filters.items():
+            query = query.eq(key, value)
+
+    return _execute(query.limit(1), table, "count").count or 0
+
+
+def fetch_many(
+    table: str,
+    column: str,
+    values,
+    filters: dict = None,
+    use_admin: bool = False,
+    columns="*"
+):
+    """
+    Fetch all records whose `column` is in `values`.
+
+    Duplicate and empty values are dropped and long lists are
+    split into IN_FILTER_CHUNK_SIZE queries, so N lookups cost
+    ceil(N / chunk) round trips instead of N.
+    """
+    keys = list(dict.fromkeys(v for v in values if v is not None))
+    if not keys:
+        return []
+
+    client = supabase_admin if use_admin else supabase_public
+    select = _select_columns(columns)
+
+    rows = []
+    for chunk in _chunked(keys, IN_FILTER_CHUNK_SIZE):
+        query = client.table(table).select(select).in_(column, chunk)
+
+        if filters:
+            for key, value in filters.items():
+                query = query.eq(key, value)
+
+        rows.extend(_execute(query, table, "select").data or [])
+
+    return rows
+
+
+def fetch_map(
+    table: str,
+    column: str,
+    values,
+    filters: dict = None,
+    use_admin: bool = False,
+    columns="*"
+) -> dict:
+    """
+    Same as fetch_many, keyed by `column`.
+    If several rows share a key the first one wins (like fetch_one).
+    Plain id lookups on reference tables only query the cache misses.
+    """
+    result = {}
+
+    cached = (
+        column == "id"
+        and not filters
+        and columns == "*"
+        and reference_cache.is_cached_table(table)
+    )
+
+    if cached:
+        values = list(dict.fromkeys(v for v in values if v is not None))
+        for row_id in values:
+            row = reference_cache.get(table, row_id)
+            if row is not None:
+                result[row_id] = row
+        values = [v for v in values if v not in result]
+
+    for row in fetch_many(table, column, values, filters, use_admin, columns):
+        if row[column] in result:
+            continue
+        result[row[column]] = row
+        if cached:
+            reference_cache.put(table, row[column], row)
+
+    return result
+
+
+def fetch_grouped(
+    table: str,
+    column: str,
+    values,
+    filters: dict = None,
+    use_admin: bool = False,
+    columns="*"
+) -> dict:
+    """
+    Same as fetch_many, grouped into lists by `column`.
+    Every requested key is present (empty list if no rows), so
+    per-parent loops can replace `fetch_all(table, {column: v})`.
+    """
+    keys = list(dict.fromkeys(v for v in values if v is not None))
+    result = {k: [] for k in keys}
+
+    for row in fetch_many(table, column, keys, filters, use_admin, columns):
+        result.setdefault(row[column], []).append(row)
+
+    return result
+
+
 # -----------------------------
 # Write Operations
 # -----------------------------
 
+def _forget_cached(table: str):
+    from supabase_db.loader import get_request_loader
+
+    loader = get_request_loader()
+    if loader is not None:
+        loader.forget(table)
+
+
 def insert_record(table: str, payload: dict, use_admin: bool = False):
     """
     Insert a new record into a table.
     """
     client = supabase_admin if use_admin else supabase_public
 
-    response = client.table(table).insert(payload).execute()
+    response = _execute(client.table(table).insert(payload), table, "insert")
+    _forget_cached(table)
     return response.data
 
 
+def insert_records(
+    table: str,
+    payloads: list,
+    use_admin: bool = False,
+    chunk_size: int = 500
+) -> int:
+    """
+    Bulk insert in chunks of `chunk_size` rows per request.
+    Returns the number of rows sent.
+    """
+    client = supabase_admin if use_admin else supabase_public
+
+    count = 0
+    for chunk in _chunked(payloads, chunk_size):
+        _execute(client.table(table).insert(chunk), table, "insert")
+        count += len(chunk)
+
+    _forget_cached(table)
+    return count
+
+
+def upsert_records(
+    table: str,
+    payloads: list,
+    conflict_columns: list,
+    use_admin: bool = False,
+    chunk_size: int = 500
+) -> int:
+    """
+    Bulk upsert in chunks of `chunk_size` rows per request; re-sending
+    a chunk is idempotent. Returns the number of rows sent.
+    """
+    client = supabase_admin if use_admin else supabase_public
+    on_conflict = ",".join(conflict_columns)
+
+    count = 0
+    for chunk in _chunked(payloads, chunk_size):
+        _execute(client.table(table).upsert(chunk, on_conflict=on_conflict), table, "upsert")
+        count += len(chunk)
+
+    _forget_cached(table)
+    return count
+
+
 def update_record(table: str, filters: dict, payload: dict, use_admin: bool = False):
     """
     Update record(s) in a table based on filters.
@@ -61,10 +348,38 @@ def update_record(table: str, filters: dict, payload: dict, use_admin: bool = Fa
     for key, value in filters.items():
         query = query.eq(key, value)
 
-    response = query.execute()
+    response = _execute(query, table, "update")
+    _forget_cached(table)
+    invalidate_reference(table, filters)
     return response.data
 
 
+def update_many(
+    table: str,
+    column: str,
+    values,
+    payload: dict,
+    use_admin: bool = False
+) -> int:
+    """
+    Applies the same payload to every row whose `column` is in
+    `values` (chunked IN filters, like fetch_many); only the payload's
+    columns are written. Returns the number of rows updated.
+    """
+    client = supabase_admin if use_admin else supabase_public
+    values = list(dict.fromkeys(v for v in values if v is not None))
+
+    count = 0
+    for chunk in _chunked(values, IN_FILTER_CHUNK_SIZE):
+        query = client.table(table).update(payload).in_(column, chunk)
+        count += len(_execute(query, table, "update").data or [])
+
+    if values:
+        _forget_cached(table)
+        invalidate_reference(table)
+    return count
+
+
 def delete_record(table: str, filters: dict, use_admin: bool = False):
     """
     Delete record(s) from a table based on filters.
@@ -75,24 +390,38 @@ def delete_record(table: str, filters: dict, use_admin: bool = False):
     for key, value in filters.items():
         query = query.eq(key, value)
 
-    response = query.execute()
+    response = _execute(query, table, "delete")
+    _forget_cached(table)
+    invalidate_reference(table, filters)
     return response.data
 
 def upsert_record(
     table: str,
     payload: dict,
     conflict_columns: list,
-    use_admin: bool = False
+    use_admin: bool = False,
+    ignore_duplicates: bool = False
 ):
-    client = supabase_admin if use_admin else supabase
+    """
+    ignore_duplicates=True keeps an existing row untouched
+    (ON CONFLICT DO NOTHING): first write wins.
+    """
+    client = supabase_admin if use_admin else supabase_public
 
-    return (
+    response = _execute(
         client
         .table(table)
         .upsert(
             payload,
-            on_conflict=",".join(conflict_columns)
-        )
-        .execute()
+            on_conflict=",".join(conflict_columns),
+            ignore_duplicates=ignore_duplicates
+        ),
+        table,
+        "upsert"
     )
-
+    _forget_cached(table)
+    invalidate_reference(
+        table,
+        {"id": payload["id"]} if isinstance(payload, dict) and "id" in payload else None
+    )
+    return response
@@ -0,0 +1,95 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+# -----------------------------
+# Request-scoped Loader
+# -----------------------------
+
+_current_loader: ContextVar = ContextVar("supabase_request_loader", default=None)
+
+
+class RequestLoader:
+    """
+    Per-request identity map for primary-key lookups.
+
+    - fetch_one(table, {"id": x}) goes through get() while a loader
+      is active, so the same row is only read once per request.
+    - prime() loads many ids in one IN query ahead of a loop, turning
+      N fetch_one calls into a single round trip.
+    - Any write to a table drops that table's cached rows.
+    """
+
+    def __init__(self):
+        self._rows = {}      # (table, use_admin) -> {id: row | None}
+        self.queries = 0
+
+    def _bucket(self, table: str, use_admin: bool) -> dict:
+        return self._rows.setdefault((table, use_admin), {})
+
+    def prime(self, table: str, ids, use_admin: bool = False):
+        """
+        Batch-load every id not already cached.
+        Missing rows are remembered as None.
+        """
+        from supabase_db.db import fetch_map
+
+        bucket = self._bucket(table, use_admin)
+        missing = [i for i in dict.fromkeys(ids) if i is not None and i not in bucket]
+        if not missing:
+            return
+
+        found = fetch_map(table, "id", missing, use_admin=use_admin)
+        self.queries += 1
+
+        for i in missing:
+            bucket[i] = found.get(i)
+
+    def get(self, table: str, row_id, use_admin: bool = False):
+        bucket = self._bucket(table, use_admin)
+
+        if row_id not in bucket:
+            self.prime(table, [row_id], use_admin=use_admin)
+
+        row = bucket.get(row_id)
+        # Callers routinely mutate returned rows (formatting dates etc.)
+        return dict(row) if row is not None else None
+
+    def forget(self, table: str):
+        for key in [k for k in self._rows if k[0] == table]:
+            del self._rows[key]
+
+
+def get_request_loader():
+    return _current_loader.get()
+
+
+def start_request_loader():
+    loader = RequestLoader()
+    _current_loader.set(loader)
+    return loader
+
+
+def end_request_loader():
+    _current_loader.set(None)
+
+
+@contextmanager
+def request_loader():
+    """
+    Scope a loader outside of Flask requests (jobs, scripts).
+    """
+    token = _current_loader.set(RequestLoader())
+    try:
+        yield _current_loader.get()
+    finally:
+        _current_loader.reset(token)
+
+
+def prime(table: str, ids, use_admin: bool = False):
+    """
+    Batch-load ids into the active loader. No-op outside a request.
+    """
+    loader = get_request_loader()
+    if loader is not None:
+        loader.prime(table, ids, use_admin=use_admin)
@@ -0,0 +1,68 @@
+# utils/instrumentation.py
+#
+# Scoped operation counters.
+#
+#   with track_operations() as stats:
+#       build_something()
+#   stats.summary()  → {"db_queries": 12, "chain_reads": 1, ...}
+#
+# supabase_db.db counts every PostgREST request, the vote event index
+# counts reads of chain-derived data, and the Web3 provider counts RPCs.
+# Outside a tracked block record() is a no-op.
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_current: ContextVar = ContextVar("operation_stats", default=None)
+
+
+class OperationStats:
+
+    def __init__(self):
+        self.counts = {}        # kind -> {key: n}
+        self.started = time.perf_counter()
+        self.elapsed_ms = None
+
+    def record(self, kind: str, key: str):
+        bucket = self.counts.setdefault(kind, {})
+        bucket[key] = bucket.get(key, 0) + 1
+
+    def total(self, kind: str) -> int:
+        return sum(self.counts.get(kind, {}).values())
+
+    def summary(self) -> dict:
+        return {
+            **{kind: self.total(kind) for kind in sorted(self.counts)},
+            "detail": {kind: dict(keys) for kind, keys in self.counts.items()},
+            "elapsed_ms": self.elapsed_ms
+        }
+
+
+def record(kind: str, key: str):
+    stats = _current.get()
+    if stats is not None:
+        stats.record(kind, key)
+
+
+@contextmanager
+def track_operations():
+    """
+    Counts operations in this block. Nested blocks count into the
+    innermost tracker and their totals are added to the outer one.
+    """
+    outer = _current.get()
+    stats = OperationStats()
+    token = _current.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+        stats.elapsed_ms = round((time.perf_counter() - stats.started) * 1000, 2)
+
+        if outer is not None:
+            for kind, keys in stats.counts.items():
+                for key, n in keys.items():
+                    bucket = outer.counts.setdefault(kind, {})
+                    bucket[key] = bucket.get(key, 0) + n
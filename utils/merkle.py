@@ -1,8 +1,12 @@
 # utils/merkle.py
 
+import mmap
+import tempfile
 from eth_hash.auto import keccak
 from typing import List
 
+NODE_SIZE = 32
+
 
 def _hash(data: bytes) -> bytes:
     return keccak(data)
@@ -35,6 +39,289 @@ def build_merkle_tree(receipt_hashes):
 
 
 
+class MerkleTree:
+    """
+    Merkle tree built once over a fixed list of receipt hashes.
+
+    Proofs are read straight from the stored levels using a
+    receipt → leaf index map, so proving every receipt costs
+    O(N log N) lookups instead of one full rebuild per receipt.
+    """
+
+    def __init__(self, receipt_hashes: List[str]):
+        if not receipt_hashes:
+            raise ValueError("Cannot build Merkle tree with no receipts")
+
+        self.receipt_hashes = receipt_hashes
+        self.levels = build_merkle_tree(receipt_hashes)
+
+        # First occurrence wins, same as list.index()
+        self._index = {}
+        for i, r in enumerate(receipt_hashes):
+            self._index.setdefault(r, i)
+
+    @property
+    def root(self) -> str:
+        return self.levels[-1][0].hex()
+
+    def proof_at(self, index: int) -> List[str]:
+        proof = []
+
+        for level in self.levels[:-1]:
+            sibling_index = index ^ 1  # flip last bit
+
+            if sibling_index < len(level):
+                proof.append(level[sibling_index].hex())
+
+            index //= 2
+
+        return proof
+
+    def proof(self, receipt_hash: str) -> List[str]:
+        index = self._index.get(receipt_hash)
+        if index is None:
+            raise ValueError("Receipt not found")
+
+        return self.proof_at(index)
+
+    def iter_proofs(self):
+        """
+        Yields (receipt_hash, proof) for every leaf in one pass.
+        Each level is hex-encoded once and shared by all proofs.
+        """
+        hex_levels = [[node.hex() for node in level] for level in self.levels[:-1]]
+
+        for receipt_hash in self.receipt_hashes:
+            index = self._index[receipt_hash]
+            proof = []
+
+            for level in hex_levels:
+                sibling_index = index ^ 1
+
+                if sibling_index < len(level):
+                    proof.append(level[sibling_index])
+
+                index //= 2
+
+            yield receipt_hash, proof
+
+
+class CompactMerkleTree:
+    """
+    Same tree as MerkleTree (sorted-pair keccak, identical root and
+    proofs for unique receipts) with each level stored as one
+    contiguous buffer of 32-byte nodes instead of a list of `bytes`.
+
+    spill_to_disk=True backs every level with a memory-mapped temp
+    file in `spill_dir`, so resident memory stays small for
+    multi-million receipt elections. Call close() (or use `with`)
+    to release the mappings.
+    """
+
+    def __init__(
+        self,
+        receipt_hashes,
+        spill_to_disk: bool = False,
+        spill_dir: str = None
+    ):
+        self.spill_to_disk = spill_to_disk
+        self.spill_dir = spill_dir
+        self._files = []
+        self.levels = []     # buffers
+        self.sizes = []      # node count per level
+        self._index = None
+
+        # Only referenced (the caller already holds it) so proofs are
+        # keyed by the exact receipt strings stored in the DB
+        self.receipt_hashes = receipt_hashes
+        n = len(receipt_hashes)
+        if not n:
+            raise ValueError("Cannot build Merkle tree with no receipts")
+
+        level = self._alloc(n)
+        for i, r in enumerate(receipt_hashes):
+            level[i * NODE_SIZE:(i + 1) * NODE_SIZE] = bytes.fromhex(r)
+        self._push(level, n)
+
+        while n > 1:
+            parent_count = (n + 1) // 2
+            parent = self._alloc(parent_count)
+
+            for i in range(0, n, 2):
+                left = level[i * NODE_SIZE:(i + 1) * NODE_SIZE]
+                right = (
+                    level[(i + 1) * NODE_SIZE:(i + 2) * NODE_SIZE]
+                    if i + 1 < n else left
+                )
+
+                combined = left + right if left < right else right + left
+                j = i // 2
+                parent[j * NODE_SIZE:(j + 1) * NODE_SIZE] = _hash(combined)
+
+            level, n = parent, parent_count
+            self._push(level, n)
+
+    def _alloc(self, count: int):
+        size = count * NODE_SIZE
+
+        if not self.spill_to_disk:
+            return bytearray(size)
+
+        f = tempfile.TemporaryFile(dir=self.spill_dir)
+        f.truncate(size)
+        self._files.append(f)
+        return mmap.mmap(f.fileno(), size)
+
+    def _push(self, level, count: int):
+        self.levels.append(level)
+        self.sizes.append(count)
+
+    def node(self, level: int, index: int) -> bytes:
+        buf = self.levels[level]
+        return bytes(buf[index * NODE_SIZE:(index + 1) * NODE_SIZE])
+
+    def __len__(self):
+        return self.sizes[0]
+
+    @property
+    def root(self) -> str:
+        return self.node(len(self.levels) - 1, 0).hex()
+
+    def proof_at(self, index: int) -> List[str]:
+        proof = []
+
+        for depth in range(len(self.levels) - 1):
+            sibling_index = index ^ 1  # flip last bit
+
+            if sibling_index < self.sizes[depth]:
+                proof.append(self.node(depth, sibling_index).hex())
+
+            index //= 2
+
+        return proof
+
+    def proof(self, receipt_hash: str) -> List[str]:
+        # Built on first use only; closure streams iter_proofs() instead
+        if self._index is None:
+            self._index = {}
+            for i, r in enumerate(self.receipt_hashes):
+                self._index.setdefault(r, i)
+
+        index = self._index.get(receipt_hash)
+        if index is None:
+            raise ValueError("Receipt not found")
+
+        return self.proof_at(index)
+
+    def iter_proofs(self):
+        """
+        Yields (receipt_hash, proof) for every leaf, reading siblings
+        straight from the level buffers (receipts are unique hashes,
+        so the leaf index is the proof index).
+        """
+        for i, receipt_hash in enumerate(self.receipt_hashes):
+            yield receipt_hash, self.proof_at(i)
+
+    def close(self):
+        for level in self.levels:
+            if isinstance(level, mmap.mmap):
+                level.close()
+        for f in self._files:
+            f.close()
+
+        self.levels = []
+        self._files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MerkleAccumulator:
+    """
+    Append-only Merkle frontier.
+
+    Keeps, per level, the last completed left node (`branch`) plus the
+    last leaf, which is enough to compute the same root as
+    build_merkle_tree (sorted pairs, odd last node hashed with itself)
+    in O(log N) after every append, without keeping the leaves.
+    """
+
+    def __init__(self, count: int = 0, last_leaf: str = None, branch: List[str] = None):
+        self.count = count
+        self.last_leaf = bytes.fromhex(last_leaf) if last_leaf else None
+        self.branch = [bytes.fromhex(b) if b else None for b in (branch or [])]
+
+    @staticmethod
+    def _pair(a: bytes, b: bytes) -> bytes:
+        return _hash(a + b if a < b else b + a)
+
+    def append(self, receipt_hash: str) -> int:
+        """
+        Adds one leaf. Returns its leaf index.
+        """
+        leaf = bytes.fromhex(receipt_hash)
+        index = self.count
+
+        node = leaf
+        i = index
+        level = 0
+
+        # Right child → close the pair with the stored left sibling
+        while i & 1:
+            node = self._pair(self.branch[level], node)
+            i >>= 1
+            level += 1
+
+        if level == len(self.branch):
+            self.branch.append(None)
+        self.branch[level] = node
+
+        self.count += 1
+        self.last_leaf = leaf
+        return index
+
+    @property
+    def root(self):
+        if not self.count:
+            return None
+
+        node = self.last_leaf
+        index = self.count - 1
+        size = self.count
+        level = 0
+
+        while size > 1:
+            if index & 1:
+                node = self._pair(self.branch[level], node)
+            else:
+                # Last node of an odd-sized level pairs with itself
+                node = _hash(node + node)
+
+            index //= 2
+            size = (size + 1) // 2
+            level += 1
+
+        return node.hex()
+
+    def to_dict(self) -> dict:
+        return {
+            "leaf_count": self.count,
+            "last_leaf": self.last_leaf.hex() if self.last_leaf else None,
+            "branch": [b.hex() if b else None for b in self.branch],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            count=data.get("leaf_count") or 0,
+            last_leaf=data.get("last_leaf"),
+            branch=data.get("branch") or []
+        )
+
+
 def get_merkle_root(receipt_hashes: List[str]) -> str:
     """
     Returns Merkle root as hex string.
@@ -55,17 +342,5 @@ def get_merkle_proof(receipt_hashes: List[str], target_receipt: str) -> List[str
     if target_receipt not in receipt_hashes:
         raise ValueError("Receipt not found")
 
-    tree = build_merkle_tree(receipt_hashes)
-    index = receipt_hashes.index(target_receipt)
-
-    proof = []
-
-    for level in tree[:-1]:
-        sibling_index = index ^ 1  # flip last bit
-
-        if sibling_index < len(level):
-            proof.append(level[sibling_index].hex())
-
-        index //= 2
-
-    return proof
+    # For many receipts build one MerkleTree and use iter_proofs()
+    return MerkleTree(receipt_hashes).proof(target_receipt)